@@ -6,17 +6,22 @@ from typing import Dict, Optional, List, Tuple, Union
 from enum import Enum
 from collections import deque
 
+from sim import GameLog
+
 GAME_LOGS = []
+LOG = GameLog(GAME_LOGS.append)
 
 
 class Board:
     def __init__(self):
-        GAME_LOGS.append("Initializing Board...")
+        if LOG.setup:
+            LOG.write("Initializing Board...")
         self.tiles = []
         self.initialize_board()
 
     def initialize_board(self):
-        GAME_LOGS.append("Board.initialize_board() called.")
+        if LOG.setup:
+            LOG.write("Board.initialize_board() called.")
         self.tiles: list[Block] = [
             Block(type="go", number=1),  # GO
             Street(
@@ -288,13 +293,18 @@ class CommunityChestCards(Enum):
 
 
 class Block(ABC):
+    __slots__ = ("type", "number")
+
     def __init__(self, type, number):
         self.type = type
         self.number = number
-        GAME_LOGS.append(f"Created Block: {self.type}, number={self.number}")
+        if LOG.setup:
+            LOG.write(f"Created Block: {self.type}, number={self.number}")
 
 
 class Chance(Block):
+    __slots__ = ()
+
     chance_deque = deque([chance for chance in ChanceCards])
 
     def __init__(self, number):
@@ -303,18 +313,22 @@ class Chance(Block):
     @classmethod
     def get_chance_card(cls):
         card = cls.chance_deque.pop()
-        GAME_LOGS.append(f"Chance Card Drawn: {card.value}")
+        if LOG.cards:
+            LOG.write(f"Chance Card Drawn: {card.value}")
         if card != ChanceCards.GET_OUT_OF_JAIL_FREE:
             cls.chance_deque.appendleft(card)
         return card
 
     @classmethod
     def put_jail_free_card_back(cls):
-        GAME_LOGS.append("Putting Chance Jail Free Card back on top of deck.")
+        if LOG.jail:
+            LOG.write("Putting Chance Jail Free Card back on top of deck.")
         cls.chance_deque.appendleft(ChanceCards.GET_OUT_OF_JAIL_FREE)
 
 
 class CommunityChest(Block):
+    __slots__ = ()
+
     community_chest_deque = deque(
         [community_chest for community_chest in CommunityChestCards]
     )
@@ -325,31 +339,38 @@ class CommunityChest(Block):
     @classmethod
     def get_community_chest_card(cls):
         card = cls.community_chest_deque.pop()
-        GAME_LOGS.append(f"Community Chest Card Drawn: {card.value}")
+        if LOG.cards:
+            LOG.write(f"Community Chest Card Drawn: {card.value}")
         if card != CommunityChestCards.GET_OUT_OF_JAIL_FREE:
             cls.community_chest_deque.appendleft(card)
         return card
 
     @classmethod
     def put_jail_free_card_back(cls):
-        GAME_LOGS.append("Putting Community Chest Jail Free Card back on top of deck.")
+        if LOG.jail:
+            LOG.write("Putting Community Chest Jail Free Card back on top of deck.")
         cls.community_chest_deque.appendleft(CommunityChestCards.GET_OUT_OF_JAIL_FREE)
 
 
 class Tax(Block):
+    __slots__ = ("name", "amount")
+
     def __init__(self, name, amount, number):
         super().__init__("tax", number)
         self.name = name
         self.amount = amount
 
     def apply_tax(self, player: "Player"):
-        GAME_LOGS.append(
-            f"{player.name} landed on Tax: {self.name}, must pay {self.amount}"
-        )
+        if LOG.money:
+            LOG.write(
+                f"{player.name} landed on Tax: {self.name}, must pay {self.amount}"
+            )
         player.pay(self.amount)
 
 
 class Property(Block):
+    __slots__ = ("name", "price", "mortgage", "unmortgage", "mortgaged", "owner")
+
     def __init__(self, name, price, number):
         super().__init__("property", number=number)
         self.name = name
@@ -365,6 +386,8 @@ class Property(Block):
 
 
 class Utility(Property):
+    __slots__ = ()
+
     def __init__(self, name, price, number):
         super().__init__(name, price, number)
 
@@ -372,11 +395,14 @@ class Utility(Property):
         if self.owner is None or self.mortgaged or self.owner == player:
             return 0
         rent_val = dice_roll * (10 if len(self.owner.utilities) == 2 else 4)
-        GAME_LOGS.append(f"Utility rent calculated: {rent_val} (dice={dice_roll})")
+        if LOG.rent:
+            LOG.write(f"Utility rent calculated: {rent_val} (dice={dice_roll})")
         return rent_val
 
 
 class RailRoad(Property):
+    __slots__ = ("rent",)
+
     def __init__(self, name: str, price: int, rent: List[int], number: int):
         super().__init__(name, price, number)
         self.rent = rent
@@ -386,9 +412,10 @@ class RailRoad(Property):
             return 0
         railroads_owned = len(self.owner.railroads)
         rent_val = self.rent[railroads_owned - 1]
-        GAME_LOGS.append(
-            f"Railroad rent calculated: {rent_val} (RRs owned={railroads_owned})"
-        )
+        if LOG.rent:
+            LOG.write(
+                f"Railroad rent calculated: {rent_val} (RRs owned={railroads_owned})"
+            )
         return rent_val
 
 
@@ -404,6 +431,8 @@ class StreetGroups(Enum):
 
 
 class Street(Property):
+    __slots__ = ("house_price", "group", "rent", "level")
+
     GROUP_COUNTS = {
         StreetGroups.BROWN: 2,
         StreetGroups.LIGHT_BLUE: 3,
@@ -451,22 +480,48 @@ class Street(Property):
         if self.owner is None or self.mortgaged or self.owner == player:
             return 0
         rent_val = self.rent[self.level]
-        GAME_LOGS.append(f"Street rent calculated: {rent_val} (level={self.level})")
+        if LOG.rent:
+            LOG.write(f"Street rent calculated: {rent_val} (level={self.level})")
         return rent_val
 
 
 class Bank:
     def __init__(self):
-        GAME_LOGS.append("Bank created.")
+        if LOG.setup:
+            LOG.write("Bank created.")
 
     def earn(self, amount):
         # The bank in Monopoly doesn't exactly "track" its money, so no effect.
-        GAME_LOGS.append(
-            f"Bank earned {amount}, but bank funds are unlimited in normal Monopoly."
-        )
+        if LOG.money:
+            LOG.write(
+                f"Bank earned {amount}, but bank funds are unlimited in normal Monopoly."
+            )
 
 
 class Player:
+    __slots__ = (
+        "name",
+        "w_buy_building",
+        "w_buy_railroad",
+        "w_buy_utility",
+        "w_use_jail_free_card",
+        "w_roll_double_in_jail",
+        "min_cash",
+        "min_cash_to_unmortgage",
+        "jail_roll_attempts",
+        "consecutive_doubles",
+        "is_in_jail",
+        "cash",
+        "streets",
+        "railroads",
+        "utilities",
+        "is_in_game",
+        "position",
+        "last_dice_roll",
+        "community_chest_jail_free_card",
+        "chance_jail_free_card",
+    )
+
     def __init__(
         self,
         name,
@@ -499,7 +554,8 @@ class Player:
         self.community_chest_jail_free_card: bool = False
         self.chance_jail_free_card: bool = False
 
-        GAME_LOGS.append(f"Created Player {self.name} with ${self.cash}.")
+        if LOG.setup:
+            LOG.write(f"Created Player {self.name} with ${self.cash}.")
 
     def __repr__(self):
         return (
@@ -513,32 +569,37 @@ class Player:
         return self.community_chest_jail_free_card or self.chance_jail_free_card
 
     def reset_jail_roll_attempts(self):
-        GAME_LOGS.append(
-            f"{self.name} reset jail roll attempts from {self.jail_roll_attempts} to 0."
-        )
+        if LOG.jail:
+            LOG.write(
+                f"{self.name} reset jail roll attempts from {self.jail_roll_attempts} to 0."
+            )
         self.jail_roll_attempts = 0
 
     def advance_to_illinois(self) -> None:
-        GAME_LOGS.append(f"{self.name} advanced to Illinois Ave.")
+        if LOG.movement:
+            LOG.write(f"{self.name} advanced to Illinois Ave.")
         if self.position > 24:
             self.earn(200)
         self.position = 24
 
     def advance_to_st_charles(self) -> None:
-        GAME_LOGS.append(f"{self.name} advanced to St. Charles Place.")
+        if LOG.movement:
+            LOG.write(f"{self.name} advanced to St. Charles Place.")
         if self.position > 11:
             self.earn(200)
         self.position = 11
 
     def advance_to_nearest_utility(self):
-        GAME_LOGS.append(f"{self.name} advanced to nearest Utility.")
+        if LOG.movement:
+            LOG.write(f"{self.name} advanced to nearest Utility.")
         if self.position < 12:
             self.position = 12
         else:
             self.position = 28
 
     def advance_to_nearest_railroad(self):
-        GAME_LOGS.append(f"{self.name} advanced to nearest Railroad.")
+        if LOG.movement:
+            LOG.write(f"{self.name} advanced to nearest Railroad.")
         # Replaced the multiple if's with if/elif to avoid skipping to 35 each time:
         if self.position < 5 or self.position > 35:
             self.position = 5
@@ -550,18 +611,21 @@ class Player:
             self.position = 35
 
     def advance_to_reading_railroad(self):
-        GAME_LOGS.append(f"{self.name} advanced to Reading Railroad.")
+        if LOG.movement:
+            LOG.write(f"{self.name} advanced to Reading Railroad.")
         if self.position > 5:
             self.earn(200)
         self.position = 5
 
     def advance_to_go(self):
-        GAME_LOGS.append(f"{self.name} advanced to GO, collecting 200.")
+        if LOG.movement:
+            LOG.write(f"{self.name} advanced to GO, collecting 200.")
         self.position = 0
         self.earn(200)
 
     def advance_to_boardwalk(self):
-        GAME_LOGS.append(f"{self.name} advanced to Boardwalk.")
+        if LOG.movement:
+            LOG.write(f"{self.name} advanced to Boardwalk.")
         self.position = 39
 
     def determine_street_repair_fee(self):
@@ -573,7 +637,8 @@ class Player:
                 elif street.level >= 2:
                     num_houses = street.level - 1
                     total += 40 * num_houses
-        GAME_LOGS.append(f"{self.name} must pay a street repair fee of {total}.")
+        if LOG.money:
+            LOG.write(f"{self.name} must pay a street repair fee of {total}.")
         return total
 
     def determine_general_repair_fee(self):
@@ -585,18 +650,21 @@ class Player:
                 elif street.level >= 2:
                     num_houses = street.level - 1
                     total += 25 * num_houses
-        GAME_LOGS.append(f"{self.name} must pay a general repair fee of {total}.")
+        if LOG.money:
+            LOG.write(f"{self.name} must pay a general repair fee of {total}.")
         return total
 
     def go_back_three(self, board_size: int):
         oldpos = self.position
         self.position = (self.position - 3 + board_size) % board_size
-        GAME_LOGS.append(
-            f"{self.name} goes back 3 spaces from {oldpos} to {self.position}."
-        )
+        if LOG.movement:
+            LOG.write(
+                f"{self.name} goes back 3 spaces from {oldpos} to {self.position}."
+            )
 
     def transfer_ownership_of_all_assets_to_another_player(self, other: "Player"):
-        GAME_LOGS.append(f"{self.name} is transferring all assets to {other.name}.")
+        if LOG.property:
+            LOG.write(f"{self.name} is transferring all assets to {other.name}.")
         other.earn(self.cash)
         self.cash = 0
 
@@ -617,18 +685,21 @@ class Player:
             other.utilities.append(ut)
 
         if self.community_chest_jail_free_card:
-            GAME_LOGS.append(
-                f"{self.name} also gives COMMUNITY CHEST Jail Free card to {other.name}."
-            )
+            if LOG.property:
+                LOG.write(
+                    f"{self.name} also gives COMMUNITY CHEST Jail Free card to {other.name}."
+                )
             other.community_chest_jail_free_card = True
         if self.chance_jail_free_card:
-            GAME_LOGS.append(
-                f"{self.name} also gives CHANCE Jail Free card to {other.name}."
-            )
+            if LOG.property:
+                LOG.write(
+                    f"{self.name} also gives CHANCE Jail Free card to {other.name}."
+                )
             other.chance_jail_free_card = True
 
     def transfer_ownership_of_all_assets_to_the_bank(self, to: Bank):
-        GAME_LOGS.append(f"{self.name} is transferring all assets back to the Bank.")
+        if LOG.property:
+            LOG.write(f"{self.name} is transferring all assets back to the Bank.")
         self.cash = 0
         for group, streets in self.streets.items():
             for st in streets:
@@ -641,12 +712,14 @@ class Player:
             ut = self.utilities.pop()
             ut.owner = None
         if self.community_chest_jail_free_card:
-            GAME_LOGS.append(
-                f"{self.name} returns COMMUNITY CHEST Jail Free card to deck."
-            )
+            if LOG.property:
+                LOG.write(
+                    f"{self.name} returns COMMUNITY CHEST Jail Free card to deck."
+                )
             CommunityChest.put_jail_free_card_back()
         if self.chance_jail_free_card:
-            GAME_LOGS.append(f"{self.name} returns CHANCE Jail Free card to deck.")
+            if LOG.property:
+                LOG.write(f"{self.name} returns CHANCE Jail Free card to deck.")
             Chance.put_jail_free_card_back()
 
     def receive_street(self, street: Street) -> None:
@@ -661,17 +734,20 @@ class Player:
             self.transfer_ownership_of_all_assets_to_the_bank(to)
 
     def pay(self, amount, to: Union["Player", Bank]):
-        GAME_LOGS.append(f"{self.name} must pay {amount} to {to.__class__.__name__}.")
+        if LOG.money:
+            LOG.write(f"{self.name} must pay {amount} to {to.__class__.__name__}.")
         if self.cash < amount:
             # TODO: self.raise_fund(amount=amount)
             pass
         if self.cash < amount:
-            GAME_LOGS.append(f"{self.name} cannot pay and is going bankrupt!")
+            if LOG.money:
+                LOG.write(f"{self.name} cannot pay and is going bankrupt!")
             self.is_in_game = False
             self.transfer_ownership_of_all_assets(to)
             return
-        GAME_LOGS.append(
-            f"{self.name} pays {amount}. Remaining cash={self.cash - amount}."
-        )
+        if LOG.money:
+            LOG.write(
+                f"{self.name} pays {amount}. Remaining cash={self.cash - amount}."
+            )
         self.cash -= amount
         to.earn(amount=amount)
@@ -2,24 +2,89 @@ import random
 import tkinter as tk
 from tkinter import ttk
 from abc import ABC, abstractmethod
-from typing import Dict, Optional, List, Tuple, Union
-from enum import Enum
-from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from typing import Callable, Dict, NamedTuple, Optional, List, Tuple, Union
+from enum import Enum, IntEnum
+
+from sim_progress import ProgressReporter, SilentProgress
+from sim_stats import WinStats
+
+
+class GameLog:
+    """
+    Category-gated trace log. Each category is a plain bool attribute, so a
+    call site guarded with `if LOG.rent:` costs one attribute check and
+    formats nothing while the category is off. Messages go to `sink`, any
+    callable taking one string.
+    """
+
+    CATEGORIES = (
+        "setup",
+        "dice",
+        "turns",
+        "movement",
+        "landings",
+        "rent",
+        "money",
+        "property",
+        "decisions",
+        "cards",
+        "jail",
+        "state",
+    )
+
+    def __init__(self, sink: Callable[[str], None], enabled: bool = True):
+        self.sink = sink
+        for category in self.CATEGORIES:
+            setattr(self, category, enabled)
+
+    def enable(self, *categories: str) -> None:
+        self._set(categories or self.CATEGORIES, True)
+
+    def disable(self, *categories: str) -> None:
+        self._set(categories or self.CATEGORIES, False)
+
+    def _set(self, categories, enabled: bool) -> None:
+        for category in categories:
+            if category not in self.CATEGORIES:
+                raise ValueError(f"Unknown log category: {category}")
+            setattr(self, category, enabled)
+
+    def write(self, message: Union[str, Callable[[], str]]) -> None:
+        self.sink(message() if callable(message) else message)
+
+    def log(self, category: str, message: Union[str, Callable[[], str]]) -> None:
+        # For unguarded call sites; pass a lambda so nothing is formatted
+        # while the category is off
+        if getattr(self, category):
+            self.write(message)
+
+
+# Every class below traces through LOG. It starts with every category off, so
+# bulk runs only pay for the flag checks; sim_log turns it on.
+LOG = GameLog(print, enabled=False)
 
 
 class Board:
     def __init__(self):
+        if LOG.setup:
+            LOG.write("Initializing Board...")
         self.tiles = []
+        self.tile_kinds: List[TileKinds] = []
+        self.nearest_tiles: Dict[TileKinds, List[int]] = {}
         self.initialize_board()
 
     def initialize_board(self):
+        if LOG.setup:
+            LOG.write("Board.initialize_board() called.")
         self.tiles: list[Block] = [
             Block(type="go", number=1),  # GO
             Street(
                 name="Mediterranean Avenue",
                 group=StreetGroups.BROWN,
                 price=60,
-                rent=[2, 4, 10, 30, 90, 250],  # Regular, All owned, 1-4 houses, hotel
+                rent=(2, 4, 10, 30, 90, 250),  # Regular, All owned, 1-4 houses, hotel
                 house_price=50,
                 number=2,
             ),
@@ -28,7 +93,7 @@ class Board:
                 name="Baltic Avenue",
                 group=StreetGroups.BROWN,
                 price=60,
-                rent=[4, 8, 20, 60, 180, 450],
+                rent=(4, 8, 20, 60, 180, 450),
                 house_price=50,
                 number=4,
             ),
@@ -36,14 +101,14 @@ class Board:
             RailRoad(
                 name="Reading Railroad",
                 price=200,
-                rent=[25, 50, 100, 200],  # Rent for 1-4 railroads owned
+                rent=(25, 50, 100, 200),  # Rent for 1-4 railroads owned
                 number=6,
             ),
             Street(
                 name="Oriental Avenue",
                 group=StreetGroups.LIGHT_BLUE,
                 price=100,
-                rent=[6, 12, 30, 90, 270, 550],
+                rent=(6, 12, 30, 90, 270, 550),
                 house_price=50,
                 number=7,
             ),
@@ -52,7 +117,7 @@ class Board:
                 name="Vermont Avenue",
                 group=StreetGroups.LIGHT_BLUE,
                 price=100,
-                rent=[6, 12, 30, 90, 270, 550],
+                rent=(6, 12, 30, 90, 270, 550),
                 house_price=50,
                 number=9,
             ),
@@ -60,7 +125,7 @@ class Board:
                 name="Connecticut Avenue",
                 group=StreetGroups.LIGHT_BLUE,
                 price=120,
-                rent=[8, 16, 40, 100, 300, 600],
+                rent=(8, 16, 40, 100, 300, 600),
                 house_price=50,
                 number=10,
             ),
@@ -69,7 +134,7 @@ class Board:
                 name="St. Charles Place",
                 group=StreetGroups.PINK,
                 price=140,
-                rent=[10, 20, 50, 150, 450, 750],
+                rent=(10, 20, 50, 150, 450, 750),
                 house_price=100,
                 number=12,
             ),
@@ -78,7 +143,7 @@ class Board:
                 name="States Avenue",
                 group=StreetGroups.PINK,
                 price=140,
-                rent=[10, 20, 50, 150, 450, 750],
+                rent=(10, 20, 50, 150, 450, 750),
                 house_price=100,
                 number=14,
             ),
@@ -86,21 +151,21 @@ class Board:
                 name="Virginia Avenue",
                 group=StreetGroups.PINK,
                 price=160,
-                rent=[12, 24, 60, 180, 500, 900],
+                rent=(12, 24, 60, 180, 500, 900),
                 house_price=100,
                 number=15,
             ),
             RailRoad(
                 name="Pennsylvania Railroad",
                 price=200,
-                rent=[25, 50, 100, 200],
+                rent=(25, 50, 100, 200),
                 number=16,
             ),
             Street(
                 name="St. James Place",
                 group=StreetGroups.ORANGE,
                 price=180,
-                rent=[14, 28, 70, 200, 550, 950],
+                rent=(14, 28, 70, 200, 550, 950),
                 house_price=100,
                 number=17,
             ),
@@ -109,7 +174,7 @@ class Board:
                 name="Tennessee Avenue",
                 group=StreetGroups.ORANGE,
                 price=180,
-                rent=[14, 28, 70, 200, 550, 950],
+                rent=(14, 28, 70, 200, 550, 950),
                 house_price=100,
                 number=19,
             ),
@@ -117,7 +182,7 @@ class Board:
                 name="New York Avenue",
                 group=StreetGroups.ORANGE,
                 price=200,
-                rent=[16, 32, 80, 220, 600, 1000],
+                rent=(16, 32, 80, 220, 600, 1000),
                 house_price=100,
                 number=20,
             ),
@@ -126,7 +191,7 @@ class Board:
                 name="Kentucky Avenue",
                 group=StreetGroups.RED,
                 price=220,
-                rent=[18, 36, 90, 250, 700, 1050],
+                rent=(18, 36, 90, 250, 700, 1050),
                 house_price=150,
                 number=22,
             ),
@@ -135,7 +200,7 @@ class Board:
                 name="Indiana Avenue",
                 group=StreetGroups.RED,
                 price=220,
-                rent=[18, 36, 90, 250, 700, 1050],
+                rent=(18, 36, 90, 250, 700, 1050),
                 house_price=150,
                 number=24,
             ),
@@ -143,21 +208,21 @@ class Board:
                 name="Illinois Avenue",
                 group=StreetGroups.RED,
                 price=240,
-                rent=[20, 40, 100, 300, 750, 1100],
+                rent=(20, 40, 100, 300, 750, 1100),
                 house_price=150,
                 number=25,
             ),
             RailRoad(
                 name="B&O Railroad",
                 price=200,
-                rent=[25, 50, 100, 200],
+                rent=(25, 50, 100, 200),
                 number=26,
             ),
             Street(
                 name="Atlantic Avenue",
                 group=StreetGroups.YELLOW,
                 price=260,
-                rent=[22, 44, 110, 330, 800, 1150],
+                rent=(22, 44, 110, 330, 800, 1150),
                 house_price=150,
                 number=27,
             ),
@@ -165,7 +230,7 @@ class Board:
                 name="Ventnor Avenue",
                 group=StreetGroups.YELLOW,
                 price=260,
-                rent=[22, 44, 110, 330, 800, 1150],
+                rent=(22, 44, 110, 330, 800, 1150),
                 house_price=150,
                 number=28,
             ),
@@ -174,7 +239,7 @@ class Board:
                 name="Marvin Gardens",
                 group=StreetGroups.YELLOW,
                 price=280,
-                rent=[24, 48, 120, 360, 850, 1200],
+                rent=(24, 48, 120, 360, 850, 1200),
                 house_price=150,
                 number=30,
             ),
@@ -183,7 +248,7 @@ class Board:
                 name="Pacific Avenue",
                 group=StreetGroups.GREEN,
                 price=300,
-                rent=[26, 52, 130, 390, 900, 1275],
+                rent=(26, 52, 130, 390, 900, 1275),
                 house_price=200,
                 number=32,
             ),
@@ -191,7 +256,7 @@ class Board:
                 name="North Carolina Avenue",
                 group=StreetGroups.GREEN,
                 price=300,
-                rent=[26, 52, 130, 390, 900, 1275],
+                rent=(26, 52, 130, 390, 900, 1275),
                 house_price=200,
                 number=33,
             ),
@@ -200,14 +265,14 @@ class Board:
                 name="Pennsylvania Avenue",
                 group=StreetGroups.GREEN,
                 price=320,
-                rent=[28, 56, 150, 450, 1000, 1400],
+                rent=(28, 56, 150, 450, 1000, 1400),
                 house_price=200,
                 number=35,
             ),
             RailRoad(
                 name="Short Line",
                 price=200,
-                rent=[25, 50, 100, 200],
+                rent=(25, 50, 100, 200),
                 number=36,
             ),
             Chance(number=37),
@@ -215,7 +280,7 @@ class Board:
                 name="Park Place",
                 group=StreetGroups.DARK_BLUE,
                 price=350,
-                rent=[35, 70, 175, 500, 1100, 1500],
+                rent=(35, 70, 175, 500, 1100, 1500),
                 house_price=200,
                 number=38,
             ),
@@ -224,11 +289,88 @@ class Board:
                 name="Boardwalk",
                 group=StreetGroups.DARK_BLUE,
                 price=400,
-                rent=[50, 100, 200, 600, 1400, 2000],
+                rent=(50, 100, 200, 600, 1400, 2000),
                 house_price=200,
                 number=40,
             ),
         ]
+        self.tile_kinds = compile_tile_kinds(self.tiles)
+        self.nearest_tiles = compile_nearest_tiles(self.tile_kinds)
+        self.properties: List[Property] = [
+            tile for tile in self.tiles if isinstance(tile, Property)
+        ]
+
+    def reset(self):
+        """Return every property to the bank, unmortgaged and unbuilt."""
+        if LOG.setup:
+            LOG.write("Board.reset() called.")
+        for tile in self.properties:
+            tile.owner = None
+            tile.mortgaged = False
+            if isinstance(tile, Street):
+                tile.level = 0
+
+
+class TileKinds(IntEnum):
+    IDLE = 0  # GO, Jail (just visiting), Free Parking
+    STREET = 1
+    RAILROAD = 2
+    UTILITY = 3
+    CHANCE = 4
+    COMMUNITY_CHEST = 5
+    TAX = 6
+    GO_TO_JAIL = 7
+
+
+# Tile class name -> kind. Classes are matched by name along the MRO, so the
+# parallel tile classes of sim_gui classify the same way as these.
+TILE_CLASS_KINDS = {
+    "Street": TileKinds.STREET,
+    "RailRoad": TileKinds.RAILROAD,
+    "Utility": TileKinds.UTILITY,
+    "Chance": TileKinds.CHANCE,
+    "CommunityChest": TileKinds.COMMUNITY_CHEST,
+    "Tax": TileKinds.TAX,
+}
+
+
+def compile_tile_kinds(tiles) -> List[TileKinds]:
+    """Classify every tile once so landings can dispatch on position alone."""
+    kinds = []
+    for tile in tiles:
+        kind = next(
+            (
+                TILE_CLASS_KINDS[cls.__name__]
+                for cls in type(tile).__mro__
+                if cls.__name__ in TILE_CLASS_KINDS
+            ),
+            None,
+        )
+        if kind is None:
+            kind = TileKinds.GO_TO_JAIL if tile.type == "go_to_jail" else TileKinds.IDLE
+        kinds.append(kind)
+    return kinds
+
+
+def compile_nearest_tiles(
+    tile_kinds: List[TileKinds],
+    kinds=(TileKinds.RAILROAD, TileKinds.UTILITY),
+) -> Dict[TileKinds, List[int]]:
+    """
+    For each of `kinds` and every position, the next tile of that kind moving
+    forward.
+    """
+    size = len(tile_kinds)
+    nearest_tiles = {}
+    for kind in kinds:
+        nearest = []
+        for position in range(size):
+            for step in range(1, size + 1):
+                if tile_kinds[(position + step) % size] == kind:
+                    nearest.append((position + step) % size)
+                    break
+        nearest_tiles[kind] = nearest
+    return nearest_tiles
 
 
 class ChanceCards(Enum):
@@ -283,62 +425,207 @@ class CommunityChestCards(Enum):
     INHERITANCE = "You inherit $100"
 
 
+class CardActions(IntEnum):
+    CASH = 0
+    MOVE_TO = 1
+    MOVE_TO_NEAREST = 2
+    MOVE_BACK = 3
+    GO_TO_JAIL = 4
+    PAY_EACH_PLAYER = 5
+    REPAIRS = 6
+    KEEP_CARD = 7
+
+
+class CardEffect(NamedTuple):
+    action: CardActions
+    cash: int = 0  # earned from (+) or paid to (-) the bank
+    move_to: Optional[int] = None  # board position, collect 200 when passing GO
+    nearest: Optional[TileKinds] = None
+    move_back: int = 0
+    pay_each_player: int = 0  # paid to (+) or collected from (-) every other player
+    repair_rates: Tuple[int, int] = (0, 0)  # per house, per hotel
+    keep_card: bool = False
+
+
+CARD_EFFECTS: Dict[Enum, CardEffect] = {
+    ChanceCards.ADVANCE_TO_GO: CardEffect(CardActions.MOVE_TO, move_to=0),
+    ChanceCards.BANK_DIVIDEND: CardEffect(CardActions.CASH, cash=50),
+    ChanceCards.GO_TO_JAIL: CardEffect(CardActions.GO_TO_JAIL),
+    ChanceCards.ADVANCE_TO_ILLINOIS: CardEffect(CardActions.MOVE_TO, move_to=24),
+    ChanceCards.ADVANCE_TO_ST_CHARLES: CardEffect(CardActions.MOVE_TO, move_to=11),
+    ChanceCards.NEAREST_UTILITY: CardEffect(
+        CardActions.MOVE_TO_NEAREST, nearest=TileKinds.UTILITY
+    ),
+    ChanceCards.NEAREST_RAILROAD: CardEffect(
+        CardActions.MOVE_TO_NEAREST, nearest=TileKinds.RAILROAD
+    ),
+    ChanceCards.READING_RAILROAD: CardEffect(CardActions.MOVE_TO, move_to=5),
+    ChanceCards.BOARDWALK: CardEffect(CardActions.MOVE_TO, move_to=39),
+    ChanceCards.CHAIRMAN: CardEffect(CardActions.PAY_EACH_PLAYER, pay_each_player=50),
+    ChanceCards.BUILDING_LOAN: CardEffect(CardActions.CASH, cash=150),
+    ChanceCards.STREET_REPAIRS: CardEffect(CardActions.REPAIRS, repair_rates=(40, 115)),
+    ChanceCards.POOR_TAX: CardEffect(CardActions.CASH, cash=-15),
+    ChanceCards.GENERAL_REPAIRS: CardEffect(
+        CardActions.REPAIRS, repair_rates=(25, 100)
+    ),
+    ChanceCards.GET_OUT_OF_JAIL_FREE: CardEffect(CardActions.KEEP_CARD, keep_card=True),
+    ChanceCards.GO_BACK_THREE: CardEffect(CardActions.MOVE_BACK, move_back=3),
+    CommunityChestCards.ADVANCE_TO_GO: CardEffect(CardActions.MOVE_TO, move_to=0),
+    CommunityChestCards.BANK_ERROR: CardEffect(CardActions.CASH, cash=200),
+    CommunityChestCards.DOCTOR_FEE: CardEffect(CardActions.CASH, cash=-50),
+    CommunityChestCards.STOCK_SALE: CardEffect(CardActions.CASH, cash=50),
+    CommunityChestCards.GO_TO_JAIL: CardEffect(CardActions.GO_TO_JAIL),
+    CommunityChestCards.GET_OUT_OF_JAIL_FREE: CardEffect(
+        CardActions.KEEP_CARD, keep_card=True
+    ),
+    CommunityChestCards.HOLIDAY_FUND: CardEffect(CardActions.CASH, cash=100),
+    CommunityChestCards.INCOME_TAX_REFUND: CardEffect(CardActions.CASH, cash=20),
+    CommunityChestCards.BIRTHDAY: CardEffect(
+        CardActions.PAY_EACH_PLAYER, pay_each_player=-10
+    ),
+    CommunityChestCards.LIFE_INSURANCE: CardEffect(CardActions.CASH, cash=100),
+    CommunityChestCards.HOSPITAL_FEES: CardEffect(CardActions.CASH, cash=-100),
+    CommunityChestCards.SCHOOL_FEES: CardEffect(CardActions.CASH, cash=-50),
+    CommunityChestCards.CONSULTANCY_FEE: CardEffect(CardActions.CASH, cash=25),
+    CommunityChestCards.STREET_REPAIRS: CardEffect(
+        CardActions.REPAIRS, repair_rates=(40, 115)
+    ),
+    CommunityChestCards.BEAUTY_CONTEST: CardEffect(CardActions.CASH, cash=10),
+    CommunityChestCards.INHERITANCE: CardEffect(CardActions.CASH, cash=100),
+}
+
+
+# A random byte below 252 maps uniformly onto the 36 dice pairs; the rest are
+# thrown away so no pair is favoured
+DICE_PAIRS = [(d1, d2) for d1 in range(1, 7) for d2 in range(1, 7)]
+DICE_BYTE_TABLE = bytes(b % 36 for b in range(256))
+DICE_REJECTED_BYTES = bytes(range(252, 256))
+
+
+class GameRNG:
+    """
+    Random streams owned by a single game.
+    Dice, decisions and deck shuffles come from separate generators seeded
+    from the master seed and the game index, so game i of a run is the same
+    no matter which process plays it. Dice and decisions are drawn in blocks
+    and served from a buffer.
+    """
+
+    BLOCK_SIZE = 1024
+
+    def __init__(self, seed=None, index: int = 0):
+        self.dice_source = random.Random()
+        self.decision_source = random.Random()
+        self.card_source = random.Random()
+        self.reseed(seed, index)
+
+    def reseed(self, seed, index: int = 0) -> None:
+        self.seed = seed
+        self.index = index
+        self.dice_source.seed(f"{seed}/{index}/dice")
+        self.decision_source.seed(f"{seed}/{index}/decisions")
+        self.card_source.seed(f"{seed}/{index}/cards")
+        self.dice = iter(())
+        self.uniforms = iter(())
+
+    def roll_dice(self) -> Tuple[int, int]:
+        try:
+            return next(self.dice)
+        except StopIteration:
+            block = self.dice_source.randbytes(self.BLOCK_SIZE)
+            codes = block.translate(DICE_BYTE_TABLE, DICE_REJECTED_BYTES)
+            self.dice = map(DICE_PAIRS.__getitem__, codes)
+            return next(self.dice)
+
+    def random(self) -> float:
+        try:
+            return next(self.uniforms)
+        except StopIteration:
+            draw = self.decision_source.random
+            self.uniforms = iter([draw() for _ in range(self.BLOCK_SIZE)])
+            return next(self.uniforms)
+
+    def shuffle(self, items: list) -> None:
+        self.decision_source.shuffle(items)
+
+    def shuffle_deck(self, cards: list) -> None:
+        self.card_source.shuffle(cards)
+
+
+class Deck:
+    """
+    A game's Chance or Community Chest deck: the cards in shuffled order and
+    the index of the next draw. The Get Out of Jail Free card is skipped
+    while a player holds it.
+    """
+
+    def __init__(self, cards: List[Enum], rng: GameRNG):
+        self.printed_order = tuple(cards)
+        self.cards = list(cards)
+        self.reset(rng)
+
+    def reset(self, rng: GameRNG) -> None:
+        self.cards[:] = self.printed_order
+        rng.shuffle_deck(self.cards)
+        self.next_index = 0
+        self.jail_free_card_out = False
+
+    def draw(self) -> Enum:
+        card = self.cards[self.next_index]
+        self.next_index = (self.next_index + 1) % len(self.cards)
+        if CARD_EFFECTS[card].keep_card:
+            if self.jail_free_card_out:
+                return self.draw()
+            self.jail_free_card_out = True
+        return card
+
+    def put_jail_free_card_back(self) -> None:
+        self.jail_free_card_out = False
+
+
 class Block(ABC):
+    __slots__ = ("type", "number")
 
     def __init__(self, type, number):
         self.type = type
         self.number = number
+        if LOG.setup:
+            LOG.write(f"Created Block: {self.type}, number={self.number}")
 
 
 class Chance(Block):
-    chance_deque = deque([chance for chance in ChanceCards])
+    __slots__ = ()
 
     def __init__(self, number):
         super().__init__("chance", number)
 
-    @classmethod
-    def get_chance_card(cls):
-        card = cls.chance_deque.pop()
-        if card != ChanceCards.GET_OUT_OF_JAIL_FREE:
-            cls.chance_deque.appendleft(card)
-        return card
-
-    @classmethod
-    def put_jail_free_card_back(cls):
-        cls.chance_deque.appendleft(ChanceCards.GET_OUT_OF_JAIL_FREE)
-
 
 class CommunityChest(Block):
-    community_chest_deque = deque(
-        [community_chest for community_chest in CommunityChestCards]
-    )
+    __slots__ = ()
 
     def __init__(self, number):
         super().__init__("community_chest", number)
 
-    @classmethod
-    def get_community_chest_card(cls):
-        card = cls.community_chest_deque.pop()
-        if card != CommunityChestCards.GET_OUT_OF_JAIL_FREE:
-            cls.community_chest_deque.appendleft(card)
-        return card
-
-    @classmethod
-    def put_jail_free_card_back(cls):
-        cls.community_chest_deque.appendleft(CommunityChestCards.GET_OUT_OF_JAIL_FREE)
-
 
 class Tax(Block):
+    __slots__ = ("name", "amount")
+
     def __init__(self, name, amount, number):
         super().__init__("tax", number)
         self.name = name
         self.amount = amount
 
     def apply_tax(self, player: "Player"):
+        if LOG.money:
+            LOG.write(
+                f"{player.name} landed on Tax: {self.name}, must pay {self.amount}"
+            )
         player.pay(self.amount)
 
 
 class Property(Block):
+    __slots__ = ("name", "price", "mortgage", "unmortgage", "mortgaged", "owner")
+
     def __init__(self, name, price, number):
         super().__init__("property", number=number)
         self.name = name
@@ -354,6 +641,8 @@ class Property(Block):
 
 
 class Utility(Property):
+    __slots__ = ()
+
     def __init__(self, name, price, number):
         super().__init__(name, price, number)
 
@@ -364,11 +653,16 @@ class Utility(Property):
             return 0
         if self.owner == player:
             return 0
-        return dice_roll * (10 if len(self.owner.utilities) == 2 else 4)
+        rent = dice_roll * (10 if len(self.owner.utilities) == 2 else 4)
+        if LOG.rent:
+            LOG.write(f"Utility rent calculated: {rent} (dice={dice_roll})")
+        return rent
 
 
 class RailRoad(Property):
-    def __init__(self, name: str, price: int, rent: List[int], number: int):
+    __slots__ = ("rent",)
+
+    def __init__(self, name: str, price: int, rent: Tuple[int, ...], number: int):
         super().__init__(name, price, number)
         self.rent = rent
 
@@ -380,6 +674,11 @@ class RailRoad(Property):
         if self.owner == player:
             return 0
         railroads_owned = len(self.owner.railroads)
+        if LOG.rent:
+            LOG.write(
+                f"Railroad rent calculated: {self.rent[railroads_owned - 1]}"
+                f" (RRs owned={railroads_owned})"
+            )
         return self.rent[railroads_owned - 1]
 
 
@@ -395,6 +694,8 @@ class StreetGroups(Enum):
 
 
 class Street(Property):
+    __slots__ = ("house_price", "group", "rent", "level")
+
     GROUP_COUNTS = {
         StreetGroups.BROWN: 2,
         StreetGroups.LIGHT_BLUE: 3,
@@ -411,7 +712,7 @@ class Street(Property):
         name: str,
         group: StreetGroups,
         price: int,
-        rent: List[int],
+        rent: Tuple[int, ...],
         house_price: int,
         number: int,
     ):
@@ -439,18 +740,51 @@ class Street(Property):
             return 0
         if self.owner == player:
             return 0
+        if LOG.rent:
+            LOG.write(
+                f"Street rent calculated: {self.rent[self.level]} (level={self.level})"
+            )
         return self.rent[self.level]
 
 
 class Bank:
     def __init__(self):
-        pass
+        if LOG.setup:
+            LOG.write("Bank created.")
 
     def earn(self, amount):
-        pass
+        # The bank's funds are unlimited, so there is nothing to track
+        if LOG.money:
+            LOG.write(f"Bank earned {amount}.")
 
 
 class Player:
+    __slots__ = (
+        "name",
+        "w_buy_building",
+        "w_buy_railroad",
+        "w_buy_utility",
+        "w_use_jail_free_card",
+        "w_roll_double_in_jail",
+        "min_cash",
+        "min_cash_to_unmortgage",
+        "jail_roll_attempts",
+        "consecutive_doubles",
+        "is_in_jail",
+        "cash",
+        "streets",
+        "railroads",
+        "utilities",
+        "is_in_game",
+        "position",
+        "last_dice_roll",
+        "community_chest_jail_free_card",
+        "chance_jail_free_card",
+        "rng",
+        "chance_deck",
+        "community_chest_deck",
+    )
+
     def __init__(
         self,
         name,
@@ -470,14 +804,27 @@ class Player:
         self.w_roll_double_in_jail: float = w_roll_double_in_jail
         self.min_cash: int = min_cash
         self.min_cash_to_unmortgage: int = min_cash_to_unmortgage
+        self.streets: Dict[str, List[Street]] = {}
+        self.railroads: List[RailRoad] = []
+        self.utilities: List[Utility] = []
+        # Replaced by the game's own streams and decks once the player joins a Game
+        self.rng = random
+        self.chance_deck: Optional[Deck] = None
+        self.community_chest_deck: Optional[Deck] = None
+        self.reset()
+        if LOG.setup:
+            LOG.write(f"Created Player {self.name} with ${self.cash}.")
+
+    def reset(self):
+        """Restore the state a player starts a game with; strategy is kept."""
         self.jail_roll_attempts: int = 0
         self.consecutive_doubles: int = 0
         self.is_in_jail: bool = False
         self.cash: int = 1500
         # self.liquidity: int = 1500
-        self.streets: Dict[str, List[Street]] = {}
-        self.railroads: List[RailRoad] = []
-        self.utilities: List[Utility] = []
+        self.streets.clear()
+        self.railroads.clear()
+        self.utilities.clear()
         self.is_in_game: bool = True
         self.position: int = 0
         self.last_dice_roll: int = 0
@@ -503,89 +850,73 @@ class Player:
         return self.community_chest_jail_free_card or self.chance_jail_free_card
 
     def decide_to_use_jail_free_card(self) -> bool:
-        return random.random() < self.w_use_jail_free_card
+        decision = self.rng.random() < self.w_use_jail_free_card
+        if LOG.jail:
+            LOG.write(f"{self.name} deciding to use Jail Free Card: {decision}")
+        return decision
 
     def use_jail_free_card(self) -> None:
         if self.chance_jail_free_card:
+            if LOG.jail:
+                LOG.write(f"{self.name} used CHANCE Jail Free Card.")
             self.chance_jail_free_card = False
-            Chance.put_jail_free_card_back()
+            self.chance_deck.put_jail_free_card_back()
         elif self.community_chest_jail_free_card:
+            if LOG.jail:
+                LOG.write(f"{self.name} used COMMUNITY CHEST Jail Free Card.")
             self.community_chest_jail_free_card = False
-            CommunityChest.put_jail_free_card_back()
+            self.community_chest_deck.put_jail_free_card_back()
         else:
             raise Exception(
                 "Should only call this when the player has a jail free card"
             )
 
     def reset_jail_roll_attempts(self):
+        if LOG.jail:
+            LOG.write(
+                f"{self.name} reset jail roll attempts from"
+                f" {self.jail_roll_attempts} to 0."
+            )
         self.jail_roll_attempts = 0
 
     def decide_to_roll_for_doubles(self) -> bool:
-        return random.random() < self.w_roll_double_in_jail
-
-    def advance_to_illinois(self) -> None:
-        if self.position > 24:
-            self.earn(200)
-        self.position = 24
-
-    def advance_to_st_charles(self) -> None:
-        if self.position > 11:
-            self.earn(200)
-        self.position = 11
-
-    def advance_to_nearest_utility(self):
-        if self.position < 12:
-            self.position = 12
-        else:
-            self.position = 28
-
-    def advance_to_nearest_railroad(self):
-        if self.position < 5 or self.position > 35:
-            self.position = 5
-        elif self.position < 15:
-            self.position = 15
-        elif self.position < 25:
-            self.position = 25
-        elif self.position < 35:
-            self.position = 35
-
-    def advance_to_reading_railroad(self):
-        if self.position > 5:
+        decision = self.rng.random() < self.w_roll_double_in_jail
+        if LOG.decisions:
+            LOG.write(f"{self.name} deciding to roll for doubles: {decision}")
+        return decision
+
+    def advance_to(self, position: int) -> None:
+        if LOG.movement:
+            LOG.write(f"{self.name} advanced from {self.position} to {position}.")
+        # Cards only move tokens forward, so a lower target means passing GO
+        if position < self.position:
+            if LOG.movement:
+                LOG.write(f"{self.name} passed GO, +200.")
             self.earn(200)
-        self.position = 5
-
-    def advance_to_go(self):
-        self.position = 0
-        self.earn(200)
-
-    def advance_to_boardwalk(self):
-        self.position = 39
-
-    def determine_street_repair_fee(self):
-        total = 0
-        for _group, streets in self.streets.items():
-            for street in streets:
-                if street.level == 5:
-                    total += 115
-                elif street.level >= 2:
-                    num_houses = street.level - 1
-                    total += 40 * num_houses
-        return total
+        self.position = position
+
+    def go_back(self, steps: int, board_size: int) -> None:
+        old_position = self.position
+        self.position = (self.position - steps + board_size) % board_size
+        if LOG.movement:
+            LOG.write(
+                f"{self.name} goes back {steps} spaces from {old_position}"
+                f" to {self.position}."
+            )
 
-    def determine_general_repair_fee(self):
+    def determine_repair_fee(self, per_house: int, per_hotel: int) -> int:
         total = 0
         for _group, streets in self.streets.items():
             for street in streets:
                 if street.level == 5:
-                    total += 100
+                    total += per_hotel
                 elif street.level >= 2:
                     num_houses = street.level - 1
-                    total += 25 * num_houses
+                    total += per_house * num_houses
+        if LOG.money:
+            LOG.write(f"{self.name} must pay a repair fee of {total}.")
         return total
 
-    def go_back_three(self, board_size: int):
-        self.position = (self.position - 3 + board_size) % board_size
-
     def get_valid_expandable_sets(self) -> Dict[str, List[Street]]:
         """Get a dictionary of all the compeleted sets that still have capacity to build houses on"""
         sets: Dict[str, List[Street]] = {}
@@ -605,14 +936,17 @@ class Player:
         - "random": Randomize the order of groups.
         - "quantity_price": Sort groups based on total house levels and minimum house price.
         """
-        from random import shuffle
-
+        if LOG.property:
+            LOG.write(
+                f"{self.name} is attempting to buy houses/hotels"
+                f" with priority={priority}."
+            )
         # Get all completed sets that can still be expanded (not maxed out)
         completed_sets = self.get_valid_expandable_sets()
 
         def get_groups_based_on_random():
             groups = list(completed_sets.keys())
-            shuffle(groups)
+            self.rng.shuffle(groups)
             return groups
 
         def get_groups_based_on_house_quantity_price_priority():
@@ -664,6 +998,10 @@ class Player:
                         self.buy_house(property)
                         built = True
                     else:
+                        if LOG.property:
+                            LOG.write(
+                                f"{self.name} cannot afford a house on {property.name}."
+                            )
                         break  # Stop if funds are insufficient for further houses
 
             # Break the loop if no houses were built in this iteration
@@ -671,6 +1009,8 @@ class Player:
                 break
 
     def unmortgage_properties(self):
+        if LOG.property:
+            LOG.write(f"{self.name} attempts to unmortgage properties.")
         # Filter mortgaged properties by group
         mortgaged_groups = {
             group: properties
@@ -690,11 +1030,18 @@ class Player:
                     property.mortgaged
                     and self.cash - property.unmortgage >= self.min_cash_to_unmortgage
                 ):
+                    if LOG.property:
+                        LOG.write(
+                            f"{self.name} unmortgages {property.name}"
+                            f" for {property.unmortgage}."
+                        )
                     self.cash -= property.unmortgage
                     # self.liquidity -= property.unmortgage
                     property.mortgaged = False
 
     def transfer_ownership_of_all_assets_to_another_player(self, other: "Player"):
+        if LOG.property:
+            LOG.write(f"{self.name} is transferring all assets to {other.name}.")
         # CASH
         other.earn(self.cash)
         self.cash = 0
@@ -721,13 +1068,24 @@ class Player:
 
         # JAIL FREE CARDS
         if self.community_chest_jail_free_card:
+            if LOG.property:
+                LOG.write(
+                    f"{self.name} also gives COMMUNITY CHEST Jail Free card"
+                    f" to {other.name}."
+                )
             other.community_chest_jail_free_card = True
         if self.chance_jail_free_card:
+            if LOG.property:
+                LOG.write(
+                    f"{self.name} also gives CHANCE Jail Free card to {other.name}."
+                )
             other.chance_jail_free_card = True
 
     def transfer_ownership_of_all_assets_to_the_bank(self, to: Bank):
         ## TODO: Technically bank should auction everything
         ## However for now this implementation just frees the cards so they can be repurchased
+        if LOG.property:
+            LOG.write(f"{self.name} is transferring all assets back to the Bank.")
         self.cash = 0
         # self.liquidity = 0
 
@@ -748,9 +1106,15 @@ class Player:
 
         # JAIL FREE CARDS
         if self.community_chest_jail_free_card:
-            CommunityChest.put_jail_free_card_back()
+            if LOG.property:
+                LOG.write(
+                    f"{self.name} returns COMMUNITY CHEST Jail Free card to deck."
+                )
+            self.community_chest_deck.put_jail_free_card_back()
         if self.chance_jail_free_card:
-            Chance.put_jail_free_card_back()
+            if LOG.property:
+                LOG.write(f"{self.name} returns CHANCE Jail Free card to deck.")
+            self.chance_deck.put_jail_free_card_back()
 
     def receive_street(self, street: Street) -> None:
         if street.group not in self.streets:
@@ -764,38 +1128,61 @@ class Player:
             self.transfer_ownership_of_all_assets_to_the_bank(to)
 
     def pay(self, amount, to: Union["Player", Bank]):
+        if LOG.money:
+            LOG.write(f"{self.name} must pay {amount} to {to.__class__.__name__}.")
         if self.cash < amount:
             self.raise_fund(amount=amount)
 
         if self.cash < amount:
+            if LOG.money:
+                LOG.write(f"{self.name} cannot pay and is going bankrupt!")
             self.is_in_game = False
             self.transfer_ownership_of_all_assets(to)
             return
+        if LOG.money:
+            LOG.write(
+                f"{self.name} pays {amount}. Remaining cash={self.cash - amount}."
+            )
+        self.cash -= amount
         to.earn(amount=amount)
 
     def earn(self, amount: int):
+        if LOG.money:
+            LOG.write(f"{self.name} earns {amount}. Old cash={self.cash}.")
         self.cash += amount
         # self.liquidity += amount
 
     def decide_to_buy_property_random(
         self, property: Union[Street, RailRoad, Utility]
     ) -> bool:
+        decision = False
         if isinstance(property, Street):
-            return random.random() < self.w_buy_building
+            decision = self.rng.random() < self.w_buy_building
         elif isinstance(property, RailRoad):
-            return random.random() < self.w_buy_railroad
+            decision = self.rng.random() < self.w_buy_railroad
         elif isinstance(property, Utility):
-            return random.random() < self.w_buy_utility
-        return False
+            decision = self.rng.random() < self.w_buy_utility
+        if LOG.decisions:
+            LOG.write(
+                f"{self.name} random buy-decision for {property.name}: {decision}"
+            )
+        return decision
 
     def decide_to_buy_property(self, property: Union[Street, RailRoad, Utility]):
         if self.cash - property.price < self.min_cash:
+            if LOG.decisions:
+                LOG.write(
+                    f"{self.name} cannot buy {property.name},"
+                    " not enough cash after min_cash check."
+                )
             return False
         return self.decide_to_buy_property_random(property)
 
     def buy_property(self, property: "Property"):
         if property.owner is not None:
             return
+        if LOG.property:
+            LOG.write(f"{self.name} buys {property.name} for {property.price}.")
         self.cash -= property.price
         # self.liquidity -= property.price
         # self.liquidity += property.mortgage
@@ -807,12 +1194,22 @@ class Player:
             if len(self.streets[property.group]) == 3:
                 for street in self.streets[property.group]:
                     street.level = 1
+                if LOG.property:
+                    LOG.write(
+                        f"{self.name} now owns the full set for"
+                        f" {property.group.name}; all set to level=1."
+                    )
         elif isinstance(property, RailRoad):
             self.railroads.append(property)
         elif isinstance(property, Utility):
             self.utilities.append(property)
 
     def buy_house(self, property: "Street"):
+        if LOG.property:
+            LOG.write(
+                f"{self.name} is buying a house on {property.name},"
+                f" cost {property.house_price}."
+            )
         property.level += 1
         self.cash -= property.house_price
         ##self.liquidity -= property.house_price
@@ -833,6 +1230,11 @@ class Player:
         2. Mortgaging properties with the least number of houses owned in the group and the cheapest price to mortgage
         NOTE: It is assumed this function is only called if it is actually possible to achieve amount (total_assets > amount)
         """
+        if LOG.money:
+            LOG.write(
+                f"{self.name} is trying to raise funds to pay {amount}."
+                f" Current cash={self.cash}."
+            )
 
         def raise_fund_by_selling_houses():
             streets_with_houses = self.get_streets_with_houses()
@@ -844,6 +1246,11 @@ class Player:
 
             while self.cash < amount and streets_with_houses:
                 property = streets_with_houses[-1]
+                if LOG.money:
+                    LOG.write(
+                        f"{self.name} sells house on {property.name},"
+                        f" gets {property.house_price // 2} back."
+                    )
                 self.cash += property.house_price // 2
                 ##self.liquidity -= property.house_price // 2
                 property.level -= 1
@@ -851,6 +1258,8 @@ class Player:
                     streets_with_houses.pop()
 
         def raise_fund_by_mortgaging_properties():
+            if LOG.money:
+                LOG.write(f"{self.name} tries mortgaging properties to raise funds.")
             property_frequency: Dict[int, List[Property]] = {}
             for _group, properties in self.streets.items():
                 if len(properties) not in property_frequency:
@@ -882,6 +1291,11 @@ class Player:
                 for _freq, properties in property_frequency.items():
                     for property in properties:
                         if not property.mortgaged:
+                            if LOG.money:
+                                LOG.write(
+                                    f"{self.name} mortgages {property.name}"
+                                    f" for {property.mortgage}."
+                                )
                             self.cash += property.mortgage
                             # self.liquidity -= property.mortgage
                             property.mortgaged = True
@@ -895,23 +1309,75 @@ class Player:
         raise_fund_by_mortgaging_properties()
 
     def move(self, steps, board_size):
+        if LOG.movement:
+            LOG.write(f"{self.name} moves {steps} steps from {self.position}.")
         self.last_dice_roll = steps
         self.position = self.position + steps
         if self.position / board_size >= 1:
+            if LOG.movement:
+                LOG.write(f"{self.name} passed GO, +200.")
             self.cash += 200
             # self.liquidity += 200
         self.position %= board_size
+        if LOG.movement:
+            LOG.write(f"{self.name} new position: {self.position}.")
 
     def get_position(self):
         return self.position
 
     def go_to_jail(self):
+        if LOG.jail:
+            LOG.write(f"{self.name} goes to Jail!")
         self.is_in_jail = True
         self.position = 10
 
 
+class Outcome(Enum):
+    BANKRUPTCY = "bankruptcy"  # one player left
+    STALEMATE = "stalemate"  # no progress; a winner only if adjudicated
+    TURN_CAP = "turn_cap"  # no winner
+    RESIGNATION = "resignation"  # called early by a position evaluator
+
+
+MAX_TURNS = 10000
+# A game is a stalemate once no property has changed owner, level or mortgage
+# and no player still in the game has lost more than max_cash_drift over
+# stalemate_window turns. It ends with no winner unless the game adjudicates
+# stalemates, in which case the richest player wins. Stalemates, and the
+# evaluator if there is one, are checked every CHECK_INTERVAL turns.
+STALEMATE_WINDOW = 1000
+CHECK_INTERVAL = 100
+
+
 class Game:
-    def __init__(self, p1, p2, p3=None, p4=None):
+    def __init__(
+        self,
+        p1,
+        p2,
+        p3=None,
+        p4=None,
+        rng: Optional[GameRNG] = None,
+        max_turns: int = MAX_TURNS,
+        stalemate_window: Optional[int] = STALEMATE_WINDOW,
+        max_cash_drift: int = 0,
+        adjudicate_stalemates: bool = False,
+        evaluator=None,
+    ):
+        """
+        stalemate_window=None turns stalemate detection off, so a game only
+        ends in bankruptcy or at max_turns. A stalemate has no winner unless
+        adjudicate_stalemates is set, which gives it to the richest player.
+        evaluator, e.g. sim_evaluate.PositionEvaluator, may end a decided game
+        early: its resigns_to(game) returns the player the others resign to.
+        """
+        if LOG.setup:
+            LOG.write("Initializing Game with players.")
+        self.max_turns = max_turns
+        self.stalemate_window = stalemate_window
+        self.max_cash_drift = max_cash_drift
+        self.adjudicate_stalemates = adjudicate_stalemates
+        self.evaluator = evaluator
+        self.outcome: Optional[Outcome] = None
         # Create a game board
         self.board = Board()
         self.players: List[Player] = [p1, p2]
@@ -921,24 +1387,116 @@ class Game:
             self.players.append(p4)
         self.bank = Bank()
         self.current_player_index = 0
+        self.turn_count = 0
+        # Without an explicit rng the game is seeded from the global stream,
+        # so random.seed() still makes a single game reproducible
+        self.rng = rng or GameRNG(random.getrandbits(64))
+        self.chance_deck = Deck(list(ChanceCards), self.rng)
+        self.community_chest_deck = Deck(list(CommunityChestCards), self.rng)
+        for player in self.players:
+            player.rng = self.rng
+            player.chance_deck = self.chance_deck
+            player.community_chest_deck = self.community_chest_deck
+        # One landing handler per board position, indexed by tile kind
+        handlers = {
+            TileKinds.IDLE: self.handle_idle_landing,
+            TileKinds.STREET: self.handle_street_landing,
+            TileKinds.RAILROAD: self.handle_railroad_landing,
+            TileKinds.UTILITY: self.handle_utility_landing,
+            TileKinds.CHANCE: self.handle_chance_landing,
+            TileKinds.COMMUNITY_CHEST: self.handle_community_chest_landing,
+            TileKinds.TAX: self.handle_tax_landing,
+            TileKinds.GO_TO_JAIL: self.handle_go_to_jail_landing,
+        }
+        self.landing_handlers = [handlers[kind] for kind in self.board.tile_kinds]
+        self.nearest_landing_handlers = {
+            TileKinds.RAILROAD: self.handle_nearest_railroad_landing,
+            TileKinds.UTILITY: self.handle_nearest_utility_landing,
+        }
+        self.card_handlers = {
+            CardActions.CASH: self.apply_cash_card,
+            CardActions.MOVE_TO: self.apply_move_to_card,
+            CardActions.MOVE_TO_NEAREST: self.apply_move_to_nearest_card,
+            CardActions.MOVE_BACK: self.apply_move_back_card,
+            CardActions.GO_TO_JAIL: self.apply_go_to_jail_card,
+            CardActions.PAY_EACH_PLAYER: self.apply_pay_each_player_card,
+            CardActions.REPAIRS: self.apply_repairs_card,
+            CardActions.KEEP_CARD: self.apply_keep_card,
+        }
 
     def roll_dice(self):
-        return random.randint(1, 6), random.randint(1, 6)
+        if LOG.dice:
+            d1, d2 = self.rng.roll_dice()
+            LOG.write(f"Dice rolled => ({d1}, {d2})")
+            return d1, d2
+        return self.rng.roll_dice()
 
     def next_player(self):
         self.current_player_index = (self.current_player_index + 1) % len(self.players)
+        if LOG.turns:
+            LOG.write(f"Next player: index {self.current_player_index}.")
 
     def check_win_condition(self) -> Optional[Player]:
         active_players = [p for p in self.players if p.is_in_game]
         if len(active_players) == 1:
+            if LOG.turns:
+                LOG.write(
+                    f"WIN CONDITION MET: {active_players[0].name}"
+                    " is the last active player."
+                )
             return active_players[0]
         return None
 
+    def net_worth(self, player: Player) -> float:
+        """Cash plus printed prices, halved when mortgaged, plus buildings."""
+        worth = player.cash
+        for tile in self.board.properties:
+            if tile.owner is player:
+                worth += tile.mortgage if tile.mortgaged else tile.price
+                if isinstance(tile, Street) and tile.level > 1:
+                    worth += (tile.level - 1) * tile.house_price
+        return worth
+
+    def adjudicate(self) -> Player:
+        """The richest player still in the game; ties go to the earlier seat."""
+        active_players = [p for p in self.players if p.is_in_game]
+        return max(active_players, key=self.net_worth)
+
+    def board_state(self) -> Tuple:
+        return tuple(
+            (tile.owner, tile.mortgaged, getattr(tile, "level", 0))
+            for tile in self.board.properties
+        )
+
+    def is_stalemate(self) -> bool:
+        """Called every CHECK_INTERVAL turns by simulate_game."""
+        state = self.board_state()
+        cash = [player.cash for player in self.players]
+        if state != self.window_state:
+            self.window_state, self.window_cash = state, cash
+            self.window_start = self.turn_count
+            return False
+        if self.turn_count - self.window_start < self.stalemate_window:
+            return False
+        if any(
+            player.is_in_game and now < then - self.max_cash_drift
+            for player, now, then in zip(self.players, cash, self.window_cash)
+        ):
+            # Someone is still being bled; start a new window from here
+            self.window_cash = cash
+            self.window_start = self.turn_count
+            return False
+        return True
+
     def play_turn(self):
         logs = []
         player = self.players[self.current_player_index]
+        if LOG.turns:
+            LOG.write(f"--- TURN START :: {player.name} ---")
 
         if not player.is_in_game:
+            if LOG.turns:
+                LOG.write(f"{player.name} is out of the game, skipping.")
             self.next_player()
             return
 
@@ -947,11 +1505,12 @@ class Game:
             logs.append(f"{player.name} is in jail. Attempting to get out...")
             skip, d1_j, d2_j = self.attempt_jail_break(player)
             if skip:
+                if LOG.turns:
+                    LOG.write(f"{player.name} remains in jail, end turn.")
                 self.next_player()
                 return logs
-            if d1 and d2:
-                d1 = d1_j
-                d2 = d2_j
+            player.is_in_jail = False
+            d1, d2 = d1_j, d2_j
         logs.append(f"{player.name} rolled dice ({d1}, {d2}) => {d1+d2}")
 
         old_position = player.get_position()
@@ -959,13 +1518,19 @@ class Game:
         logs.append(
             f"{player.name} moved from {old_position} to {player.get_position()}."
         )
-        tile = self.board.tiles[player.position]
-        self.handle_tile_landing(player, tile)
+        position = player.position
+        if LOG.landings:
+            self.log_landing(player)
+        self.landing_handlers[position](player, self.board.tiles[position])
 
         # DOUBLE DICE CHECKS
         if d1 == d2:
+            if LOG.turns:
+                LOG.write(f"{player.name} rolled a double.")
             player.consecutive_doubles += 1
             if player.consecutive_doubles == 3:
+                if LOG.turns:
+                    LOG.write(f"{player.name} rolled 3 consecutive doubles => Jail!")
                 player.go_to_jail()
                 player.consecutive_doubles = 0
                 self.next_player()
@@ -977,46 +1542,66 @@ class Game:
         if player.is_in_game:
             player.unmortgage_properties()
             player.buy_houses_and_hotels()
+        if LOG.state:
+            for other in self.players:
+                LOG.write(repr(other))
+        if LOG.turns:
+            LOG.write(f"--- TURN END :: {player.name} ---\n")
         return logs
 
+    def log_landing(self, player: Player):
+        tile = self.board.tiles[player.position]
+        LOG.write(f"{player.name} landed on tile #{tile.number} ({tile.type}).")
+
     def handle_tile_landing(self, player: Player, tile: Block):
-        if isinstance(tile, Street):
-            self.handle_street_landing(player, tile)
-        elif isinstance(tile, RailRoad):
-            self.handle_railroad_landing(player, tile)
-        elif isinstance(tile, Utility):
-            self.handle_utility_landing(player, tile)
-        elif isinstance(tile, Chance):
-            self.handle_chance_landing(player, tile)
-        elif isinstance(tile, CommunityChest):
-            self.handle_community_chest_landing(player, tile)
-        elif isinstance(tile, Tax):
-            self.handle_tax_landing(player, tile)
-        elif isinstance(tile, Block) and tile.type == "go_to_jail":
-            player.go_to_jail()
+        self.landing_handlers[player.position](player, tile)
+
+    def handle_idle_landing(self, player: Player, tile: Block):
+        pass
+
+    def handle_go_to_jail_landing(self, player: Player, tile: Block):
+        if LOG.jail:
+            LOG.write(f"{player.name} must go to jail from tile {tile.number}.")
+        player.go_to_jail()
 
     def handle_street_landing(self, player: Player, street: Street):
         if street.owner is None:
+            if LOG.landings:
+                LOG.write(f"{player.name} can buy {street.name} if desired.")
             # Player can buy the property if they have enough money
             if player.decide_to_buy_property(street):
                 player.buy_property(street)
         elif street.owner != player and street.owner.is_in_game:
             # Player pays rent if the property is owned
             rent = street.calculate_rent(player)
+            if LOG.landings and rent > 0:
+                LOG.write(
+                    f"{player.name} pays rent {rent} to {street.owner.name}"
+                    f" for {street.name}."
+                )
             player.pay(rent, street.owner)
 
     def handle_railroad_landing(self, player: Player, railroad: RailRoad):
         if railroad.owner is None:
+            if LOG.landings:
+                LOG.write(f"{player.name} can buy Railroad {railroad.name} if desired.")
             # Player can buy the railroad if they have enough money
             if player.decide_to_buy_property(railroad):
                 player.buy_property(railroad)
         elif railroad.owner != player and railroad.owner.is_in_game:
             # Player pays rent to the railroad owner
             rent = railroad.calculate_rent(player)
+            if LOG.landings and rent > 0:
+                LOG.write(
+                    f"{player.name} pays rent {rent} to {railroad.owner.name}"
+                    f" for {railroad.name}."
+                )
             player.pay(rent, railroad.owner)
 
     def handle_utility_landing(self, player: Player, utility: Utility):
         if utility.owner is None:
+            if LOG.landings:
+                LOG.write(f"{player.name} can buy Utility {utility.name} if desired.")
             # Player can buy the utility if they have enough money
             if player.decide_to_buy_property(utility):
                 player.buy_property(utility)
@@ -1026,126 +1611,146 @@ class Game:
                 player.last_dice_roll
             )  # Assuming dice roll is stored on the player
             rent = utility.calculate_rent(dice_roll, player)
+            if LOG.landings and rent > 0:
+                LOG.write(
+                    f"{player.name} pays {rent} to {utility.owner.name} (Utility rent)."
+                )
             player.pay(rent, utility.owner)
 
     def handle_chance_landing(self, player: Player, chance: Chance):
-        card = Chance.get_chance_card()
+        card = self.chance_deck.draw()
+        if LOG.cards:
+            LOG.write(f"Chance Card Drawn: {card.value}")
         # Handle the effect of the chance card
         self.resolve_card_effect(player, card)
 
     def handle_community_chest_landing(
         self, player: Player, community_chest: CommunityChest
     ):
-        card = CommunityChest.get_community_chest_card()
+        card = self.community_chest_deck.draw()
+        if LOG.cards:
+            LOG.write(f"Community Chest Card Drawn: {card.value}")
         # Handle the effect of the community chest card
         self.resolve_card_effect(player, card)
 
     def handle_tax_landing(self, player: Player, tax: Tax):
         # Player pays the tax amount
+        if LOG.landings:
+            LOG.write(f"{player.name} landed on tax {tax.name}, cost {tax.amount}.")
         player.pay(tax.amount, self.bank)
 
-    def resolve_card_effect(self, player: Player, card: Enum):
-        if (
-            card == ChanceCards.ADVANCE_TO_GO
-            or card == CommunityChestCards.ADVANCE_TO_GO
-        ):
-            player.advance_to_go()
-        elif card == ChanceCards.BANK_DIVIDEND:
-            player.earn(amount=50)
-        elif card == ChanceCards.GO_TO_JAIL or card == CommunityChestCards.GO_TO_JAIL:
-            player.go_to_jail()
-        elif card == ChanceCards.ADVANCE_TO_ILLINOIS:
-            player.advance_to_illinois()
-        elif card == ChanceCards.ADVANCE_TO_ST_CHARLES:
-            player.advance_to_st_charles()
-        elif card == ChanceCards.NEAREST_UTILITY:
-            player.advance_to_nearest_utility()
-            utility: Utility = self.board.tiles[player.get_position()]
-
-            def handle_advance_to_utility():
-                if utility.owner is None:
-                    if player.decide_to_buy_property(utility):
-                        player.buy_property(utility)
-                elif utility.owner != player and utility.owner.is_in_game:
-                    # Player pays rent based on dice roll
-                    d1, d2 = self.roll_dice()
-                    rent = (d1 + d2) * 10
-                    player.pay(rent, utility.owner)
-
-            handle_advance_to_utility()
-        elif card == ChanceCards.NEAREST_RAILROAD:
-            player.advance_to_nearest_railroad()
-            railroad: RailRoad = self.board.tiles[player.get_position()]
-
-            def handle_advance_to_railroad():
-                if railroad.owner is None:
-                    if player.decide_to_buy_property(railroad):
-                        player.buy_property(railroad)
-                elif railroad.owner != player and railroad.owner.is_in_game:
-                    rent = railroad.calculate_rent(player)
-                    player.pay(rent * 2, railroad.owner)
-
-            handle_advance_to_railroad()
-        elif card == ChanceCards.READING_RAILROAD:
-            player.advance_to_reading_railroad()
-            railroad: RailRoad = self.board.tiles[player.get_position()]
-            self.handle_railroad_landing(player, railroad)
-        elif card == ChanceCards.BOARDWALK:
-            player.advance_to_boardwalk()
-            boardwalk: Street = self.board.tiles[player.get_position()]
-            self.handle_street_landing(player, boardwalk)
-        elif card == ChanceCards.CHAIRMAN:
-            for i in range(len(self.players)):
-                if i != self.current_player_index:
-                    player.pay(50, self.players[i])
-        elif card == ChanceCards.BUILDING_LOAN:
-            player.earn(150)
+    def handle_nearest_railroad_landing(self, player: Player, railroad: RailRoad):
+        if railroad.owner is None:
+            if player.decide_to_buy_property(railroad):
+                player.buy_property(railroad)
+        elif railroad.owner != player and railroad.owner.is_in_game:
+            # Owner is paid twice the rental they are otherwise entitled to
+            rent = railroad.calculate_rent(player)
+            if LOG.landings:
+                LOG.write(f"{player.name} must pay 2x RR rent => {rent * 2}.")
+            player.pay(rent * 2, railroad.owner)
+
+    def handle_nearest_utility_landing(self, player: Player, utility: Utility):
+        if utility.owner is None:
+            if player.decide_to_buy_property(utility):
+                player.buy_property(utility)
         elif (
-            card == ChanceCards.STREET_REPAIRS
-            or card == CommunityChestCards.STREET_REPAIRS
+            utility.owner != player
+            and utility.owner.is_in_game
+            and not utility.mortgaged
         ):
-            player.pay(player.determine_street_repair_fee(), self.bank)
-        elif card == ChanceCards.POOR_TAX:
-            player.pay(15, self.bank)
-        elif card == ChanceCards.GENERAL_REPAIRS:
-            player.pay(player.determine_general_repair_fee(), self.bank)
-        elif card == ChanceCards.GET_OUT_OF_JAIL_FREE:
+            # Throw the dice and pay the owner ten times the amount thrown
+            d1, d2 = self.roll_dice()
+            rent = (d1 + d2) * 10
+            if LOG.landings:
+                LOG.write(f"{player.name} must pay 10x dice to Utility => {rent}.")
+            player.pay(rent, utility.owner)
+
+    def resolve_card_effect(self, player: Player, card: Enum):
+        if LOG.cards:
+            LOG.write(f"Resolving card effect for {player.name}: {card.value}")
+        effect = CARD_EFFECTS[card]
+        self.card_handlers[effect.action](player, card, effect)
+
+    def apply_cash_card(self, player: Player, card: Enum, effect: CardEffect):
+        if effect.cash >= 0:
+            if LOG.cards:
+                LOG.write(f"{player.name} collects {effect.cash} ({card.name}).")
+            player.earn(effect.cash)
+        else:
+            if LOG.cards:
+                LOG.write(f"{player.name} pays {-effect.cash} ({card.name}).")
+            player.pay(-effect.cash, self.bank)
+
+    def apply_move_to_card(self, player: Player, card: Enum, effect: CardEffect):
+        player.advance_to(effect.move_to)
+        position = player.position
+        if LOG.landings:
+            self.log_landing(player)
+        self.landing_handlers[position](player, self.board.tiles[position])
+
+    def apply_move_to_nearest_card(
+        self, player: Player, card: Enum, effect: CardEffect
+    ):
+        player.advance_to(self.board.nearest_tiles[effect.nearest][player.position])
+        position = player.position
+        self.nearest_landing_handlers[effect.nearest](
+            player, self.board.tiles[position]
+        )
+
+    def apply_move_back_card(self, player: Player, card: Enum, effect: CardEffect):
+        player.go_back(effect.move_back, len(self.board.tiles))
+        position = player.position
+        if LOG.landings:
+            self.log_landing(player)
+        self.landing_handlers[position](player, self.board.tiles[position])
+
+    def apply_go_to_jail_card(self, player: Player, card: Enum, effect: CardEffect):
+        player.go_to_jail()
+
+    def apply_pay_each_player_card(
+        self, player: Player, card: Enum, effect: CardEffect
+    ):
+        for other in self.players:
+            if other is player or not other.is_in_game:
+                continue
+            if effect.pay_each_player > 0:
+                if LOG.cards:
+                    LOG.write(
+                        f"{player.name} pays {effect.pay_each_player}"
+                        f" to {other.name} ({card.name})."
+                    )
+                player.pay(effect.pay_each_player, other)
+            else:
+                if LOG.cards:
+                    LOG.write(
+                        f"{other.name} pays {-effect.pay_each_player}"
+                        f" to {player.name} ({card.name})."
+                    )
+                other.pay(-effect.pay_each_player, player)
+
+    def apply_repairs_card(self, player: Player, card: Enum, effect: CardEffect):
+        per_house, per_hotel = effect.repair_rates
+        player.pay(player.determine_repair_fee(per_house, per_hotel), self.bank)
+
+    def apply_keep_card(self, player: Player, card: Enum, effect: CardEffect):
+        if isinstance(card, ChanceCards):
+            if LOG.cards:
+                LOG.write(f"{player.name} receives GET OUT OF JAIL FREE (Chance).")
             player.chance_jail_free_card = True
-        elif card == ChanceCards.GO_BACK_THREE:
-            player.go_back_three(len(self.board.tiles))
-        elif CommunityChestCards.BANK_ERROR:
-            player.earn(200)
-        elif CommunityChestCards.DOCTOR_FEE:
-            player.pay(50, self.bank)
-        elif CommunityChestCards.STOCK_SALE:
-            player.earn(50)
-        elif CommunityChestCards.GO_TO_JAIL:
-            player.go_to_jail()
-        elif CommunityChestCards.GET_OUT_OF_JAIL_FREE:
+        else:
+            if LOG.cards:
+                LOG.write(f"{player.name} receives GET OUT OF JAIL FREE (CommChest).")
             player.community_chest_jail_free_card = True
-        elif CommunityChestCards.HOLIDAY_FUND:
-            player.earn(100)
-        elif CommunityChestCards.INCOME_TAX_REFUND:
-            player.earn(20)
-        elif CommunityChestCards.BIRTHDAY:
-            for i in range(len(self.players)):
-                if i != self.current_player_index:
-                    other_player = self.players[i]
-                    other_player.pay(10, player)
-        elif CommunityChestCards.LIFE_INSURANCE:
-            player.earn(100)
-        elif CommunityChestCards.SCHOOL_FEES:
-            player.pay(50, self.bank)
-        elif CommunityChestCards.CONSULTANCY_FEE:
-            player.earn(25)
-        elif CommunityChestCards.BEAUTY_CONTEST:
-            player.earn(10)
-        elif CommunityChestCards.INHERITANCE:
-            player.earn(100)
 
     def attempt_jail_break(
         self, player: Player
     ) -> Tuple[bool, Optional[int], Optional[int]]:
+        if LOG.jail:
+            LOG.write(
+                f"{player.name} attempts jail break."
+                f" So far tried {player.jail_roll_attempts} times."
+            )
         # Check if the player has a "Get Out of Jail Free" card
         if player.has_jail_free_card():
             use_card = player.decide_to_use_jail_free_card()
@@ -1153,6 +1758,8 @@ class Game:
                 player.use_jail_free_card()
                 player.reset_jail_roll_attempts()
                 d1, d2 = self.roll_dice()
+                if LOG.jail:
+                    LOG.write(f"{player.name} used a Jail Free card.")
                 return (False, d1, d2)
 
         # Check if the player has attempted rolling a double less than 3 times
@@ -1161,102 +1768,301 @@ class Game:
             if roll_doubles:
                 d1, d2 = self.roll_dice()
                 if d1 == d2:  # Player rolled a double
+                    if LOG.jail:
+                        LOG.write(f"{player.name} rolled doubles & is free from jail.")
                     player.reset_jail_roll_attempts()  # Reset attempts
                     return (False, d1, d2)
                 else:  # Double not rolled, increment attempts
                     player.jail_roll_attempts += 1
+                    if LOG.jail:
+                        LOG.write(
+                            f"{player.name} did NOT roll doubles,"
+                            f" attempt={player.jail_roll_attempts}."
+                        )
                     return (True, None, None)
 
         # If all attempts to roll a double fail, the player pays $50
+        if LOG.jail:
+            LOG.write(f"{player.name} paying 50 to get out of jail.")
         player.pay(50, to=self.bank)
         if player.is_in_game:
             player.reset_jail_roll_attempts()
             d1, d2 = self.roll_dice()
             return (False, d1, d2)
         else:
+            if LOG.jail:
+                LOG.write(f"{player.name} is bankrupt trying to leave jail.")
             return (True, -1, -1)
 
-    def simulate_game(self):
+    def reset(self, seed=None, index: int = 0):
+        """
+        Put the game back to its opening position in place and reseed it as
+        GameRNG(seed, index), so one Game can play many runs without
+        rebuilding the board, the players or the decks.
+        """
+        if seed is None:
+            seed = random.getrandbits(64)
+        if LOG.setup:
+            LOG.write(f"Resetting Game for seed={seed}, index={index}.")
+        self.rng.reseed(seed, index)
+        self.chance_deck.reset(self.rng)
+        self.community_chest_deck.reset(self.rng)
+        self.board.reset()
+        for player in self.players:
+            player.reset()
+        self.current_player_index = 0
+        self.turn_count = 0
+
+    def simulate_game(self, max_turns: Optional[int] = None) -> Optional[Player]:
+        """
+        Play until one player is left, until the game is a stalemate (won by
+        the richest player if adjudicate_stalemates is set, None otherwise),
+        until the evaluator calls it, or return None after max_turns turns
+        (default self.max_turns). self.outcome tells which it was.
+        """
+        max_turns = self.max_turns if max_turns is None else max_turns
+        if LOG.turns:
+            LOG.write(f"Starting simulate_game() with {max_turns:,} turn cutoff.")
         winner = None
-        while not winner:
+        self.window_state = None
+        checked = self.stalemate_window or self.evaluator
+        next_check = CHECK_INTERVAL if checked else max_turns
+        while not winner and self.turn_count < max_turns:
             self.play_turn()
+            self.turn_count += 1
             winner = self.check_win_condition()
+            if self.turn_count == next_check and not winner:
+                next_check += CHECK_INTERVAL
+                if self.stalemate_window and self.is_stalemate():
+                    self.outcome = Outcome.STALEMATE
+                    if self.adjudicate_stalemates:
+                        winner = self.adjudicate()
+                    break
+                if self.evaluator:
+                    winner = self.evaluator.resigns_to(self)
+                    if winner:
+                        self.outcome = Outcome.RESIGNATION
+                        break
+        else:
+            self.outcome = Outcome.BANKRUPTCY if winner else Outcome.TURN_CAP
+        if LOG.turns:
+            if winner:
+                LOG.write(
+                    f"WINNER after {self.turn_count} turns: {winner.name}"
+                    f" ({self.outcome.value})."
+                )
+            elif self.outcome == Outcome.STALEMATE:
+                LOG.write(f"Stalemate after {self.turn_count} turns, no winner.")
+            else:
+                LOG.write(f"No winner after {max_turns} turns => stopping.")
         return winner
 
 
+# The players every simulation seats unless it is given its own roster; each
+# entry holds Player keyword arguments
+DEFAULT_ROSTER: Tuple[Dict[str, Union[str, float, int]], ...] = (
+    dict(
+        name="Player 1",
+        w_buy_building=0.8,
+        w_buy_railroad=0.7,
+        w_buy_utility=0.6,
+        w_roll_double_in_jail=0.5,
+        w_use_jail_free_card=0.5,
+        min_cash=200,
+        min_cash_to_unmortgage=300,
+    ),
+    dict(
+        name="Player 2",
+        w_buy_building=0.6,
+        w_buy_railroad=0.8,
+        w_buy_utility=0.7,
+        w_roll_double_in_jail=0.4,
+        w_use_jail_free_card=0.6,
+        min_cash=200,
+        min_cash_to_unmortgage=300,
+    ),
+    dict(
+        name="Player 3",
+        w_buy_building=0.7,
+        w_buy_railroad=0.6,
+        w_buy_utility=0.8,
+        w_roll_double_in_jail=0.6,
+        w_use_jail_free_card=0.7,
+        min_cash=200,
+        min_cash_to_unmortgage=300,
+    ),
+    dict(
+        name="Player 4",
+        w_buy_building=0.5,
+        w_buy_railroad=0.5,
+        w_buy_utility=0.5,
+        w_roll_double_in_jail=0.5,
+        w_use_jail_free_card=0.5,
+        min_cash=200,
+        min_cash_to_unmortgage=300,
+    ),
+)
+
+
+# Games per chunk when a serial run reports progress
+PROGRESS_CHUNK_SIZE = 50
+
+
 class MonteCarloSimulation:
-    def __init__(self, runs: int):
+    def __init__(
+        self,
+        runs: int,
+        game_class=Game,
+        seed=None,
+        roster=None,
+        game_options: Optional[Dict] = None,
+    ):
         """
         Initialize the simulation with the number of runs.
+        game_class can be swapped for another engine with the same interface,
+        e.g. sim_array.ArrayGame.
+        Game i is played with GameRNG(seed, i); without a seed one is drawn
+        from the global random stream.
+        roster is a sequence of Player keyword-argument dicts and defaults to
+        DEFAULT_ROSTER.
+        game_options are passed on to game_class, e.g. max_turns or
+        stalemate_window.
         """
         self.runs = runs
+        self.game_class = game_class
+        self.seed = seed if seed is not None else random.getrandbits(64)
+        self.roster = roster if roster is not None else DEFAULT_ROSTER
+        self.game_options = game_options or {}
+
+    def create_players(self) -> List[Player]:
+        """Create one player per roster entry."""
+        return [Player(**spec) for spec in self.roster]
+
+    def create_game(self, players: Optional[List[Player]] = None):
+        """A game of the roster's players, or of `players`, ready to reset."""
+        return self.game_class(
+            *(players or self.create_players()),
+            rng=GameRNG(self.seed),
+            **self.game_options,
+        )
+
+    def cell_options(self) -> Dict:
+        """
+        Settings other than the seed, roster and classes that change the
+        games played; sim_cache hashes them into the cell key. Subclasses
+        with settings of their own add them here.
+        """
+        return dict(self.game_options)
 
-    def run(self):
+    def run(self, workers: int = 1, progress: Optional[ProgressReporter] = None):
         """
         Run the Monte Carlo simulation.
+        With workers > 1 the game indices are split into chunks that are
+        played in a process pool and merged in index order. Game i always
+        uses GameRNG(seed, i), so the result does not depend on the number
+        of workers.
+        progress, e.g. sim_progress.TTYProgress(), is fed every finished chunk.
         Returns:
             dict: A dictionary mapping player names to the number of wins.
+            Games nobody won (turn cap, or a stalemate that is not
+            adjudicated) count under "no_winner"; play_all().outcomes splits
+            the games by sim.Outcome.
         """
-        win_count = {}
-
-        for _ in range(self.runs):
-            # Create players with differing strategies
-            players = [
-                Player(
-                    name="Player 1",
-                    w_buy_building=0.8,
-                    w_buy_railroad=0.7,
-                    w_buy_utility=0.6,
-                    w_roll_double_in_jail=0.5,
-                    w_use_jail_free_card=0.5,
-                    min_cash=200,
-                    min_cash_to_unmortgage=300,
-                ),
-                Player(
-                    name="Player 2",
-                    w_buy_building=0.6,
-                    w_buy_railroad=0.8,
-                    w_buy_utility=0.7,
-                    w_roll_double_in_jail=0.4,
-                    w_use_jail_free_card=0.6,
-                    min_cash=200,
-                    min_cash_to_unmortgage=300,
-                ),
-                Player(
-                    name="Player 3",
-                    w_buy_building=0.7,
-                    w_buy_railroad=0.6,
-                    w_buy_utility=0.8,
-                    w_roll_double_in_jail=0.6,
-                    w_use_jail_free_card=0.7,
-                    min_cash=200,
-                    min_cash_to_unmortgage=300,
-                ),
-                Player(
-                    name="Player 4",
-                    w_buy_building=0.5,
-                    w_buy_railroad=0.5,
-                    w_buy_utility=0.5,
-                    w_roll_double_in_jail=0.5,
-                    w_use_jail_free_card=0.5,
-                    min_cash=200,
-                    min_cash_to_unmortgage=300,
-                ),
-            ]
+        return self.play_all(workers, progress).win_count
+
+    def play_all(self, workers: int = 1, progress: Optional[ProgressReporter] = None):
+        """Games 0..runs-1 as the stats object of new_stats()."""
+        reporter = progress or SilentProgress()
+        reporter.start(self.runs)
+        with self.executor(workers) as executor:
+            stats = self.play_games(0, self.runs, executor, workers, progress)
+        reporter.finish()
+        return stats
+
+    def run_until(
+        self,
+        epsilon: float,
+        max_games: int,
+        workers: int = 1,
+        block_size: int = 200,
+        progress: Optional[ProgressReporter] = None,
+    ) -> WinStats:
+        """
+        Play blocks of block_size games until every player's win-rate
+        interval has a half-width below epsilon, or max_games games have been
+        played. Convergence is only checked between blocks, so the stopping
+        point is the same for any number of workers.
+        """
+        names = [player.name for player in self.create_players()]
+        stats = self.new_stats()
+        reporter = progress or SilentProgress()
+        reporter.start(max_games)
+        with self.executor(workers) as executor:
+            while stats.games < max_games and not stats.converged(epsilon, names):
+                stop = min(stats.games + block_size, max_games)
+                stats.merge(
+                    self.play_games(stats.games, stop, executor, workers, progress)
+                )
+        reporter.finish()
+        return stats
 
-            # Initialize the Game with all four players
-            game = Game(*players)
+    @staticmethod
+    def executor(workers: int):
+        if workers <= 1:
+            return nullcontext()
+        return ProcessPoolExecutor(max_workers=workers)
+
+    def new_stats(self) -> WinStats:
+        """The empty aggregate that run_chunk fills; subclasses may change it."""
+        return WinStats()
+
+    def play_games(
+        self,
+        start: int,
+        stop: int,
+        executor,
+        workers: int,
+        progress: Optional[ProgressReporter] = None,
+    ) -> WinStats:
+        if executor is None and not progress:
+            return self.run_chunk(start, stop)
+
+        if executor is None:
+            # Short chunks so a serial run still reports as it goes
+            chunk_size = PROGRESS_CHUNK_SIZE
+            play = map
+        else:
+            # Several chunks per worker so long games do not leave cores idle
+            chunk_size = max(1, -(-(stop - start) // (workers * 8)))
+            play = executor.map
+        starts = range(start, stop, chunk_size)
+        stops = [min(chunk_start + chunk_size, stop) for chunk_start in starts]
+        stats = self.new_stats()
+        for chunk in play(self.run_chunk, starts, stops):
+            stats.merge(chunk)
+            if progress:
+                progress.add(chunk)
+        return stats
+
+    def run_chunk(self, start: int, stop: int) -> WinStats:
+        """Play games start..stop-1 and return their statistics."""
+        stats = self.new_stats()
+
+        # Initialize the Game with all four players once, then reset it in
+        # place for every run
+        game = self.create_game()
+
+        for index in range(start, stop):
+            game.reset(self.seed, index)
 
             # Simulate the game and retrieve the winner
             winner = game.simulate_game()
-            print("Game is done!")
 
             # Tally the wins
-            if winner.name not in win_count:
-                win_count[winner.name] = 0
-            win_count[winner.name] += 1
+            name = winner.name if winner else "no_winner"
+            stats.add(name, game.turn_count, game.outcome.value)
 
-        return win_count
+        return stats
 
 
 def tile_to_grid_position(tile_index: int) -> Tuple[int, int]:
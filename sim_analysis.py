@@ -0,0 +1,132 @@
+"""Control-variate estimates of win rates.
+
+Part of the spread in who wins a single game is luck: the dice one player
+rolled, the properties they happened to land on while those were still for
+sale, and the rent that changed hands. CovariateGame measures that luck as
+covariates with a known expectation of zero, and ControlVariateSimulation
+subtracts the part of each win rate they explain (see
+sim_stats.ControlVariateStats).
+
+The covariates come from the one-roll landing probabilities: a roll of total
+t from square s lands on s + t with probability DICE_SUM_PROBABILITIES[t].
+For each of a seat's first `window` rolls it records, per seat:
+
+    dice      total - 7
+    buy       price of the square landed on if it is unowned, minus the same
+              averaged over the 11 possible totals
+    paid      rent owed on the square landed on, minus its average
+    received  rent owed to this seat by the roller, minus its average
+
+Each term depends only on the roll and on the position and ownership before
+it, so its mean is zero whatever the state of the game. The landing used is
+the one the dice alone give, before jail and cards redirect the player. The
+opening rolls decide who gets which property, so luck early in the game
+predicts the winner far better than luck summed over thousands of turns.
+"""
+
+from typing import Dict, List, Optional, Tuple
+
+from sim import Game, MonteCarloSimulation, Player, Property, Utility
+from sim_progress import ProgressReporter
+from sim_stats import ControlVariateStats
+
+# Probability of each dice total, indexed by the total
+DICE_SUM_PROBABILITIES = [0.0, 0.0] + [
+    (6 - abs(7 - total)) / 36 for total in range(2, 13)
+]
+DICE_TOTALS = [
+    (total, probability)
+    for total, probability in enumerate(DICE_SUM_PROBABILITIES)
+    if probability
+]
+
+COVARIATE_NAMES = ("dice", "buy", "paid", "received")
+
+
+class CovariateGame(Game):
+    def __init__(self, *players, rng=None, window: int = 60, **options):
+        super().__init__(*players, rng=rng, **options)
+        self.window = window
+        self.seats = {player: seat for seat, player in enumerate(self.players)}
+        self.clear_covariates()
+
+    def clear_covariates(self):
+        self.rolls = [0] * len(self.players)
+        self.luck = {name: [0.0] * len(self.players) for name in COVARIATE_NAMES}
+
+    def reset(self, seed=None, index: int = 0):
+        super().reset(seed, index)
+        self.clear_covariates()
+
+    def covariates(self) -> List[float]:
+        return [value for name in COVARIATE_NAMES for value in self.luck[name]]
+
+    def landing(
+        self, player: Player, position: int, total: int
+    ) -> Tuple[int, int, Optional[Player]]:
+        """Price if for sale, rent owed, and the owner it is owed to."""
+        tile = self.board.tiles[position % len(self.board.tiles)]
+        if not isinstance(tile, Property):
+            return 0, 0, None
+        if tile.owner is None:
+            return tile.price, 0, None
+        if isinstance(tile, Utility):
+            return 0, tile.calculate_rent(total, player), tile.owner
+        return 0, tile.calculate_rent(player), tile.owner
+
+    def roll_dice(self):
+        d1, d2 = super().roll_dice()
+        seat = self.current_player_index
+        if self.rolls[seat] >= self.window:
+            return d1, d2
+        self.rolls[seat] += 1
+        player = self.players[seat]
+        luck = self.luck
+
+        price, rent, owner = self.landing(player, player.position + d1 + d2, d1 + d2)
+        luck["dice"][seat] += d1 + d2 - 7
+        luck["buy"][seat] += price
+        luck["paid"][seat] += rent
+        if owner is not None:
+            luck["received"][self.seats[owner]] += rent
+        for total, probability in DICE_TOTALS:
+            price, rent, owner = self.landing(player, player.position + total, total)
+            luck["buy"][seat] -= probability * price
+            luck["paid"][seat] -= probability * rent
+            if owner is not None:
+                luck["received"][self.seats[owner]] -= probability * rent
+        return d1, d2
+
+
+class ControlVariateSimulation(MonteCarloSimulation):
+    def __init__(
+        self, runs: int, seed=None, roster=None, game_options: Optional[Dict] = None
+    ):
+        super().__init__(
+            runs,
+            game_class=CovariateGame,
+            seed=seed,
+            roster=roster,
+            game_options=game_options,
+        )
+
+    def new_stats(self) -> ControlVariateStats:
+        names = [player["name"] for player in self.roster] + ["no_winner"]
+        return ControlVariateStats(
+            names, covariates=len(COVARIATE_NAMES) * len(self.roster)
+        )
+
+    def run(
+        self, workers: int = 1, progress: Optional[ProgressReporter] = None
+    ) -> ControlVariateStats:
+        return self.play_all(workers, progress)
+
+    def run_chunk(self, start: int, stop: int) -> ControlVariateStats:
+        stats = self.new_stats()
+        game = self.create_game()
+        for index in range(start, stop):
+            game.reset(self.seed, index)
+            winner = game.simulate_game()
+            name = winner.name if winner else "no_winner"
+            stats.add(name, game.turn_count, game.covariates())
+        return stats
@@ -0,0 +1,684 @@
+"""Struct-of-arrays game engine.
+
+ArrayGame plays the same rules as sim.Game and draws from its GameRNG in the
+same order, so for the same seed it produces the same winner after the same
+number of turns. Instead of 40 Block objects and dicts of lists on every
+Player, the state of a game lives in a handful of flat typed arrays indexed by
+tile and player id.
+"""
+
+import random
+from array import array
+from typing import Dict, List, Optional
+
+from sim import (
+    CARD_EFFECTS,
+    CHECK_INTERVAL,
+    MAX_TURNS,
+    STALEMATE_WINDOW,
+    Board,
+    CardActions,
+    CardEffect,
+    ChanceCards,
+    CommunityChestCards,
+    Deck,
+    GameRNG,
+    Outcome,
+    Player,
+    Street,
+    StreetGroups,
+    Tax,
+    TileKinds,
+)
+
+BANK = -1
+NO_OWNER = -1
+
+###############################################################################
+#                       STATIC BOARD TABLES (shared)                          #
+###############################################################################
+
+_BOARD = Board()
+BOARD_SIZE = len(_BOARD.tiles)
+GROUPS: List[StreetGroups] = list(StreetGroups)
+
+TILE_KINDS = array("b", _BOARD.tile_kinds)
+PRICE = array("l", [getattr(tile, "price", 0) for tile in _BOARD.tiles])
+MORTGAGE = array("l", [getattr(tile, "mortgage", 0) for tile in _BOARD.tiles])
+UNMORTGAGE = array("d", [getattr(tile, "unmortgage", 0) for tile in _BOARD.tiles])
+HOUSE_PRICE = array("l", [getattr(tile, "house_price", 0) for tile in _BOARD.tiles])
+TAX_AMOUNT = array(
+    "l", [tile.amount if isinstance(tile, Tax) else 0 for tile in _BOARD.tiles]
+)
+# Street group index per tile, -1 for anything that is not a street
+GROUP = array(
+    "b",
+    [
+        GROUPS.index(tile.group) if isinstance(tile, Street) else -1
+        for tile in _BOARD.tiles
+    ],
+)
+GROUP_COUNT = array("b", [Street.GROUP_COUNTS[group] for group in GROUPS])
+# Six rent slots per tile: street levels 0-5, or railroads owned 1-4
+RENT = array("l")
+for _tile in _BOARD.tiles:
+    _rent = list(getattr(_tile, "rent", []))
+    RENT.extend(_rent + [0] * (6 - len(_rent)))
+STREET_TILES = [i for i, kind in enumerate(TILE_KINDS) if kind == TileKinds.STREET]
+RAILROAD_TILES = [i for i, kind in enumerate(TILE_KINDS) if kind == TileKinds.RAILROAD]
+UTILITY_TILES = [i for i, kind in enumerate(TILE_KINDS) if kind == TileKinds.UTILITY]
+NEAREST_TILES = _BOARD.nearest_tiles
+
+
+class ArrayGame:
+    def __init__(
+        self,
+        p1,
+        p2,
+        p3=None,
+        p4=None,
+        rng: Optional[GameRNG] = None,
+        max_turns: int = MAX_TURNS,
+        stalemate_window: Optional[int] = STALEMATE_WINDOW,
+        max_cash_drift: int = 0,
+        adjudicate_stalemates: bool = False,
+    ):
+        self.max_turns = max_turns
+        self.stalemate_window = stalemate_window
+        self.max_cash_drift = max_cash_drift
+        self.adjudicate_stalemates = adjudicate_stalemates
+        self.outcome: Optional[Outcome] = None
+        self.players: List[Player] = [p for p in (p1, p2, p3, p4) if p]
+        n = len(self.players)
+
+        # Strategy weights, one slot per player
+        self.w_buy_building = array("d", [p.w_buy_building for p in self.players])
+        self.w_buy_railroad = array("d", [p.w_buy_railroad for p in self.players])
+        self.w_buy_utility = array("d", [p.w_buy_utility for p in self.players])
+        self.w_roll_double_in_jail = array(
+            "d", [p.w_roll_double_in_jail for p in self.players]
+        )
+        self.w_use_jail_free_card = array(
+            "d", [p.w_use_jail_free_card for p in self.players]
+        )
+        self.min_cash = array("d", [p.min_cash for p in self.players])
+        self.min_cash_to_unmortgage = array(
+            "d", [p.min_cash_to_unmortgage for p in self.players]
+        )
+
+        # Per-player state
+        self.cash = array("d", [1500] * n)
+        self.position = array("b", [0] * n)
+        self.is_in_game = array("b", [1] * n)
+        self.is_in_jail = array("b", [0] * n)
+        self.jail_roll_attempts = array("b", [0] * n)
+        self.consecutive_doubles = array("b", [0] * n)
+        self.last_dice_roll = array("b", [0] * n)
+        self.chance_jail_free_card = array("b", [0] * n)
+        self.community_chest_jail_free_card = array("b", [0] * n)
+        self.railroads_owned = array("b", [0] * n)
+        self.utilities_owned = array("b", [0] * n)
+        self.streets_owned = array("b", [0] * n)
+        self.streets_mortgaged = array("b", [0] * n)
+        self.group_owned = array("b", [0] * (n * len(GROUPS)))
+        self.complete_groups = array("b", [0] * n)
+        self.players_left = n
+
+        # Per-tile state. `acquired` orders each owner's holdings the way the
+        # object engine's per-player lists do.
+        self.owner = array("b", [NO_OWNER] * BOARD_SIZE)
+        self.level = array("b", [0] * BOARD_SIZE)
+        self.mortgaged = array("b", [0] * BOARD_SIZE)
+        self.acquired = array("l", [0] * BOARD_SIZE)
+        self.acquisitions = 0
+
+        self.current_player_index = 0
+        self.turn_count = 0
+        self.rng = rng or GameRNG(random.getrandbits(64))
+        self.chance_deck = Deck(list(ChanceCards), self.rng)
+        self.community_chest_deck = Deck(list(CommunityChestCards), self.rng)
+
+        handlers = {
+            TileKinds.IDLE: self.handle_idle_landing,
+            TileKinds.STREET: self.handle_property_landing,
+            TileKinds.RAILROAD: self.handle_property_landing,
+            TileKinds.UTILITY: self.handle_property_landing,
+            TileKinds.CHANCE: self.handle_chance_landing,
+            TileKinds.COMMUNITY_CHEST: self.handle_community_chest_landing,
+            TileKinds.TAX: self.handle_tax_landing,
+            TileKinds.GO_TO_JAIL: self.handle_go_to_jail_landing,
+        }
+        self.landing_handlers = [handlers[kind] for kind in TILE_KINDS]
+        self.nearest_landing_handlers = {
+            TileKinds.RAILROAD: self.handle_nearest_railroad_landing,
+            TileKinds.UTILITY: self.handle_nearest_utility_landing,
+        }
+        self.card_handlers = {
+            CardActions.CASH: self.apply_cash_card,
+            CardActions.MOVE_TO: self.apply_move_to_card,
+            CardActions.MOVE_TO_NEAREST: self.apply_move_to_nearest_card,
+            CardActions.MOVE_BACK: self.apply_move_back_card,
+            CardActions.GO_TO_JAIL: self.apply_go_to_jail_card,
+            CardActions.PAY_EACH_PLAYER: self.apply_pay_each_player_card,
+            CardActions.REPAIRS: self.apply_repairs_card,
+            CardActions.KEEP_CARD: self.apply_keep_card,
+        }
+
+    # ------------------------------------------------------------------ dice
+
+    def roll_dice(self):
+        return self.rng.roll_dice()
+
+    def next_player(self):
+        self.current_player_index = (self.current_player_index + 1) % len(self.players)
+
+    def check_win_condition(self) -> Optional[Player]:
+        if self.players_left == 1:
+            return self.players[self.is_in_game.index(1)]
+        return None
+
+    # ------------------------------------------------------------- holdings
+
+    def acquire(self, p: int, tile: int):
+        self.owner[tile] = p
+        self.acquisitions += 1
+        self.acquired[tile] = self.acquisitions
+        group = GROUP[tile]
+        if group >= 0:
+            self.streets_owned[p] += 1
+            self.streets_mortgaged[p] += self.mortgaged[tile]
+            self.group_owned[p * len(GROUPS) + group] += 1
+            if self.group_owned[p * len(GROUPS) + group] == GROUP_COUNT[group]:
+                self.complete_groups[p] += 1
+        elif TILE_KINDS[tile] == TileKinds.RAILROAD:
+            self.railroads_owned[p] += 1
+        else:
+            self.utilities_owned[p] += 1
+
+    def streets_by_group(self, p: int) -> Dict[int, List[int]]:
+        """The player's streets grouped by color, in acquisition order."""
+        owner = self.owner
+        streets = sorted(
+            (tile for tile in STREET_TILES if owner[tile] == p),
+            key=self.acquired.__getitem__,
+        )
+        groups: Dict[int, List[int]] = {}
+        for tile in streets:
+            groups.setdefault(GROUP[tile], []).append(tile)
+        return groups
+
+    def holdings(self, p: int, tiles: List[int]) -> List[int]:
+        owner = self.owner
+        return sorted(
+            (tile for tile in tiles if owner[tile] == p),
+            key=self.acquired.__getitem__,
+        )
+
+    # ---------------------------------------------------------------- money
+
+    def earn(self, p: int, amount):
+        if p != BANK:
+            self.cash[p] += amount
+
+    def pay(self, p: int, amount, to: int):
+        if self.cash[p] < amount:
+            self.raise_fund(p, amount)
+
+        if self.cash[p] < amount:
+            self.is_in_game[p] = 0
+            self.players_left -= 1
+            self.transfer_ownership_of_all_assets(p, to)
+            return
+        self.cash[p] -= amount
+        self.earn(to, amount)
+
+    def transfer_ownership_of_all_assets(self, p: int, to: int):
+        streets = [
+            tile for tiles in self.streets_by_group(p).values() for tile in tiles
+        ]
+        # The object engine pops railroads and utilities off the end of the list
+        railroads = self.holdings(p, RAILROAD_TILES)[::-1]
+        utilities = self.holdings(p, UTILITY_TILES)[::-1]
+        self.streets_owned[p] = 0
+        self.streets_mortgaged[p] = 0
+        self.complete_groups[p] = 0
+        self.railroads_owned[p] = 0
+        self.utilities_owned[p] = 0
+        for group in range(len(GROUPS)):
+            self.group_owned[p * len(GROUPS) + group] = 0
+
+        if to == BANK:
+            self.cash[p] = 0
+            for tile in streets + railroads + utilities:
+                self.owner[tile] = NO_OWNER
+            if self.community_chest_jail_free_card[p]:
+                self.community_chest_deck.put_jail_free_card_back()
+            if self.chance_jail_free_card[p]:
+                self.chance_deck.put_jail_free_card_back()
+            return
+
+        self.earn(to, self.cash[p])
+        self.cash[p] = 0
+        for tile in streets + railroads + utilities:
+            self.acquire(to, tile)
+        if self.community_chest_jail_free_card[p]:
+            self.community_chest_jail_free_card[to] = 1
+        if self.chance_jail_free_card[p]:
+            self.chance_jail_free_card[to] = 1
+
+    def raise_fund(self, p: int, amount):
+        groups = self.streets_by_group(p)
+        level = self.level
+
+        # 1. Sell houses, cheapest first
+        with_houses = [
+            tile
+            for group, tiles in groups.items()
+            if len(tiles) == GROUP_COUNT[group]
+            for tile in tiles
+            if level[tile] >= 2
+        ]
+        with_houses.sort(key=HOUSE_PRICE.__getitem__, reverse=True)
+        while self.cash[p] < amount and with_houses:
+            tile = with_houses[-1]
+            self.cash[p] += HOUSE_PRICE[tile] // 2
+            level[tile] -= 1
+            if level[tile] == 1:
+                with_houses.pop()
+        if self.cash[p] >= amount:
+            return
+
+        # 2. Mortgage, smallest holdings and cheapest mortgages first
+        frequency: Dict[int, List[int]] = {}
+        for tiles in groups.values():
+            frequency.setdefault(len(tiles), []).extend(tiles)
+        for tiles in (
+            self.holdings(p, RAILROAD_TILES),
+            self.holdings(p, UTILITY_TILES),
+        ):
+            if tiles:
+                frequency.setdefault(len(tiles), []).extend(tiles)
+        ordered = sorted(
+            frequency.items(),
+            key=lambda item: (item[0], min(MORTGAGE[tile] for tile in item[1])),
+        )
+        mortgaged = self.mortgaged
+        for _freq, tiles in ordered:
+            for tile in tiles:
+                if not mortgaged[tile]:
+                    self.cash[p] += MORTGAGE[tile]
+                    mortgaged[tile] = 1
+                    if GROUP[tile] >= 0:
+                        self.streets_mortgaged[p] += 1
+                if self.cash[p] >= amount:
+                    return
+
+    def unmortgage_properties(self, p: int):
+        mortgaged = self.mortgaged
+        groups = [
+            tiles
+            for tiles in self.streets_by_group(p).values()
+            if any(mortgaged[tile] for tile in tiles)
+        ]
+        groups.sort(key=len, reverse=True)
+        for tiles in groups:
+            for tile in tiles:
+                if (
+                    mortgaged[tile]
+                    and self.cash[p] - UNMORTGAGE[tile]
+                    >= self.min_cash_to_unmortgage[p]
+                ):
+                    self.cash[p] -= UNMORTGAGE[tile]
+                    mortgaged[tile] = 0
+                    self.streets_mortgaged[p] -= 1
+
+    def buy_houses_and_hotels(self, p: int):
+        level = self.level
+        mortgaged = self.mortgaged
+        completed_sets = {
+            group: tiles
+            for group, tiles in self.streets_by_group(p).items()
+            if len(tiles) == GROUP_COUNT[group]
+            and not all(level[tile] == 5 for tile in tiles)
+            and all(not mortgaged[tile] for tile in tiles)
+        }
+        groups = sorted(
+            completed_sets,
+            key=lambda group: (
+                sum(level[tile] for tile in completed_sets[group]),
+                min(HOUSE_PRICE[tile] for tile in completed_sets[group]),
+            ),
+        )
+
+        min_cash = self.min_cash[p]
+        while self.cash[p] > min_cash:
+            built = False
+            for group in groups:
+                tiles = completed_sets[group]
+                min_level = min(level[tile] for tile in tiles)
+                if min_level == 5:
+                    continue
+                for tile in [tile for tile in tiles if level[tile] == min_level]:
+                    if self.cash[p] - HOUSE_PRICE[tile] >= min_cash:
+                        level[tile] += 1
+                        self.cash[p] -= HOUSE_PRICE[tile]
+                        built = True
+                    else:
+                        break
+            if not built:
+                break
+
+    def determine_repair_fee(self, p: int, per_house: int, per_hotel: int) -> int:
+        total = 0
+        owner = self.owner
+        level = self.level
+        for tile in STREET_TILES:
+            if owner[tile] == p:
+                if level[tile] == 5:
+                    total += per_hotel
+                elif level[tile] >= 2:
+                    total += per_house * (level[tile] - 1)
+        return total
+
+    # ------------------------------------------------------------- property
+
+    def decide_to_buy_property(self, p: int, tile: int) -> bool:
+        if self.cash[p] - PRICE[tile] < self.min_cash[p]:
+            return False
+        kind = TILE_KINDS[tile]
+        if kind == TileKinds.STREET:
+            return self.rng.random() < self.w_buy_building[p]
+        elif kind == TileKinds.RAILROAD:
+            return self.rng.random() < self.w_buy_railroad[p]
+        return self.rng.random() < self.w_buy_utility[p]
+
+    def buy_property(self, p: int, tile: int):
+        if self.owner[tile] != NO_OWNER:
+            return
+        self.cash[p] -= PRICE[tile]
+        self.acquire(p, tile)
+        group = GROUP[tile]
+        # Mirrors sim.Player.buy_property, which only marks three-street sets
+        if group >= 0 and self.group_owned[p * len(GROUPS) + group] == 3:
+            for street in STREET_TILES:
+                if GROUP[street] == group:
+                    self.level[street] = 1
+
+    def calculate_rent(self, tile: int, p: int):
+        owner = self.owner[tile]
+        if owner == NO_OWNER or self.mortgaged[tile] or owner == p:
+            return 0
+        kind = TILE_KINDS[tile]
+        if kind == TileKinds.STREET:
+            return RENT[tile * 6 + self.level[tile]]
+        elif kind == TileKinds.RAILROAD:
+            return RENT[tile * 6 + self.railroads_owned[owner] - 1]
+        return self.last_dice_roll[p] * (10 if self.utilities_owned[owner] == 2 else 4)
+
+    # -------------------------------------------------------------- landing
+
+    def handle_idle_landing(self, p: int, tile: int):
+        pass
+
+    def handle_property_landing(self, p: int, tile: int):
+        owner = self.owner[tile]
+        if owner == NO_OWNER:
+            if self.decide_to_buy_property(p, tile):
+                self.buy_property(p, tile)
+        elif owner != p and self.is_in_game[owner]:
+            self.pay(p, self.calculate_rent(tile, p), owner)
+
+    def handle_chance_landing(self, p: int, tile: int):
+        self.resolve_card_effect(p, self.chance_deck.draw())
+
+    def handle_community_chest_landing(self, p: int, tile: int):
+        self.resolve_card_effect(p, self.community_chest_deck.draw())
+
+    def handle_tax_landing(self, p: int, tile: int):
+        self.pay(p, TAX_AMOUNT[tile], BANK)
+
+    def handle_go_to_jail_landing(self, p: int, tile: int):
+        self.go_to_jail(p)
+
+    def handle_nearest_railroad_landing(self, p: int, tile: int):
+        owner = self.owner[tile]
+        if owner == NO_OWNER:
+            if self.decide_to_buy_property(p, tile):
+                self.buy_property(p, tile)
+        elif owner != p and self.is_in_game[owner]:
+            self.pay(p, self.calculate_rent(tile, p) * 2, owner)
+
+    def handle_nearest_utility_landing(self, p: int, tile: int):
+        owner = self.owner[tile]
+        if owner == NO_OWNER:
+            if self.decide_to_buy_property(p, tile):
+                self.buy_property(p, tile)
+        elif owner != p and self.is_in_game[owner] and not self.mortgaged[tile]:
+            d1, d2 = self.roll_dice()
+            self.pay(p, (d1 + d2) * 10, owner)
+
+    def go_to_jail(self, p: int):
+        self.is_in_jail[p] = 1
+        self.position[p] = 10
+
+    # ---------------------------------------------------------------- cards
+
+    def resolve_card_effect(self, p: int, card):
+        effect = CARD_EFFECTS[card]
+        self.card_handlers[effect.action](p, card, effect)
+
+    def advance_to(self, p: int, position: int):
+        if position < self.position[p]:
+            self.cash[p] += 200
+        self.position[p] = position
+
+    def apply_cash_card(self, p: int, card, effect: CardEffect):
+        if effect.cash >= 0:
+            self.cash[p] += effect.cash
+        else:
+            self.pay(p, -effect.cash, BANK)
+
+    def apply_move_to_card(self, p: int, card, effect: CardEffect):
+        self.advance_to(p, effect.move_to)
+        position = self.position[p]
+        self.landing_handlers[position](p, position)
+
+    def apply_move_to_nearest_card(self, p: int, card, effect: CardEffect):
+        self.advance_to(p, NEAREST_TILES[effect.nearest][self.position[p]])
+        self.nearest_landing_handlers[effect.nearest](p, self.position[p])
+
+    def apply_move_back_card(self, p: int, card, effect: CardEffect):
+        position = (self.position[p] - effect.move_back + BOARD_SIZE) % BOARD_SIZE
+        self.position[p] = position
+        self.landing_handlers[position](p, position)
+
+    def apply_go_to_jail_card(self, p: int, card, effect: CardEffect):
+        self.go_to_jail(p)
+
+    def apply_pay_each_player_card(self, p: int, card, effect: CardEffect):
+        for other in range(len(self.players)):
+            if other == p or not self.is_in_game[other]:
+                continue
+            if effect.pay_each_player > 0:
+                self.pay(p, effect.pay_each_player, other)
+            else:
+                self.pay(other, -effect.pay_each_player, p)
+
+    def apply_repairs_card(self, p: int, card, effect: CardEffect):
+        per_house, per_hotel = effect.repair_rates
+        self.pay(p, self.determine_repair_fee(p, per_house, per_hotel), BANK)
+
+    def apply_keep_card(self, p: int, card, effect: CardEffect):
+        if isinstance(card, ChanceCards):
+            self.chance_jail_free_card[p] = 1
+        else:
+            self.community_chest_jail_free_card[p] = 1
+
+    # ----------------------------------------------------------------- turn
+
+    def attempt_jail_break(self, p: int):
+        if self.chance_jail_free_card[p] or self.community_chest_jail_free_card[p]:
+            if self.rng.random() < self.w_use_jail_free_card[p]:
+                if self.chance_jail_free_card[p]:
+                    self.chance_jail_free_card[p] = 0
+                    self.chance_deck.put_jail_free_card_back()
+                else:
+                    self.community_chest_jail_free_card[p] = 0
+                    self.community_chest_deck.put_jail_free_card_back()
+                self.jail_roll_attempts[p] = 0
+                d1, d2 = self.roll_dice()
+                return (False, d1, d2)
+
+        if self.jail_roll_attempts[p] < 3:
+            if self.rng.random() < self.w_roll_double_in_jail[p]:
+                d1, d2 = self.roll_dice()
+                if d1 == d2:
+                    self.jail_roll_attempts[p] = 0
+                    return (False, d1, d2)
+                self.jail_roll_attempts[p] += 1
+                return (True, None, None)
+
+        self.pay(p, 50, BANK)
+        if self.is_in_game[p]:
+            self.jail_roll_attempts[p] = 0
+            d1, d2 = self.roll_dice()
+            return (False, d1, d2)
+        return (True, -1, -1)
+
+    def play_turn(self):
+        p = self.current_player_index
+        if not self.is_in_game[p]:
+            self.next_player()
+            return
+
+        d1, d2 = self.roll_dice()
+        if self.is_in_jail[p]:
+            skip, d1, d2 = self.attempt_jail_break(p)
+            if skip:
+                self.next_player()
+                return
+            self.is_in_jail[p] = 0
+
+        steps = d1 + d2
+        self.last_dice_roll[p] = steps
+        position = self.position[p] + steps
+        if position >= BOARD_SIZE:
+            self.cash[p] += 200
+            position -= BOARD_SIZE
+        self.position[p] = position
+        self.landing_handlers[position](p, position)
+
+        if d1 == d2:
+            self.consecutive_doubles[p] += 1
+            if self.consecutive_doubles[p] == 3:
+                self.go_to_jail(p)
+                self.consecutive_doubles[p] = 0
+                self.next_player()
+        else:
+            self.consecutive_doubles[p] = 0
+            self.next_player()
+
+        if self.is_in_game[p]:
+            if self.streets_mortgaged[p]:
+                self.unmortgage_properties(p)
+            if self.complete_groups[p]:
+                self.buy_houses_and_hotels(p)
+
+    def reset(self, seed=None, index: int = 0):
+        """Clear every array in place and reseed as GameRNG(seed, index)."""
+        if seed is None:
+            seed = random.getrandbits(64)
+        self.rng.reseed(seed, index)
+        self.chance_deck.reset(self.rng)
+        self.community_chest_deck.reset(self.rng)
+        for values in (
+            self.position,
+            self.is_in_jail,
+            self.jail_roll_attempts,
+            self.consecutive_doubles,
+            self.last_dice_roll,
+            self.chance_jail_free_card,
+            self.community_chest_jail_free_card,
+            self.railroads_owned,
+            self.utilities_owned,
+            self.streets_owned,
+            self.streets_mortgaged,
+            self.group_owned,
+            self.complete_groups,
+            self.level,
+            self.mortgaged,
+            self.acquired,
+        ):
+            values[:] = array(values.typecode, [0]) * len(values)
+        n = len(self.players)
+        self.cash[:] = array("d", [1500]) * n
+        self.is_in_game[:] = array("b", [1]) * n
+        self.owner[:] = array("b", [NO_OWNER]) * BOARD_SIZE
+        self.players_left = n
+        self.acquisitions = 0
+        self.current_player_index = 0
+        self.turn_count = 0
+        for player in self.players:
+            player.reset()
+
+    def net_worth(self, p: int) -> float:
+        worth = self.cash[p]
+        for tile in range(BOARD_SIZE):
+            if self.owner[tile] == p:
+                worth += MORTGAGE[tile] if self.mortgaged[tile] else PRICE[tile]
+                if self.level[tile] > 1:
+                    worth += (self.level[tile] - 1) * HOUSE_PRICE[tile]
+        return worth
+
+    def adjudicate(self) -> Player:
+        active = [p for p in range(len(self.players)) if self.is_in_game[p]]
+        return self.players[max(active, key=self.net_worth)]
+
+    def is_stalemate(self) -> bool:
+        """Same test as sim.Game.is_stalemate, on the tile arrays."""
+        state = self.owner.tobytes() + self.mortgaged.tobytes() + self.level.tobytes()
+        cash = self.cash.tolist()
+        if state != self.window_state:
+            self.window_state, self.window_cash = state, cash
+            self.window_start = self.turn_count
+            return False
+        if self.turn_count - self.window_start < self.stalemate_window:
+            return False
+        if any(
+            self.is_in_game[p] and cash[p] < self.window_cash[p] - self.max_cash_drift
+            for p in range(len(self.players))
+        ):
+            self.window_cash = cash
+            self.window_start = self.turn_count
+            return False
+        return True
+
+    def simulate_game(self, max_turns: Optional[int] = None) -> Optional[Player]:
+        """Same stopping rules as sim.Game.simulate_game."""
+        max_turns = self.max_turns if max_turns is None else max_turns
+        winner = None
+        self.window_state = None
+        next_check = CHECK_INTERVAL if self.stalemate_window else max_turns
+        while not winner and self.turn_count < max_turns:
+            self.play_turn()
+            self.turn_count += 1
+            winner = self.check_win_condition()
+            if self.turn_count == next_check and not winner:
+                next_check += CHECK_INTERVAL
+                if self.is_stalemate():
+                    self.outcome = Outcome.STALEMATE
+                    if self.adjudicate_stalemates:
+                        winner = self.adjudicate()
+                    break
+        else:
+            self.outcome = Outcome.BANKRUPTCY if winner else Outcome.TURN_CAP
+        self.sync_players()
+        return winner
+
+    def sync_players(self):
+        """Copy the per-player arrays back onto the Player objects."""
+        for p, player in enumerate(self.players):
+            player.cash = self.cash[p]
+            player.position = self.position[p]
+            player.is_in_game = bool(self.is_in_game[p])
+            player.is_in_jail = bool(self.is_in_jail[p])
@@ -0,0 +1,766 @@
+"""Lockstep batch engine.
+
+BatchSimulation holds `lanes` independent games in NumPy arrays and advances
+every one of them by one turn per step. The common work of a turn is
+vectorized across lanes: dice, movement, passing GO, buying property, rent
+and tax payments, go-to-jail, jail and card effects. The rare branches
+(building, unmortgaging, raising funds and bankruptcy) fall back to
+ArrayGame's scalar rules, run on a lane view of the same arrays. When a game
+ends its lane is reset and picks up the next game, until every game of the
+chunk has been played.
+
+BatchSimulation is a MonteCarloSimulation, so run(), play_all() and
+run_until() play their games here: play_games() hands each range (a whole run,
+or one run_until block) to run_chunk() as a single lockstep pass, and progress
+is fed as games finish.
+The `workers` argument is ignored: the lanes are the parallelism, and they
+all live in one process.
+
+game_options are the sim.Game options (max_turns, stalemate_window,
+max_cash_drift, adjudicate_stalemates) with the same defaults, so games end by
+bankruptcy, stalemate or the turn cap under the same rules as sim.Game and are
+tallied with their sim.Outcome. Each lane runs ArrayGame's stalemate test
+every CHECK_INTERVAL turns of its game.
+
+The batch draws from NumPy generators of its own, so results match sim.Game
+statistically rather than seed for seed. Each lane shuffles its own decks.
+run_chunk(start, stop) reseeds them from (seed, start), so a range of games
+always plays out the same, in any order and however often it is played.
+"""
+
+from contextlib import nullcontext
+from enum import Enum
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from sim import (
+    CARD_EFFECTS,
+    CHECK_INTERVAL,
+    CardActions,
+    ChanceCards,
+    CommunityChestCards,
+    GameRNG,
+    MonteCarloSimulation,
+    Outcome,
+    Player,
+    ProgressReporter,
+    TileKinds,
+)
+from sim_array import (
+    BANK,
+    BOARD_SIZE,
+    GROUP,
+    GROUP_COUNT,
+    GROUPS,
+    HOUSE_PRICE,
+    NEAREST_TILES,
+    NO_OWNER,
+    PRICE,
+    RENT,
+    STREET_TILES,
+    TAX_AMOUNT,
+    TILE_KINDS,
+    UNMORTGAGE,
+    ArrayGame,
+)
+from sim_stats import WinStats
+
+# Static tables as NumPy arrays for fancy indexing
+KIND = np.array(TILE_KINDS, dtype=np.int64)
+PRICE_NP = np.array(PRICE, dtype=np.int64)
+TAX_NP = np.array(TAX_AMOUNT, dtype=np.int64)
+GROUP_NP = np.array(GROUP, dtype=np.int64)
+GROUP_COUNT_NP = np.array(GROUP_COUNT, dtype=np.int64)
+RENT_NP = np.array(RENT, dtype=np.int64).reshape(BOARD_SIZE, 6)
+NEAREST_NP = {int(kind): np.array(tiles) for kind, tiles in NEAREST_TILES.items()}
+# Plain ints: comparing arrays against IntEnum members is slow
+STREET = int(TileKinds.STREET)
+RAILROAD = int(TileKinds.RAILROAD)
+UTILITY = int(TileKinds.UTILITY)
+CHANCE = int(TileKinds.CHANCE)
+COMMUNITY_CHEST = int(TileKinds.COMMUNITY_CHEST)
+TAX = int(TileKinds.TAX)
+GO_TO_JAIL = int(TileKinds.GO_TO_JAIL)
+CASH = int(CardActions.CASH)
+MOVE_TO = int(CardActions.MOVE_TO)
+MOVE_TO_NEAREST = int(CardActions.MOVE_TO_NEAREST)
+MOVE_BACK = int(CardActions.MOVE_BACK)
+GO_TO_JAIL_CARD = int(CardActions.GO_TO_JAIL)
+PAY_EACH_PLAYER = int(CardActions.PAY_EACH_PLAYER)
+REPAIRS = int(CardActions.REPAIRS)
+KEEP_CARD = int(CardActions.KEEP_CARD)
+IS_PROPERTY = np.isin(KIND, [STREET, RAILROAD, UTILITY])
+# Street tiles per group, two-street groups padded with their first street
+GROUP_TILES = np.array(
+    [
+        (tiles + tiles)[:3]
+        for tiles in (
+            [tile for tile in STREET_TILES if GROUP[tile] == group]
+            for group in range(len(GROUPS))
+        )
+    ]
+)
+GROUP_HOUSE_PRICE = np.array([HOUSE_PRICE[tiles[0]] for tiles in GROUP_TILES])
+# Cheapest unmortgage; below it a player cannot unmortgage anything
+MIN_UNMORTGAGE = min(UNMORTGAGE[tile] for tile in STREET_TILES)
+
+# Per-player arrays, shape (lanes, players)
+PLAYER_ARRAYS = [
+    "position",
+    "is_in_game",
+    "is_in_jail",
+    "jail_roll_attempts",
+    "consecutive_doubles",
+    "last_dice_roll",
+    "chance_jail_free_card",
+    "community_chest_jail_free_card",
+    "railroads_owned",
+    "utilities_owned",
+    "streets_owned",
+    "streets_mortgaged",
+    "complete_groups",
+]
+# Per-tile arrays, shape (lanes, tiles)
+TILE_ARRAYS = ["owner", "level", "mortgaged", "acquired"]
+# Per-lane counters that ArrayGame keeps as plain attributes
+LANE_COUNTERS = ["current_player_index", "players_left", "acquisitions"]
+
+
+class BatchDeck:
+    """One sim.Deck per lane: a shuffled order of the cards and the index of
+    the next draw, with the Get Out of Jail Free card skipped while held.
+    """
+
+    def __init__(self, cards: List[Enum], lanes: int, rng: np.random.Generator):
+        self.cards = cards
+        self.rng = rng
+        self.jail_free = next(
+            i for i, card in enumerate(cards) if CARD_EFFECTS[card].keep_card
+        )
+        self.order = np.empty((lanes, len(cards)), dtype=np.int64)
+        self.top = np.zeros(lanes, dtype=np.int64)
+        self.card_out = np.zeros(lanes, dtype=bool)
+
+        effects = [CARD_EFFECTS[card] for card in cards]
+        self.action = np.array([e.action for e in effects], dtype=np.int64)
+        self.cash = np.array([e.cash for e in effects], dtype=np.int64)
+        self.move_to = np.array(
+            [-1 if e.move_to is None else e.move_to for e in effects], dtype=np.int64
+        )
+        self.nearest = np.array([e.nearest or 0 for e in effects], dtype=np.int64)
+        self.move_back = np.array([e.move_back for e in effects], dtype=np.int64)
+        self.pay_each_player = np.array(
+            [e.pay_each_player for e in effects], dtype=np.int64
+        )
+        self.per_house = np.array([e.repair_rates[0] for e in effects], dtype=np.int64)
+        self.per_hotel = np.array([e.repair_rates[1] for e in effects], dtype=np.int64)
+
+    def shuffle(self, lanes: np.ndarray):
+        self.order[lanes] = self.rng.permuted(
+            np.broadcast_to(np.arange(len(self.cards)), (len(lanes), len(self.cards))),
+            axis=1,
+        )
+        self.top[lanes] = 0
+        self.card_out[lanes] = False
+
+    def draw_many(self, lanes: np.ndarray) -> np.ndarray:
+        """Draw one card in each of the given (distinct) lanes."""
+        n = len(self.cards)
+        top = self.top[lanes]
+        held = (self.order[lanes, top] == self.jail_free) & self.card_out[lanes]
+        top = np.where(held, (top + 1) % n, top)
+        cards = self.order[lanes, top]
+        self.top[lanes] = (top + 1) % n
+        self.card_out[lanes] |= cards == self.jail_free
+        return cards
+
+    def draw(self, lane: int) -> Enum:
+        return self.cards[self.draw_many(np.array([lane]))[0]]
+
+    def put_jail_free_card_back(self, lane: int):
+        self.card_out[lane] = False
+
+
+class LaneDeck:
+    """The sim.Deck interface over one lane of a BatchDeck."""
+
+    def __init__(self, deck: BatchDeck, lane: int):
+        self.deck = deck
+        self.lane = lane
+
+    def draw(self) -> Enum:
+        return self.deck.draw(self.lane)
+
+    def put_jail_free_card_back(self):
+        self.deck.put_jail_free_card_back(self.lane)
+
+
+def lane_counter(name: str):
+    def get(self):
+        return int(getattr(self.batch, name)[self.lane])
+
+    def set(self, value):
+        getattr(self.batch, name)[self.lane] = value
+
+    return property(get, set)
+
+
+class LaneGame(ArrayGame):
+    """ArrayGame whose state is one lane of a BatchSimulation."""
+
+    current_player_index = lane_counter("current_player_index")
+    players_left = lane_counter("players_left")
+    acquisitions = lane_counter("acquisitions")
+    turn_count = lane_counter("turn_count")
+
+    def __init__(self, batch: "BatchSimulation", lane: int, players: List[Player]):
+        self.batch = batch
+        self.lane = lane
+        super().__init__(*players, **batch.game_options)
+        self.rng = batch.scalar_rng
+        self.cash = batch.cash[lane]
+        self.group_owned = batch.group_owned[lane]
+        for name in PLAYER_ARRAYS + TILE_ARRAYS:
+            setattr(self, name, getattr(batch, name)[lane])
+        self.chance_deck = LaneDeck(batch.chance, lane)
+        self.community_chest_deck = LaneDeck(batch.community_chest, lane)
+
+
+class BatchSimulation(MonteCarloSimulation):
+    def __init__(
+        self,
+        runs: int,
+        lanes: int = 1024,
+        seed: Optional[int] = None,
+        max_turns: Optional[int] = None,
+        roster=None,
+        game_options: Optional[Dict] = None,
+    ):
+        """
+        Play `runs` games, `lanes` of them at a time.
+        Every game uses the players from create_players().
+        max_turns, if given, is short for game_options["max_turns"].
+        """
+        game_options = dict(game_options or {})
+        if max_turns is not None:
+            game_options["max_turns"] = max_turns
+        super().__init__(runs, seed=seed, roster=roster, game_options=game_options)
+        self.lanes = min(lanes, runs)
+        # As asked for: a chunk plays min(max_lanes, its size) games at a time,
+        # which decides how the random draws are spread over the games
+        self.max_lanes = lanes
+        # Both streams are reseeded by every run_chunk
+        self.rng = np.random.default_rng(self.seed)
+        self.scalar_rng = GameRNG(self.seed)
+
+        self.players = self.create_players()
+        n = len(self.players)
+        # Buy weights indexed by [tile kind, player]
+        self.w_buy = np.zeros((len(TileKinds), n))
+        self.w_buy[STREET] = [p.w_buy_building for p in self.players]
+        self.w_buy[RAILROAD] = [p.w_buy_railroad for p in self.players]
+        self.w_buy[UTILITY] = [p.w_buy_utility for p in self.players]
+        self.w_use_jail_free_card = np.array(
+            [p.w_use_jail_free_card for p in self.players]
+        )
+        self.w_roll_double_in_jail = np.array(
+            [p.w_roll_double_in_jail for p in self.players]
+        )
+        self.min_cash = np.array([p.min_cash for p in self.players])
+        self.min_cash_to_unmortgage = np.array(
+            [p.min_cash_to_unmortgage for p in self.players]
+        )
+
+        k = self.lanes
+        self.cash = np.zeros((k, n))
+        for name in PLAYER_ARRAYS:
+            setattr(self, name, np.zeros((k, n), dtype=np.int64))
+        self.group_owned = np.zeros((k, n * len(GROUPS)), dtype=np.int64)
+        for name in TILE_ARRAYS:
+            setattr(self, name, np.zeros((k, BOARD_SIZE), dtype=np.int64))
+        for name in LANE_COUNTERS:
+            setattr(self, name, np.zeros(k, dtype=np.int64))
+        self.turn_count = np.zeros(k, dtype=np.int64)
+        # Index of the game each lane is playing, -1 once the lane is retired
+        self.game_index = np.full(k, -1, dtype=np.int64)
+
+        self.chance = BatchDeck(list(ChanceCards), k, self.rng)
+        self.community_chest = BatchDeck(list(CommunityChestCards), k, self.rng)
+        self.games = [LaneGame(self, lane, self.players) for lane in range(k)]
+        # The stopping rules, as the lane games read them from game_options
+        self.max_turns = self.games[0].max_turns
+        self.stalemate_window = self.games[0].stalemate_window
+        self.adjudicate_stalemates = self.games[0].adjudicate_stalemates
+        self.stalled = np.zeros(k, dtype=bool)
+        self.games_started = 0
+        self.games_stop = 0
+        self.progress = None
+
+    # -------------------------------------------------------------- lanes
+
+    def start_games(self, lanes: np.ndarray):
+        """Reset the given lanes and give each the next game, if any remain."""
+        remaining = self.games_stop - self.games_started
+        retired = lanes[remaining:]
+        lanes = lanes[:remaining]
+        self.game_index[retired] = -1
+        if not len(lanes):
+            return
+
+        self.game_index[lanes] = np.arange(len(lanes)) + self.games_started
+        self.games_started += len(lanes)
+        self.cash[lanes] = 1500
+        for name in PLAYER_ARRAYS:
+            getattr(self, name)[lanes] = 0
+        self.is_in_game[lanes] = 1
+        self.group_owned[lanes] = 0
+        for name in TILE_ARRAYS:
+            getattr(self, name)[lanes] = 0
+        self.owner[lanes] = NO_OWNER
+        for name in LANE_COUNTERS:
+            getattr(self, name)[lanes] = 0
+        self.players_left[lanes] = len(self.players)
+        self.turn_count[lanes] = 0
+        self.stalled[lanes] = False
+        for lane in lanes:
+            self.games[lane].window_state = None
+        self.chance.shuffle(lanes)
+        self.community_chest.shuffle(lanes)
+
+    def next_player(self, lanes: np.ndarray, p: np.ndarray):
+        self.current_player_index[lanes] = (p + 1) % len(self.players)
+
+    def pay(self, lanes: np.ndarray, p: np.ndarray, amount, to):
+        """Pay amount from p to `to` (players or BANK) in each lane.
+
+        Lanes that cannot cover the amount in cash go through ArrayGame.pay
+        so they raise funds or go bankrupt.
+        """
+        if not len(lanes):
+            return
+        short = self.cash[lanes, p] < amount
+        if short.any():
+            amount = np.broadcast_to(amount, lanes.shape)
+            to = np.broadcast_to(to, lanes.shape)
+            for lane, player, owed, payee in zip(
+                lanes[short], p[short], amount[short], to[short]
+            ):
+                self.games[lane].pay(int(player), owed, int(payee))
+            ok = ~short
+            lanes, p, amount, to = lanes[ok], p[ok], amount[ok], to[ok]
+
+        self.cash[lanes, p] -= amount
+        if np.ndim(to):
+            amount = np.broadcast_to(amount, lanes.shape)
+            to_player = to != BANK
+            self.cash[lanes[to_player], to[to_player]] += amount[to_player]
+        elif to != BANK:
+            self.cash[lanes, to] += amount
+
+    # ---------------------------------------------------------------- turn
+
+    def step(self):
+        """Advance every active lane by one turn."""
+        active = np.flatnonzero(self.game_index >= 0)
+        p = self.current_player_index[active]
+        self.turn_count[active] += 1
+
+        # Players that are out just pass the turn on
+        playing = self.is_in_game[active, p] == 1
+        self.next_player(active[~playing], p[~playing])
+        lanes, p = active[playing], p[playing]
+
+        d1 = self.rng.integers(1, 7, len(lanes))
+        d2 = self.rng.integers(1, 7, len(lanes))
+        jailed = self.is_in_jail[lanes, p] == 1
+        if jailed.any():
+            moving = self.attempt_jail_break(lanes, p, d1, d2, jailed)
+            lanes, p, d1, d2 = lanes[moving], p[moving], d1[moving], d2[moving]
+
+        # Move
+        steps = d1 + d2
+        self.last_dice_roll[lanes, p] = steps
+        position = self.position[lanes, p] + steps
+        passed_go = position >= BOARD_SIZE
+        self.cash[lanes[passed_go], p[passed_go]] += 200
+        self.position[lanes, p] = position % BOARD_SIZE
+        self.resolve_landings(lanes, p, np.zeros(len(lanes), dtype=np.int64))
+
+        # Doubles
+        double = d1 == d2
+        doubles = np.where(double, self.consecutive_doubles[lanes, p] + 1, 0)
+        third = doubles == 3
+        self.go_to_jail(lanes[third], p[third])
+        doubles[third] = 0
+        self.consecutive_doubles[lanes, p] = doubles
+        done = ~double | third
+        self.next_player(lanes[done], p[done])
+
+        # Post move actions, only where they can possibly do something
+        cash = self.cash[lanes, p]
+        can_unmortgage = (self.streets_mortgaged[lanes, p] > 0) & (
+            cash - self.min_cash_to_unmortgage[p] >= MIN_UNMORTGAGE
+        )
+        can_build = self.complete_groups[lanes, p] > 0
+        if can_build.any():
+            can_build[can_build] = self.can_build(
+                lanes[can_build],
+                p[can_build],
+                cash[can_build] - self.min_cash[p[can_build]],
+            )
+        post = (self.is_in_game[lanes, p] == 1) & (can_unmortgage | can_build)
+        for lane, player in zip(lanes[post], p[post]):
+            game = self.games[lane]
+            if game.streets_mortgaged[player]:
+                game.unmortgage_properties(int(player))
+            if game.complete_groups[player]:
+                game.buy_houses_and_hotels(int(player))
+
+        # Same order as Game.simulate_game: a win, then a stalemate on the
+        # check turns, then the turn cap
+        won = self.players_left[active] == 1
+        if self.stalemate_window:
+            check = ~won & (self.turn_count[active] % CHECK_INTERVAL == 0)
+            for lane in active[check]:
+                self.stalled[lane] = self.games[lane].is_stalemate()
+        finished = active[
+            won | self.stalled[active] | (self.turn_count[active] >= self.max_turns)
+        ]
+        if len(finished):
+            self.record_results(finished)
+            self.start_games(finished)
+
+    def can_build(self, lanes, p, budget) -> np.ndarray:
+        """Whether each player has a set they could put a house on."""
+        tiles = GROUP_TILES[None]
+        rows = lanes[:, None, None]
+        complete = (self.owner[rows, tiles] == p[:, None, None]).all(axis=2)
+        expandable = (self.level[rows, tiles] < 5).any(axis=2)
+        mortgaged = (self.mortgaged[rows, tiles] == 1).any(axis=2)
+        affordable = GROUP_HOUSE_PRICE <= budget[:, None]
+        return (complete & expandable & ~mortgaged & affordable).any(axis=1)
+
+    def attempt_jail_break(self, lanes, p, d1, d2, jailed) -> np.ndarray:
+        """Jail break for the jailed players among lanes.
+
+        Writes the dice each released player moves with into d1/d2 and
+        returns the mask of lanes whose player moves this turn.
+        """
+        lanes, p = lanes[jailed], p[jailed]
+        n = len(lanes)
+        chance_card = self.chance_jail_free_card[lanes, p] == 1
+        chest_card = self.community_chest_jail_free_card[lanes, p] == 1
+        use_card = (chance_card | chest_card) & (
+            self.rng.random(n) < self.w_use_jail_free_card[p]
+        )
+        use_chance = use_card & chance_card
+        self.chance_jail_free_card[lanes[use_chance], p[use_chance]] = 0
+        self.chance.card_out[lanes[use_chance]] = False
+        use_chest = use_card & ~chance_card
+        self.community_chest_jail_free_card[lanes[use_chest], p[use_chest]] = 0
+        self.community_chest.card_out[lanes[use_chest]] = False
+
+        tries = (
+            ~use_card
+            & (self.jail_roll_attempts[lanes, p] < 3)
+            & (self.rng.random(n) < self.w_roll_double_in_jail[p])
+        )
+        r1 = self.rng.integers(1, 7, n)
+        r2 = self.rng.integers(1, 7, n)
+        rolled_double = tries & (r1 == r2)
+        self.jail_roll_attempts[lanes[tries], p[tries]] += 1
+
+        # Out of attempts, or chose not to roll: pay the $50 fine
+        fine = ~use_card & ~tries
+        self.pay(lanes[fine], p[fine], 50, BANK)
+        paid = fine & (self.is_in_game[lanes, p] == 1)
+        released = use_card | rolled_double | paid
+        self.jail_roll_attempts[lanes[released], p[released]] = 0
+        self.is_in_jail[lanes[released], p[released]] = 0
+
+        stay = ~released
+        self.next_player(lanes[stay], p[stay])
+
+        # Anyone not released by a double moves with a fresh roll
+        d1[jailed] = np.where(rolled_double, r1, self.rng.integers(1, 7, n))
+        d2[jailed] = np.where(rolled_double, r2, self.rng.integers(1, 7, n))
+        moving = ~jailed
+        moving[jailed] = released
+        return moving
+
+    def go_to_jail(self, lanes: np.ndarray, p: np.ndarray):
+        self.is_in_jail[lanes, p] = 1
+        self.position[lanes, p] = 10
+
+    # ------------------------------------------------------------ landing
+
+    def resolve_landings(self, lanes, p, nearest):
+        """Resolve the tile each player stands on.
+
+        nearest holds RAILROAD/UTILITY for players sent there by an "advance
+        to nearest" card and 0 otherwise. Cards that move the player again
+        loop back around for another landing.
+        """
+        while len(lanes):
+            position = self.position[lanes, p]
+            kind = KIND[position]
+
+            to_jail = kind == GO_TO_JAIL
+            self.go_to_jail(lanes[to_jail], p[to_jail])
+
+            tax = kind == TAX
+            self.pay(lanes[tax], p[tax], TAX_NP[position[tax]], BANK)
+
+            prop = IS_PROPERTY[position]
+            self.land_on_property(lanes[prop], p[prop], position[prop], nearest[prop])
+
+            moved = np.zeros(len(lanes), dtype=bool)
+            new_nearest = np.zeros(len(lanes), dtype=np.int64)
+            for deck, deck_kind in (
+                (self.chance, CHANCE),
+                (self.community_chest, COMMUNITY_CHEST),
+            ):
+                drawn = kind == deck_kind
+                if drawn.any():
+                    moved[drawn], new_nearest[drawn] = self.apply_cards(
+                        deck, lanes[drawn], p[drawn]
+                    )
+
+            lanes, p, nearest = lanes[moved], p[moved], new_nearest[moved]
+
+    def land_on_property(self, lanes, p, position, nearest):
+        owner = self.owner[lanes, position]
+
+        # Unowned: only players who can afford it get a buy decision
+        unowned = owner == NO_OWNER
+        affordable = unowned & (
+            self.cash[lanes, p] - PRICE_NP[position] >= self.min_cash[p]
+        )
+        if affordable.any():
+            self.decide_to_buy(lanes[affordable], p[affordable], position[affordable])
+
+        owned = ~unowned & (owner != p)
+        owned[owned] = self.is_in_game[lanes[owned], owner[owned]] == 1
+        if not owned.any():
+            return
+        lanes, p, position, nearest, owner = (
+            lanes[owned],
+            p[owned],
+            position[owned],
+            nearest[owned],
+            owner[owned],
+        )
+        kind = KIND[position]
+
+        rent = np.zeros(len(lanes), dtype=np.int64)
+        street = kind == STREET
+        rent[street] = RENT_NP[
+            position[street], self.level[lanes[street], position[street]]
+        ]
+        railroad = kind == RAILROAD
+        rent[railroad] = RENT_NP[
+            position[railroad],
+            self.railroads_owned[lanes[railroad], owner[railroad]] - 1,
+        ]
+        utility = kind == UTILITY
+        rent[utility] = self.last_dice_roll[lanes[utility], p[utility]] * np.where(
+            self.utilities_owned[lanes[utility], owner[utility]] == 2, 10, 4
+        )
+
+        # Advance-to-nearest cards: double railroad rent, ten times a fresh roll
+        rent[nearest == RAILROAD] *= 2
+        nearest_utility = nearest == UTILITY
+        if nearest_utility.any():
+            rolls = nearest_utility.sum()
+            rent[nearest_utility] = 10 * (
+                self.rng.integers(1, 7, rolls) + self.rng.integers(1, 7, rolls)
+            )
+        mortgaged = self.mortgaged[lanes, position] == 1
+        rent[mortgaged] = 0
+        charged = ~(nearest_utility & mortgaged)
+
+        self.pay(lanes[charged], p[charged], rent[charged], owner[charged])
+
+    def decide_to_buy(self, lanes, p, position):
+        buy = self.rng.random(len(lanes)) < self.w_buy[KIND[position], p]
+        lanes, p, position = lanes[buy], p[buy], position[buy]
+
+        self.cash[lanes, p] -= PRICE_NP[position]
+        self.owner[lanes, position] = p
+        self.acquisitions[lanes] += 1
+        self.acquired[lanes, position] = self.acquisitions[lanes]
+        kind = KIND[position]
+        self.railroads_owned[lanes, p] += kind == RAILROAD
+        self.utilities_owned[lanes, p] += kind == UTILITY
+
+        street = kind == STREET
+        lanes, p, position = lanes[street], p[street], position[street]
+        group = GROUP_NP[position]
+        slot = p * len(GROUPS) + group
+        self.streets_owned[lanes, p] += 1
+        self.streets_mortgaged[lanes, p] += self.mortgaged[lanes, position]
+        self.group_owned[lanes, slot] += 1
+        owned = self.group_owned[lanes, slot]
+        self.complete_groups[lanes, p] += owned == GROUP_COUNT_NP[group]
+        # Same rule as sim.Player.buy_property: only three-street sets level up
+        third = owned == 3
+        self.level[lanes[third, None], GROUP_TILES[group[third]]] = 1
+
+    def apply_cards(self, deck: BatchDeck, lanes, p):
+        """Apply a freshly drawn card in each lane.
+
+        Returns (moved, nearest): which players were moved onto a new tile
+        that still has to be resolved, and the nearest-kind for those moves.
+        """
+        cards = deck.draw_many(lanes)
+        action = deck.action[cards]
+        moved = np.zeros(len(lanes), dtype=bool)
+        nearest = np.zeros(len(lanes), dtype=np.int64)
+
+        cash = action == CASH
+        earn = cash & (deck.cash[cards] >= 0)
+        self.cash[lanes[earn], p[earn]] += deck.cash[cards[earn]]
+        fee = cash & ~earn
+        self.pay(lanes[fee], p[fee], -deck.cash[cards[fee]], BANK)
+
+        move_to = action == MOVE_TO
+        if move_to.any():
+            target = deck.move_to[cards[move_to]]
+            self.advance_to(lanes[move_to], p[move_to], target)
+            moved |= move_to
+
+        to_nearest = action == MOVE_TO_NEAREST
+        if to_nearest.any():
+            kind = deck.nearest[cards[to_nearest]]
+            position = self.position[lanes[to_nearest], p[to_nearest]]
+            target = np.where(
+                kind == RAILROAD,
+                NEAREST_NP[RAILROAD][position],
+                NEAREST_NP[UTILITY][position],
+            )
+            self.advance_to(lanes[to_nearest], p[to_nearest], target)
+            moved |= to_nearest
+            nearest[to_nearest] = kind
+
+        back = action == MOVE_BACK
+        if back.any():
+            self.position[lanes[back], p[back]] = (
+                self.position[lanes[back], p[back]] - deck.move_back[cards[back]]
+            ) % BOARD_SIZE
+            moved |= back
+
+        to_jail = action == GO_TO_JAIL_CARD
+        self.go_to_jail(lanes[to_jail], p[to_jail])
+
+        keep = action == KEEP_CARD
+        if deck is self.chance:
+            self.chance_jail_free_card[lanes[keep], p[keep]] = 1
+        else:
+            self.community_chest_jail_free_card[lanes[keep], p[keep]] = 1
+
+        repairs = action == REPAIRS
+        if repairs.any():
+            self.apply_repairs(deck, lanes[repairs], p[repairs], cards[repairs])
+
+        each = action == PAY_EACH_PLAYER
+        if each.any():
+            self.apply_pay_each_player(deck, lanes[each], p[each], cards[each])
+
+        return moved, nearest
+
+    def apply_repairs(self, deck: BatchDeck, lanes, p, cards):
+        owned = self.owner[lanes] == p[:, None]
+        level = self.level[lanes]
+        hotels = (owned & (level == 5)).sum(axis=1)
+        houses = np.where(owned & (level >= 2) & (level < 5), level - 1, 0).sum(axis=1)
+        fee = houses * deck.per_house[cards] + hotels * deck.per_hotel[cards]
+        self.pay(lanes, p, fee, BANK)
+
+    def apply_pay_each_player(self, deck: BatchDeck, lanes, p, cards):
+        # Same order as Game.apply_pay_each_player_card: other seats in turn
+        amount = deck.pay_each_player[cards]
+        for other in range(len(self.players)):
+            payees = (p != other) & (self.is_in_game[lanes, other] == 1)
+            pays = payees & (amount > 0)
+            self.pay(lanes[pays], p[pays], amount[pays], other)
+            collects = payees & (amount < 0)
+            self.pay(
+                lanes[collects],
+                np.full(collects.sum(), other),
+                -amount[collects],
+                p[collects],
+            )
+
+    def advance_to(self, lanes, p, target):
+        passed_go = target < self.position[lanes, p]
+        self.cash[lanes[passed_go], p[passed_go]] += 200
+        self.position[lanes, p] = target
+
+    # ------------------------------------------------------------- results
+
+    def record_results(self, lanes: np.ndarray):
+        finished = self.new_stats()
+        for lane in lanes:
+            if self.players_left[lane] == 1:
+                name = self.players[int(np.argmax(self.is_in_game[lane]))].name
+                outcome = Outcome.BANKRUPTCY
+            elif self.stalled[lane]:
+                name = "no_winner"
+                if self.adjudicate_stalemates:
+                    name = self.games[lane].adjudicate().name
+                outcome = Outcome.STALEMATE
+            else:
+                name = "no_winner"
+                outcome = Outcome.TURN_CAP
+            finished.add(name, int(self.turn_count[lane]), outcome.value)
+        self.stats.merge(finished)
+        if self.progress:
+            self.progress.add(finished)
+
+    def cell_options(self) -> Dict:
+        options = super().cell_options()
+        options.update(max_turns=self.max_turns, lanes=self.max_lanes)
+        return options
+
+    @staticmethod
+    def executor(workers: int):
+        # The lanes already play in parallel within one process, so workers
+        # is accepted for the MonteCarloSimulation interface and ignored
+        return nullcontext()
+
+    def play_games(
+        self,
+        start: int,
+        stop: int,
+        executor,
+        workers: int,
+        progress: Optional[ProgressReporter] = None,
+    ) -> WinStats:
+        # One lockstep pass over the whole range: splitting it into chunks
+        # would leave lanes idle at the end of every chunk. Progress is fed
+        # the games of every step that finishes some
+        self.progress = progress
+        try:
+            return self.run_chunk(start, stop)
+        finally:
+            self.progress = None
+
+    def reseed(self, start: int) -> None:
+        """Restart the random streams for the range of games from `start`."""
+        self.rng = np.random.default_rng([self.seed, start])
+        self.chance.rng = self.rng
+        self.community_chest.rng = self.rng
+        # In place: every LaneGame holds this object
+        self.scalar_rng.reseed(self.seed, start)
+
+    def run_chunk(self, start: int, stop: int) -> WinStats:
+        """Play games start..stop-1 in lockstep and return their statistics."""
+        self.reseed(start)
+        self.stats = self.new_stats()
+        self.games_started = start
+        self.games_stop = stop
+        self.start_games(np.arange(self.lanes))
+        while (self.game_index >= 0).any():
+            self.step()
+        return self.stats
@@ -0,0 +1,367 @@
+"""Reproducible benchmarks of the simulation engines.
+
+Every case plays a fixed number of games of DEFAULT_ROSTER from a pinned
+seed, so two runs of the same code play exactly the same games; the
+`checksum` of winners and game lengths shows when a change altered the
+games themselves rather than only their speed. Each trial of each case runs
+in a freshly spawned interpreter, so peak RSS and warm caches belong to that
+case alone.
+
+    sim                 sim.Game with its default stopping rules
+    sim_full            sim.Game playing every game to bankruptcy or the cap
+    sim_array           sim_array.ArrayGame, same rules as sim_full
+    sim_log_off         sim_log.Game with every log category off
+    sim_log_on          sim_log.Game logging everything into a ring buffer
+    sim_gui             the sim_gui.Game engine, built anew for every game
+
+A trial reports games/s, turns/s, median and p99 wall time per game, peak
+RSS and the traced allocation peak of a game (alloc_peak_kb, measured after
+the timed games, and exact for the same code and seed). Microbenchmarks time
+the hot paths on their own and report calls/s:
+
+    play_turn               sim.Game.play_turn, reset every 1000 turns
+    buy_houses_and_hotels   building up two complete colour groups
+    raise_fund              selling those houses and mortgaging the streets
+    monte_carlo_run         MonteCarloSimulation.run, a call per 20 games
+
+Results are written as JSON; with --compare the median rate of each case is
+set against a stored result file, and sim_gate.py turns that into a
+pass/fail check:
+
+    python sim_bench.py --repeat 3 --out bench.json
+    python sim_bench.py --repeat 3 --compare bench.json
+"""
+
+import argparse
+import hashlib
+import json
+import multiprocessing
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from sim import (
+    DEFAULT_ROSTER,
+    MAX_TURNS,
+    GameRNG,
+    MonteCarloSimulation,
+    Street,
+    StreetGroups,
+)
+
+SEED = 20240601
+# Extra games played under tracemalloc after the timed ones
+MEMORY_GAMES = 3
+
+# Play one game by index; returns the winner's name (or None) and its turns
+PlayGame = Callable[[int], Tuple[Optional[str], int]]
+
+
+def sim_engine(seed, engine: str = "sim", **game_options) -> PlayGame:
+    from sim import Game, MonteCarloSimulation
+    from sim_array import ArrayGame
+
+    game_class = ArrayGame if engine == "sim_array" else Game
+    simulation = MonteCarloSimulation(
+        0, game_class=game_class, seed=seed, game_options=game_options
+    )
+    game = simulation.create_game()
+
+    def play(index: int) -> Tuple[Optional[str], int]:
+        game.reset(seed, index)
+        winner = game.simulate_game()
+        return (winner.name if winner else None), game.turn_count
+
+    return play
+
+
+def sim_log_engine(seed, logging: bool) -> PlayGame:
+    import sim_log
+
+    if logging:
+        # Each trial has a process of its own, so this is not undone
+        sim_log.enable_tracing(deque(maxlen=sim_log.LOG_TAIL_LINES).append)
+    players = [sim_log.Player(**spec) for spec in DEFAULT_ROSTER]
+    game = sim_log.Game(*players, rng=GameRNG(seed))
+
+    def play(index: int) -> Tuple[Optional[str], int]:
+        game.reset(seed, index)
+        winner = game.simulate_game()
+        return (winner.name if winner else None), game.turn_count
+
+    return play
+
+
+def sim_gui_engine(seed) -> PlayGame:
+    import sim_gui
+
+    def play(index: int) -> Tuple[Optional[str], int]:
+        players = [sim_gui.Player(**spec) for spec in DEFAULT_ROSTER]
+        game = sim_gui.Game(*players, rng=GameRNG(seed, index))
+        winner = None
+        turns = 0
+        while not winner and turns < MAX_TURNS:
+            game.play_turn()
+            turns += 1
+            winner = game.check_win_condition()
+        return (winner.name if winner else None), turns
+
+    return play
+
+
+# name -> (engine, engine keyword arguments, games per trial)
+CASES: Dict[str, Tuple[Callable[..., PlayGame], Dict, int]] = {
+    "sim": (sim_engine, {}, 200),
+    "sim_full": (sim_engine, {"stalemate_window": None}, 60),
+    "sim_array": (sim_engine, {"engine": "sim_array", "stalemate_window": None}, 60),
+    "sim_log_off": (sim_log_engine, {"logging": False}, 40),
+    "sim_log_on": (sim_log_engine, {"logging": True}, 20),
+    "sim_gui": (sim_gui_engine, {}, 30),
+}
+
+
+def developed_player(seed) -> Tuple:
+    """Player 1 of a fresh game owning the orange and red groups."""
+    game = MonteCarloSimulation(0, seed=seed).create_game()
+    game.reset(seed, 0)
+    player = game.players[0]
+    streets = [
+        tile
+        for tile in game.board.properties
+        if isinstance(tile, Street)
+        and tile.group in (StreetGroups.ORANGE, StreetGroups.RED)
+    ]
+    for street in streets:
+        player.buy_property(street)
+    return player, streets
+
+
+def bench_play_turn(seed, calls: int) -> float:
+    game = MonteCarloSimulation(0, seed=seed).create_game()
+    game.reset(seed, 0)
+    started = time.perf_counter()
+    for call in range(calls):
+        if call % 1000 == 999:
+            game.reset(seed, call)
+        game.play_turn()
+    return time.perf_counter() - started
+
+
+def bench_buy_houses(seed, calls: int) -> float:
+    player, streets = developed_player(seed)
+    started = time.perf_counter()
+    for _ in range(calls):
+        for street in streets:
+            street.level = 1
+        player.cash = 5000
+        player.buy_houses_and_hotels()
+    return time.perf_counter() - started
+
+
+def bench_raise_fund(seed, calls: int) -> float:
+    player, streets = developed_player(seed)
+    started = time.perf_counter()
+    for _ in range(calls):
+        for street in streets:
+            street.level = 4
+            street.mortgaged = False
+        player.cash = 0
+        player.raise_fund(amount=1200)
+    return time.perf_counter() - started
+
+
+def bench_monte_carlo_run(seed, calls: int) -> float:
+    started = time.perf_counter()
+    for call in range(calls):
+        MonteCarloSimulation(20, seed=f"{seed}/{call}").run()
+    return time.perf_counter() - started
+
+
+# name -> (benchmark, calls per trial); the benchmark returns seconds taken
+MICRO_CASES: Dict[str, Tuple[Callable[..., float], int]] = {
+    "play_turn": (bench_play_turn, 50000),
+    "buy_houses_and_hotels": (bench_buy_houses, 20000),
+    "raise_fund": (bench_raise_fund, 20000),
+    "monte_carlo_run": (bench_monte_carlo_run, 5),
+}
+
+
+ALL_CASES = [*CASES, *MICRO_CASES]
+
+
+def peak_rss_mb() -> Optional[float]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def run_micro_trial(case: str, calls: int, seed=SEED) -> Dict:
+    benchmark, _ = MICRO_CASES[case]
+    seconds = benchmark(seed, calls)
+    return {
+        "calls": calls,
+        "seconds": seconds,
+        "calls_per_second": calls / seconds,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def run_trial(case: str, games: int, seed=SEED) -> Dict:
+    """One trial of a case; meant to run in its own process."""
+    if case in MICRO_CASES:
+        return run_micro_trial(case, games, seed)
+    engine, options, _ = CASES[case]
+    play = engine(seed, **options)
+    checksum = hashlib.sha256()
+    times = []
+    turns = 0
+    started = time.perf_counter()
+    for index in range(games):
+        game_started = time.perf_counter()
+        winner, game_turns = play(index)
+        times.append(time.perf_counter() - game_started)
+        turns += game_turns
+        checksum.update(f"{index}:{winner}:{game_turns};".encode())
+    elapsed = time.perf_counter() - started
+    tracemalloc.start()
+    for index in range(games, games + MEMORY_GAMES):
+        play(index)
+    _, alloc_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "games": games,
+        "turns": turns,
+        "seconds": elapsed,
+        "games_per_second": games / elapsed,
+        "turns_per_second": turns / elapsed,
+        "median_game_ms": statistics.median(times) * 1000,
+        "p99_game_ms": percentile(times, 0.99) * 1000,
+        "peak_rss_mb": peak_rss_mb(),
+        "alloc_peak_kb": alloc_peak / 2**10,
+        "checksum": checksum.hexdigest()[:16],
+    }
+
+
+def machine() -> Dict:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "system": platform.system(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def run_suite(
+    cases: List[str],
+    repeat: int = 3,
+    scale: float = 1.0,
+    sizes: Optional[Dict[str, int]] = None,
+) -> Dict:
+    """`sizes` fixes the games (or calls) per trial of a case, ignoring scale."""
+    context = multiprocessing.get_context("spawn")
+    results = {"machine": machine(), "seed": SEED, "cases": {}}
+    for case in cases:
+        size = MICRO_CASES[case][1] if case in MICRO_CASES else CASES[case][2]
+        games = max(1, round(size * scale))
+        if sizes and case in sizes:
+            games = sizes[case]
+        trials = []
+        for _ in range(repeat):
+            # A fresh interpreter per trial so peak RSS is this trial's own
+            with ProcessPoolExecutor(1, mp_context=context) as executor:
+                trials.append(executor.submit(run_trial, case, games).result())
+        results["cases"][case] = {"games": games, "trials": trials}
+    return results
+
+
+def rate_metric(case: Dict) -> str:
+    """games_per_second for engine cases, calls_per_second for micro ones."""
+    if "games_per_second" in case["trials"][0]:
+        return "games_per_second"
+    return "calls_per_second"
+
+
+def median_of(case: Dict, metric: str) -> Optional[float]:
+    values = [trial[metric] for trial in case["trials"] if trial[metric] is not None]
+    return statistics.median(values) if values else None
+
+
+def summary_line(case: Dict) -> str:
+    peak = median_of(case, "peak_rss_mb")
+    peak = f"  peak {peak:6.1f} MB" if peak is not None else ""
+    if rate_metric(case) == "calls_per_second":
+        return f"{median_of(case, 'calls_per_second'):10,.0f} calls/s{peak}"
+    return (
+        f"{median_of(case, 'games_per_second'):8.1f} games/s"
+        f"  {median_of(case, 'turns_per_second'):10,.0f} turns/s"
+        f"  median {median_of(case, 'median_game_ms'):7.1f} ms"
+        f"  p99 {median_of(case, 'p99_game_ms'):7.1f} ms"
+        f"  alloc {median_of(case, 'alloc_peak_kb'):7.1f} KB{peak}"
+    )
+
+
+def compare(results: Dict, baseline: Dict, tolerance: float = 0.05) -> None:
+    """Print the median rate of every case against the baseline."""
+    for case, current in results["cases"].items():
+        if case not in baseline["cases"]:
+            print(f"{case:>21}: no baseline")
+            continue
+        before = baseline["cases"][case]
+        metric = rate_metric(current)
+        ratio = median_of(current, metric) / median_of(before, metric)
+        verdict = "no change"
+        if ratio > 1 + tolerance:
+            verdict = "faster"
+        elif ratio < 1 - tolerance:
+            verdict = "slower"
+        checksum = current["trials"][0].get("checksum")
+        same_games = checksum == before["trials"][0].get("checksum")
+        print(
+            f"{case:>21}: {ratio:.3f}x {metric.replace('_per_second', '')}/s, {verdict}"
+            + ("" if same_games else "  (different games: checksum changed)")
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the simulation engines.")
+    parser.add_argument(
+        "--cases", nargs="+", choices=ALL_CASES, default=list(ALL_CASES)
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="trials per case")
+    parser.add_argument("--scale", type=float, default=1.0, help="games multiplier")
+    parser.add_argument("--out", default="bench_results.json")
+    parser.add_argument("--compare", help="earlier result file to compare against")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.cases, args.repeat, args.scale)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    for case, result in results["cases"].items():
+        print(f"{case:>21}: {summary_line(result)}")
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            compare(results, json.load(f))
+
+
+if __name__ == "__main__":
+    main()
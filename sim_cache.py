@@ -0,0 +1,166 @@
+"""Content-addressed cache of simulation results.
+
+A cell is everything that decides the outcome of a run apart from which games
+are played: the roster, the seed, the simulation and engine classes (by module
+and name, since sim, sim_log and sim_gui all have a Game), the settings the
+simulation reports from cell_options() (the game options such as the turn cap
+and stalemate window, plus e.g. BatchSimulation's own turn cap and lanes) and
+the rules, i.e. the static contents of sim.Board and the card table. Its
+sha256 names a directory holding one file of aggregated WinStats per range of
+game indices:
+
+    <cache_dir>/<cell hash>/<start>-<stop>.json
+
+A request for games start..stop-1 is served from whatever stored ranges fit
+and only the gaps are simulated, so a cell that grows from 1,000 to 5,000
+games plays just the 4,000 new ones. Reads touch a file's mtime, and once the
+cache is over `max_bytes` the least recently used files are deleted.
+"""
+
+import hashlib
+import json
+import os
+from typing import Dict, List, Optional, Tuple
+
+from sim import CARD_EFFECTS, Board, MonteCarloSimulation
+from sim_stats import WinStats
+
+# Bump when a rule changes in code rather than in the board or card data
+RULES_VERSION = 2
+
+# Per-game tile state, left out of the board fingerprint
+DYNAMIC_TILE_FIELDS = {"owner", "level", "mortgaged"}
+
+
+def canonical_json(value) -> str:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def qualified_name(cls) -> str:
+    """module.QualName, so same-named classes of different engines differ."""
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def board_spec(board: Optional[Board] = None) -> List[Dict]:
+    """The static contents of every tile, in board order."""
+    board = board or Board()
+    spec = []
+    for tile in board.tiles:
+        fields = {"class": type(tile).__name__}
+        for cls in type(tile).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                if name not in DYNAMIC_TILE_FIELDS:
+                    fields[name] = getattr(tile, name)
+        spec.append(fields)
+    return spec
+
+
+def rules_fingerprint() -> str:
+    cards = {card.name: effect._asdict() for card, effect in CARD_EFFECTS.items()}
+    rules = {"version": RULES_VERSION, "board": board_spec(), "cards": cards}
+    return hashlib.sha256(canonical_json(rules).encode()).hexdigest()
+
+
+class ResultCache:
+    def __init__(self, cache_dir: str = "sim_cache", max_bytes: int = 256 * 2**20):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.rules = rules_fingerprint()
+
+    def cell_key(self, simulation: MonteCarloSimulation) -> str:
+        cell = {
+            "rules": self.rules,
+            "simulation": qualified_name(type(simulation)),
+            "game_class": qualified_name(simulation.game_class),
+            "seed": simulation.seed,
+            "roster": list(simulation.roster),
+            "options": simulation.cell_options(),
+        }
+        return hashlib.sha256(canonical_json(cell).encode()).hexdigest()
+
+    def stored_ranges(self, key: str) -> List[Tuple[int, int]]:
+        try:
+            names = os.listdir(os.path.join(self.cache_dir, key))
+        except FileNotFoundError:
+            return []
+        ranges = []
+        for name in names:
+            if name.endswith(".json"):
+                start, stop = name[: -len(".json")].split("-")
+                ranges.append((int(start), int(stop)))
+        return ranges
+
+    def plan(
+        self, key: str, start: int, stop: int
+    ) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
+        """
+        Cover start..stop-1 with stored ranges, longest first at each point.
+        Returns the stored ranges to load and the gaps left to simulate.
+        """
+        stored = sorted(
+            (r for r in self.stored_ranges(key) if start <= r[0] and r[1] <= stop),
+            key=lambda r: (r[0], -r[1]),
+        )
+        hits, gaps = [], []
+        position = start
+        for range_start, range_stop in stored:
+            if range_start < position:
+                continue
+            if range_start > position:
+                gaps.append((position, range_start))
+            hits.append((range_start, range_stop))
+            position = range_stop
+        if position < stop:
+            gaps.append((position, stop))
+        return hits, gaps
+
+    def path(self, key: str, start: int, stop: int) -> str:
+        return os.path.join(self.cache_dir, key, f"{start}-{stop}.json")
+
+    def load(self, key: str, start: int, stop: int) -> WinStats:
+        path = self.path(key, start, stop)
+        with open(path, encoding="utf-8") as f:
+            stats = WinStats.from_dict(json.load(f))
+        os.utime(path)
+        return stats
+
+    def store(self, key: str, start: int, stop: int, stats: WinStats) -> None:
+        path = self.path(key, start, stop)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write then rename so a reader never sees half a file
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(stats.to_dict(), f)
+        os.replace(path + ".tmp", path)
+
+    def evict(self) -> None:
+        entries = []
+        for root, _, names in os.walk(self.cache_dir):
+            for name in names:
+                path = os.path.join(root, name)
+                info = os.stat(path)
+                entries.append((info.st_mtime, info.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            os.remove(path)
+            total -= size
+            directory = os.path.dirname(path)
+            if not os.listdir(directory):
+                os.rmdir(directory)
+
+    def run(self, simulation: MonteCarloSimulation, chunk_size: int = 100) -> WinStats:
+        """Games 0..runs-1 of the simulation, playing only what is not stored."""
+        key = self.cell_key(simulation)
+        hits, gaps = self.plan(key, 0, simulation.runs)
+        pieces = {hit: self.load(key, *hit) for hit in hits}
+        for gap_start, gap_stop in gaps:
+            for start in range(gap_start, gap_stop, chunk_size):
+                stop = min(start + chunk_size, gap_stop)
+                pieces[start, stop] = simulation.run_chunk(start, stop)
+                self.store(key, start, stop, pieces[start, stop])
+        self.evict()
+        stats = WinStats()
+        for piece in sorted(pieces):
+            stats.merge(pieces[piece])
+        return stats
@@ -0,0 +1,99 @@
+"""Paired comparison of two rosters on common random numbers.
+
+PairedComparison plays every game index twice, once with roster A and once
+with roster B, from the same GameRNG(seed, index). Dice and cards come from
+their own streams, so both variants see the same rolls and the same deck
+order however differently they decide; only the decisions diverge. The
+difference in win rate is estimated per game, which cancels most of the dice
+luck that dominates two independent runs:
+
+    python sim_compare.py baseline.json variant.json --runs 2000 --workers 32
+"""
+
+import argparse
+import os
+from typing import Dict, List, Optional
+
+from sim import Game, MonteCarloSimulation, Player
+from sim_progress import PROGRESS_REPORTERS, ProgressReporter, make_progress
+from sim_stats import PairedStats
+from sim_sweep import load_roster
+
+
+class PairedComparison(MonteCarloSimulation):
+    def __init__(
+        self,
+        runs: int,
+        roster_a: List[Dict],
+        roster_b: List[Dict],
+        game_class=Game,
+        seed=None,
+        game_options: Optional[Dict] = None,
+    ):
+        super().__init__(
+            runs,
+            game_class=game_class,
+            seed=seed,
+            roster=roster_a,
+            game_options=game_options,
+        )
+        self.roster_b = roster_b
+        if [p["name"] for p in roster_a] != [p["name"] for p in roster_b]:
+            raise ValueError("Both rosters must seat the same player names")
+
+    def new_stats(self) -> PairedStats:
+        return PairedStats([p["name"] for p in self.roster] + ["no_winner"])
+
+    def run(
+        self, workers: int = 1, progress: Optional[ProgressReporter] = None
+    ) -> PairedStats:
+        return self.play_all(workers, progress)
+
+    def run_chunk(self, start: int, stop: int) -> PairedStats:
+        stats = self.new_stats()
+        game_a = self.create_game()
+        game_b = self.create_game([Player(**spec) for spec in self.roster_b])
+        for index in range(start, stop):
+            game_a.reset(self.seed, index)
+            winner_a = game_a.simulate_game()
+            game_b.reset(self.seed, index)
+            winner_b = game_b.simulate_game()
+            stats.add(
+                winner_a.name if winner_a else "no_winner",
+                game_a.turn_count,
+                winner_b.name if winner_b else "no_winner",
+                game_b.turn_count,
+            )
+        return stats
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Compare two rosters on paired games.")
+    parser.add_argument("roster_a", help="roster file, .json or .toml")
+    parser.add_argument("roster_b", help="roster file, .json or .toml")
+    parser.add_argument("--runs", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--progress", choices=PROGRESS_REPORTERS, default="tty")
+    args = parser.parse_args(argv)
+
+    comparison = PairedComparison(
+        args.runs,
+        load_roster(args.roster_a),
+        load_roster(args.roster_b),
+        seed=args.seed,
+    )
+    stats = comparison.run(workers=args.workers, progress=make_progress(args.progress))
+    print(f"{stats.games} paired games")
+    for name in stats.differences:
+        low, high = stats.interval(name)
+        print(
+            f"{name:>12}: A {stats.a.win_rate(name):.3f}  B {stats.b.win_rate(name):.3f}"
+            f"  A-B {stats.difference(name):+.3f} [{low:+.3f}, {high:+.3f}]"
+            f"  independent +/-{stats.independent_half_width(name):.3f}"
+            f"  variance ratio {stats.variance_ratio(name):.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,329 @@
+"""Early resignation of decided games.
+
+PositionEvaluator scores every player still in a sim.Game on three cheap
+features and turns the scores into win probabilities with a softmax:
+
+    worth    share of the net worth of all players still in the game
+    flow     expected rent received minus rent paid per lap, in $1000s
+    runway   laps the player's cash lasts against rent paid net of the $200
+             salary, capped at RUNWAY_CAP laps and scaled to 0..1
+
+Rent per lap comes from LANDINGS_PER_LAP, the long-run landings on each tile
+per trip round the board, from a Markov chain over the dice, Go To Jail and
+the movement cards (the doubled railroad and tenfold utility rent of the
+"nearest" cards is ignored). Passed to Game as `evaluator`, it is consulted
+every CHECK_INTERVAL turns and the others resign once the leader's
+probability reaches `threshold`.
+
+The feature weights are fitted to full playouts (a conditional logit on
+snapshots taken every CHECK_INTERVAL turns), and the fitted evaluator is then
+checked on fresh seeds played both in full and with resignation:
+
+    python sim_evaluate.py --calibrate 400 --test 200 --threshold 0.95
+"""
+
+import argparse
+import math
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from sim import (
+    CARD_EFFECTS,
+    Board,
+    CardActions,
+    ChanceCards,
+    CommunityChestCards,
+    MonteCarloSimulation,
+    Outcome,
+    Player,
+    TileKinds,
+    Utility,
+)
+from sim_stats import solve
+
+FEATURE_NAMES = ("worth", "flow", "runway")
+RUNWAY_CAP = 20
+JAIL = 10
+SALARY = 200
+# Positions before this turn are too open to call; with 200 the evaluator
+# overturned about 7% of games at the same threshold
+MIN_TURNS = 500
+
+# Fitted by `python sim_evaluate.py --calibrate 400 --seed 0` on DEFAULT_ROSTER;
+# runway adds nothing once worth and flow are known
+DEFAULT_WEIGHTS = (61.4, 27.2, 0.0)
+
+
+def landing_frequencies(board: Optional[Board] = None) -> List[float]:
+    """Expected landings on each tile per lap of the board."""
+    board = board or Board()
+    size = len(board.tiles)
+    decks = {
+        TileKinds.CHANCE: [CARD_EFFECTS[card] for card in ChanceCards],
+        TileKinds.COMMUNITY_CHEST: [CARD_EFFECTS[card] for card in CommunityChestCards],
+    }
+
+    def destinations(position: int) -> List[Tuple[int, float]]:
+        kind = board.tile_kinds[position]
+        if kind == TileKinds.GO_TO_JAIL:
+            return [(JAIL, 1.0)]
+        if kind not in decks:
+            return [(position, 1.0)]
+        cards = decks[kind]
+        moves = []
+        for effect in cards:
+            if effect.action == CardActions.MOVE_TO:
+                target = effect.move_to
+            elif effect.action == CardActions.MOVE_TO_NEAREST:
+                target = board.nearest_tiles[effect.nearest][position]
+            elif effect.action == CardActions.MOVE_BACK:
+                target = (position - effect.move_back) % size
+            elif effect.action == CardActions.GO_TO_JAIL:
+                target = JAIL
+            else:
+                target = position
+            moves.append((target, 1 / len(cards)))
+        return moves
+
+    rolls = [((d1 + d2), 1 / 36) for d1 in range(1, 7) for d2 in range(1, 7)]
+    transitions = [
+        [
+            (target, p_roll * p_card)
+            for total, p_roll in rolls
+            for target, p_card in destinations((position + total) % size)
+        ]
+        for position in range(size)
+    ]
+    distribution = [1 / size] * size
+    for _ in range(200):
+        step = [0.0] * size
+        for position, mass in enumerate(distribution):
+            for target, probability in transitions[position]:
+                step[target] += mass * probability
+        distribution = step
+    # A lap is `size` squares at 7 squares a roll
+    return [mass * size / 7 for mass in distribution]
+
+
+LANDINGS_PER_LAP = landing_frequencies()
+
+
+class PositionEvaluator:
+    def __init__(
+        self,
+        weights: Sequence[float] = DEFAULT_WEIGHTS,
+        threshold: float = 0.95,
+        min_turns: int = MIN_TURNS,
+    ):
+        self.weights = tuple(weights)
+        self.threshold = threshold
+        self.min_turns = min_turns
+
+    def __repr__(self):
+        # Stable, so a cache key that includes the evaluator is too
+        return (
+            f"PositionEvaluator(weights={self.weights}, "
+            f"threshold={self.threshold}, min_turns={self.min_turns})"
+        )
+
+    def features(self, game) -> Tuple[List[Player], List[List[float]]]:
+        """The players still in the game and each one's feature vector."""
+        active = [player for player in game.players if player.is_in_game]
+        rent_per_lap = {player: 0.0 for player in active}
+        for tile in game.board.properties:
+            if tile.owner in rent_per_lap:
+                if isinstance(tile, Utility):
+                    rent = tile.calculate_rent(7, None)
+                else:
+                    rent = tile.calculate_rent(None)
+                rent_per_lap[tile.owner] += LANDINGS_PER_LAP[tile.number - 1] * rent
+        total_rent = sum(rent_per_lap.values())
+        worth = [max(0.0, game.net_worth(player)) for player in active]
+        total_worth = sum(worth) or 1.0
+        opponents = len(active) - 1
+        vectors = []
+        for player, player_worth in zip(active, worth):
+            received = rent_per_lap[player] * opponents
+            paid = total_rent - rent_per_lap[player]
+            drain = paid - SALARY
+            runway = RUNWAY_CAP if drain <= 0 else min(RUNWAY_CAP, player.cash / drain)
+            vectors.append(
+                [
+                    player_worth / total_worth,
+                    (received - paid) / 1000,
+                    max(0.0, runway) / RUNWAY_CAP,
+                ]
+            )
+        return active, vectors
+
+    def probabilities(self, vectors: List[List[float]]) -> List[float]:
+        scores = [sum(w * f for w, f in zip(self.weights, v)) for v in vectors]
+        top = max(scores)
+        exps = [math.exp(score - top) for score in scores]
+        total = sum(exps)
+        return [e / total for e in exps]
+
+    def resigns_to(self, game) -> Optional[Player]:
+        if game.turn_count < self.min_turns:
+            return None
+        active, vectors = self.features(game)
+        probabilities = self.probabilities(vectors)
+        leader = max(range(len(active)), key=probabilities.__getitem__)
+        if probabilities[leader] >= self.threshold:
+            return active[leader]
+        return None
+
+
+class RecordingEvaluator(PositionEvaluator):
+    """Never resigns; keeps every position it is shown for calibration."""
+
+    def __init__(self, min_turns: int):
+        super().__init__(min_turns=min_turns)
+        self.snapshots: List[Tuple[List[Player], List[List[float]]]] = []
+
+    def resigns_to(self, game) -> Optional[Player]:
+        if game.turn_count >= self.min_turns:
+            self.snapshots.append(self.features(game))
+        return None
+
+
+def playout_snapshots(
+    runs: int, seed, min_turns: int = MIN_TURNS
+) -> List[Tuple[List[List[float]], int]]:
+    """
+    (feature vectors, index of the eventual winner) from full playouts, at
+    every check from turn min_turns on.
+    """
+    recorder = RecordingEvaluator(min_turns)
+    simulation = MonteCarloSimulation(runs, seed=seed)
+    game = simulation.create_game()
+    game.evaluator = recorder
+    samples = []
+    for index in range(runs):
+        game.reset(seed, index)
+        recorder.snapshots.clear()
+        winner = game.simulate_game()
+        if winner is None:
+            continue
+        for active, vectors in recorder.snapshots:
+            if len(active) > 1 and winner in active:
+                samples.append((vectors, active.index(winner)))
+    return samples
+
+
+def fit_weights(
+    samples: List[Tuple[List[List[float]], int]],
+    iterations: int = 25,
+    ridge: float = 1e-3,
+) -> Tuple[float, ...]:
+    """Conditional logit by Newton's method; the winner is the chosen option."""
+    k = len(FEATURE_NAMES)
+    weights = [0.0] * k
+    evaluator = PositionEvaluator(weights)
+    for _ in range(iterations):
+        gradient = [-ridge * w for w in weights]
+        hessian = [[ridge * (i == j) for j in range(k)] for i in range(k)]
+        for vectors, winner in samples:
+            probabilities = evaluator.probabilities(vectors)
+            mean = [
+                sum(p * v[i] for p, v in zip(probabilities, vectors)) for i in range(k)
+            ]
+            for i in range(k):
+                gradient[i] += vectors[winner][i] - mean[i]
+                for j in range(k):
+                    hessian[i][j] += (
+                        sum(p * v[i] * v[j] for p, v in zip(probabilities, vectors))
+                        - mean[i] * mean[j]
+                    )
+        step = solve(hessian, gradient)
+        weights = [w + s for w, s in zip(weights, step)]
+        evaluator.weights = tuple(weights)
+        if max(abs(s) for s in step) < 1e-6:
+            break
+    return tuple(weights)
+
+
+def reliability(
+    evaluator: PositionEvaluator,
+    samples: List[Tuple[List[List[float]], int]],
+    bins: Sequence[float] = (0.5, 0.7, 0.8, 0.9, 0.95, 0.99, 1.0),
+) -> List[Dict]:
+    """Leader's predicted probability against how often the leader won."""
+    rows = [
+        {"below": edge, "positions": 0, "predicted": 0.0, "won": 0} for edge in bins
+    ]
+    for vectors, winner in samples:
+        probabilities = evaluator.probabilities(vectors)
+        leader = max(range(len(vectors)), key=probabilities.__getitem__)
+        for row in rows:
+            if probabilities[leader] <= row["below"]:
+                row["positions"] += 1
+                row["predicted"] += probabilities[leader]
+                row["won"] += leader == winner
+                break
+    for row in rows:
+        if row["positions"]:
+            row["predicted"] /= row["positions"]
+            row["won"] /= row["positions"]
+    return rows
+
+
+def resignation_report(evaluator: PositionEvaluator, runs: int, seed) -> Dict:
+    """Play the same seeds in full and with resignation and compare."""
+    simulation = MonteCarloSimulation(runs, seed=seed)
+    full = simulation.create_game()
+    early = simulation.create_game()
+    early.evaluator = evaluator
+    report = {"games": runs, "resigned": 0, "changed": 0, "turns": 0, "saved": 0}
+    timings = {"full": 0.0, "early": 0.0}
+    winners = {}
+    for index in range(runs):
+        for name, game in (("full", full), ("early", early)):
+            game.reset(seed, index)
+            started = time.perf_counter()
+            winners[name] = game.simulate_game()
+            timings[name] += time.perf_counter() - started
+        report["turns"] += full.turn_count
+        report["saved"] += full.turn_count - early.turn_count
+        if early.outcome == Outcome.RESIGNATION:
+            report["resigned"] += 1
+            # Players are separate objects in the two games
+            names = [w.name if w else None for w in winners.values()]
+            report["changed"] += names[0] != names[1]
+    report["turns_saved"] = report["saved"] / report["turns"]
+    report["time_saved"] = 1 - timings["early"] / timings["full"]
+    report["changed_rate"] = report["changed"] / runs
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Calibrate early resignation.")
+    parser.add_argument("--calibrate", type=int, default=400, help="playouts to fit")
+    parser.add_argument("--test", type=int, default=200, help="games to compare")
+    parser.add_argument("--threshold", type=float, default=0.95)
+    parser.add_argument("--min-turns", type=int, default=MIN_TURNS)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    samples = playout_snapshots(
+        args.calibrate, f"{args.seed}/calibrate", args.min_turns
+    )
+    weights = fit_weights(samples)
+    evaluator = PositionEvaluator(weights, args.threshold, args.min_turns)
+    print(f"{len(samples)} positions, weights {dict(zip(FEATURE_NAMES, weights))}")
+    for row in reliability(evaluator, samples):
+        if row["positions"]:
+            print(
+                f"leader p <= {row['below']:.2f}: {row['positions']:>6} positions"
+                f"  predicted {row['predicted']:.3f}  won {row['won']:.3f}"
+            )
+    report = resignation_report(evaluator, args.test, f"{args.seed}/test")
+    print(
+        f"{report['resigned']} of {report['games']} games resigned,"
+        f" {report['turns_saved']:.1%} of turns and {report['time_saved']:.1%}"
+        f" of time saved, winner changed in {report['changed_rate']:.1%} of games"
+    )
+
+
+if __name__ == "__main__":
+    main()
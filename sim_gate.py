@@ -0,0 +1,139 @@
+"""Performance regression gate against a stored benchmark baseline.
+
+Compares a sim_bench.py result with a baseline from the same machine class
+(operating system, architecture, processor, core count and Python minor
+version; another class is refused unless --any-machine is given) and exits
+with status 1 if any case regressed:
+
+    rate     the case's trials are slower than the baseline's by a one-sided
+             Mann-Whitney test at --alpha, and the best trial (min-of-N time)
+             lost more than --tolerance against the best baseline trial.
+             With too few trials for the test to get below --alpha (3
+             against 3 can at best reach 0.05), min-of-N alone decides.
+    memory   alloc_peak_kb, which is exact for the same code and seed, grew
+             by more than --memory-tolerance, or the median peak RSS did.
+
+Without --current the suite is run now, with the baseline's cases and trial
+count, so one command checks the working tree:
+
+    python sim_bench.py --repeat 5 --out baseline.json    # on the old code
+    python sim_gate.py baseline.json                      # on the new code
+"""
+
+import argparse
+import json
+import math
+import sys
+from typing import Dict, List, Optional
+
+from sim_bench import median_of, rate_metric, run_suite
+from sim_stats import mann_whitney_less
+
+MACHINE_CLASS_FIELDS = ("system", "machine", "processor", "cpu_count")
+
+
+def machine_class(results: Dict) -> Dict:
+    machine = results["machine"]
+    fields = {field: machine.get(field) for field in MACHINE_CLASS_FIELDS}
+    fields["python"] = ".".join(machine["python"].split(".")[:2])
+    return fields
+
+
+def smallest_p_value(m: int, n: int) -> float:
+    """The strongest result a Mann-Whitney test of m and n trials can give."""
+    return 1 / math.comb(m + n, m)
+
+
+def check_case(
+    current: Dict,
+    baseline: Dict,
+    tolerance: float,
+    memory_tolerance: float,
+    alpha: float,
+) -> List[str]:
+    """Reasons the case regressed; empty if it did not."""
+    problems = []
+    metric = rate_metric(current)
+    rates = [trial[metric] for trial in current["trials"]]
+    base_rates = [trial[metric] for trial in baseline["trials"]]
+    best = max(rates) / max(base_rates)
+    if best < 1 - tolerance:
+        if smallest_p_value(len(rates), len(base_rates)) >= alpha:
+            problems.append(f"best {metric} {best:.3f}x of baseline")
+        else:
+            p = mann_whitney_less(rates, base_rates)
+            if p <= alpha:
+                problems.append(
+                    f"best {metric} {best:.3f}x of baseline, slower at p={p:.3f}"
+                )
+    for field, limit in (
+        ("alloc_peak_kb", memory_tolerance),
+        ("peak_rss_mb", memory_tolerance),
+    ):
+        now = median_of(current, field) if field in current["trials"][0] else None
+        then = median_of(baseline, field) if field in baseline["trials"][0] else None
+        if now is not None and then and now / then > 1 + limit:
+            problems.append(f"{field} {now:.1f} against {then:.1f}")
+    return problems
+
+
+def gate(
+    results: Dict,
+    baseline: Dict,
+    tolerance: float = 0.05,
+    memory_tolerance: float = 0.10,
+    alpha: float = 0.05,
+) -> bool:
+    """Print a line per case; True if nothing regressed."""
+    passed = True
+    for case, before in baseline["cases"].items():
+        if case not in results["cases"]:
+            continue
+        current = results["cases"][case]
+        problems = check_case(current, before, tolerance, memory_tolerance, alpha)
+        metric = rate_metric(current)
+        ratio = median_of(current, metric) / median_of(before, metric)
+        status = "REGRESSED" if problems else "ok"
+        details = "  " + "; ".join(problems) if problems else ""
+        print(f"{case:>21}: {status:>9}  median {ratio:.3f}x{details}")
+        passed = passed and not problems
+    return passed
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Fail on performance regressions.")
+    parser.add_argument("baseline", help="stored sim_bench.py result")
+    parser.add_argument("--current", help="result to check (default: run now)")
+    parser.add_argument("--tolerance", type=float, default=0.05)
+    parser.add_argument("--memory-tolerance", type=float, default=0.10)
+    parser.add_argument("--alpha", type=float, default=0.05)
+    parser.add_argument("--any-machine", action="store_true")
+    parser.add_argument("--out", help="also save the run made without --current")
+    args = parser.parse_args(argv)
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    if args.current:
+        with open(args.current, encoding="utf-8") as f:
+            results = json.load(f)
+    else:
+        # The baseline's cases, trial count and games, whatever scale it used
+        sizes = {case: data["games"] for case, data in baseline["cases"].items()}
+        repeat = len(next(iter(baseline["cases"].values()))["trials"])
+        results = run_suite(list(sizes), repeat, sizes=sizes)
+        if args.out:
+            with open(args.out, "w", encoding="utf-8") as f:
+                json.dump(results, f, indent=2)
+
+    if machine_class(results) != machine_class(baseline) and not args.any_machine:
+        print(
+            f"baseline is from another machine class: {machine_class(baseline)}"
+            f" against {machine_class(results)}; use --any-machine to compare anyway"
+        )
+        sys.exit(2)
+    passed = gate(results, baseline, args.tolerance, args.memory_tolerance, args.alpha)
+    sys.exit(0 if passed else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,113 +4,50 @@ import random
 from abc import ABC, abstractmethod
 from typing import Dict, Optional, List, Tuple, Union
 from enum import Enum
-from collections import deque
 
+from sim import (
+    CARD_EFFECTS,
+    CardActions,
+    CardEffect,
+    ChanceCards,
+    CommunityChestCards,
+    Deck,
+    GameRNG,
+    TileKinds,
+    compile_nearest_tiles,
+    compile_tile_kinds,
+)
 
 ###############################################################################
 #                             MONOPOLY CLASSES                                #
 ###############################################################################
 
 
-class ChanceCards(Enum):
-    ADVANCE_TO_GO = "Advance to Go (Collect $200)"
-    BANK_DIVIDEND = "Bank pays you dividend of $50"
-    GO_TO_JAIL = (
-        "Go to Jail - Go directly to Jail - Do not pass Go - Do not collect $200"
-    )
-    ADVANCE_TO_ILLINOIS = "Advance to Illinois Ave. - If you pass Go, collect $200"
-    ADVANCE_TO_ST_CHARLES = (
-        "Advance to St. Charles Place - If you pass Go, collect $200"
-    )
-    NEAREST_UTILITY = (
-        "Advance token to the nearest Utility. If unowned, you may buy it."
-    )
-    NEAREST_RAILROAD = (
-        "Advance token to the nearest Railroad and pay owner twice the rental."
-    )
-    READING_RAILROAD = "Take a trip to Reading Railroad - If you pass Go, collect $200"
-    BOARDWALK = "Take a walk on the Boardwalk - Advance token to Boardwalk"
-    CHAIRMAN = "Elected Chairman of the Board - Pay each player $50"
-    BUILDING_LOAN = "Your building loan matures - Collect $150"
-    STREET_REPAIRS = (
-        "You have been assessed for street repairs - $40 per house, $115 per hotel"
-    )
-    POOR_TAX = "Pay poor tax of $15"
-    GENERAL_REPAIRS = "Make general repairs on all your property - For each house pay $25, for each hotel pay $100"
-    GET_OUT_OF_JAIL_FREE = (
-        "Get out of Jail Free - This card may be kept until needed, or sold"
-    )
-    GO_BACK_THREE = "Go back three spaces"
-
-
-class CommunityChestCards(Enum):
-    ADVANCE_TO_GO = "Advance to Go (Collect $200)"
-    BANK_ERROR = "Bank error in your favor - Collect $200"
-    DOCTOR_FEE = "Doctor's fee - Pay $50"
-    STOCK_SALE = "From sale of stock, you get $50"
-    GO_TO_JAIL = (
-        "Go to Jail - Go directly to Jail - Do not pass Go - Do not collect $200"
-    )
-    GET_OUT_OF_JAIL_FREE = (
-        "Get out of Jail Free - This card may be kept until needed, or sold"
-    )
-    HOLIDAY_FUND = "Holiday fund matures - Receive $100"
-    INCOME_TAX_REFUND = "Income tax refund - Collect $20"
-    BIRTHDAY = "It is your birthday - Collect $10 from every player"
-    LIFE_INSURANCE = "Life insurance matures - Collect $100"
-    HOSPITAL_FEES = "Pay hospital fees of $100"
-    SCHOOL_FEES = "Pay school fees of $50"
-    CONSULTANCY_FEE = "Receive $25 consultancy fee"
-    STREET_REPAIRS = (
-        "You are assessed for street repairs - $40 per house, $115 per hotel"
-    )
-    BEAUTY_CONTEST = "You have won second prize in a beauty contest - Collect $10"
-    INHERITANCE = "You inherit $100"
-
-
 class Block(ABC):
+    __slots__ = ("type", "number")
+
     def __init__(self, type, number):
         self.type = type
         self.number = number
 
 
 class Chance(Block):
-    chance_deque = deque(ChanceCards)
+    __slots__ = ()
 
     def __init__(self, number):
         super().__init__("chance", number)
 
-    @classmethod
-    def get_chance_card(cls):
-        card = cls.chance_deque.pop()
-        if card != ChanceCards.GET_OUT_OF_JAIL_FREE:
-            cls.chance_deque.appendleft(card)
-        return card
-
-    @classmethod
-    def put_jail_free_card_back(cls):
-        cls.chance_deque.appendleft(ChanceCards.GET_OUT_OF_JAIL_FREE)
-
 
 class CommunityChest(Block):
-    community_chest_deque = deque(CommunityChestCards)
+    __slots__ = ()
 
     def __init__(self, number):
         super().__init__("community_chest", number)
 
-    @classmethod
-    def get_community_chest_card(cls):
-        card = cls.community_chest_deque.pop()
-        if card != CommunityChestCards.GET_OUT_OF_JAIL_FREE:
-            cls.community_chest_deque.appendleft(card)
-        return card
-
-    @classmethod
-    def put_jail_free_card_back(cls):
-        cls.community_chest_deque.appendleft(CommunityChestCards.GET_OUT_OF_JAIL_FREE)
-
 
 class Tax(Block):
+    __slots__ = ("name", "amount")
+
     def __init__(self, name, amount, number):
         super().__init__("tax", number)
         self.name = name
@@ -118,6 +55,8 @@ class Tax(Block):
 
 
 class Property(Block):
+    __slots__ = ("name", "price", "mortgage", "unmortgage", "mortgaged", "owner")
+
     def __init__(self, name, price, number):
         super().__init__("property", number)
         self.name = name
@@ -133,6 +72,8 @@ class Property(Block):
 
 
 class Utility(Property):
+    __slots__ = ()
+
     def __init__(self, name, price, number):
         super().__init__(name, price, number)
 
@@ -143,6 +84,8 @@ class Utility(Property):
 
 
 class RailRoad(Property):
+    __slots__ = ("rent",)
+
     def __init__(self, name: str, price: int, rent: List[int], number: int):
         super().__init__(name, price, number)
         self.rent = rent
@@ -166,6 +109,8 @@ class StreetGroups(Enum):
 
 
 class Street(Property):
+    __slots__ = ("house_price", "group", "rent", "level")
+
     GROUP_COUNTS = {
         StreetGroups.BROWN: 2,
         StreetGroups.LIGHT_BLUE: 3,
@@ -193,6 +138,8 @@ class Street(Property):
 class Board:
     def __init__(self):
         self.tiles = []
+        self.tile_kinds: List[TileKinds] = []
+        self.nearest_tiles: Dict[TileKinds, List[int]] = {}
         self.initialize_board()
 
     def initialize_board(self):
@@ -387,6 +334,8 @@ class Board:
                 39,
             ),
         ]
+        self.tile_kinds = compile_tile_kinds(self.tiles)
+        self.nearest_tiles = compile_nearest_tiles(self.tile_kinds)
 
 
 class Bank:
@@ -395,6 +344,33 @@ class Bank:
 
 
 class Player:
+    __slots__ = (
+        "name",
+        "w_buy_building",
+        "w_buy_railroad",
+        "w_buy_utility",
+        "w_use_jail_free_card",
+        "w_roll_double_in_jail",
+        "min_cash",
+        "min_cash_to_unmortgage",
+        "is_in_jail",
+        "is_in_game",
+        "jail_roll_attempts",
+        "consecutive_doubles",
+        "position",
+        "cash",
+        "liquidity",
+        "last_dice_roll",
+        "community_chest_jail_free_card",
+        "chance_jail_free_card",
+        "rng",
+        "chance_deck",
+        "community_chest_deck",
+        "streets",
+        "railroads",
+        "utilities",
+    )
+
     def __init__(
         self,
         name,
@@ -424,6 +400,10 @@ class Player:
         self.last_dice_roll = 0
         self.community_chest_jail_free_card = False
         self.chance_jail_free_card = False
+        # Replaced by the game's own streams and decks once the player joins a Game
+        self.rng = random
+        self.chance_deck: Optional[Deck] = None
+        self.community_chest_deck: Optional[Deck] = None
         self.streets: Dict[StreetGroups, List[Street]] = {}
         self.railroads: List[RailRoad] = []
         self.utilities: List[Utility] = []
@@ -432,35 +412,36 @@ class Player:
         return self.community_chest_jail_free_card or self.chance_jail_free_card
 
     def decide_to_use_jail_free_card(self):
-        return random.random() < self.w_use_jail_free_card
+        return self.rng.random() < self.w_use_jail_free_card
 
     def use_jail_free_card(self):
         if self.chance_jail_free_card:
             self.chance_jail_free_card = False
-            Chance.put_jail_free_card_back()
+            self.chance_deck.put_jail_free_card_back()
         elif self.community_chest_jail_free_card:
             self.community_chest_jail_free_card = False
-            CommunityChest.put_jail_free_card_back()
+            self.community_chest_deck.put_jail_free_card_back()
 
     def reset_jail_roll_attempts(self):
         self.jail_roll_attempts = 0
 
     def decide_to_roll_for_doubles(self):
-        return random.random() < self.w_roll_double_in_jail
+        return self.rng.random() < self.w_roll_double_in_jail
 
     def earn(self, amount):
         self.cash += amount
         self.liquidity += amount
 
     def pay(self, amount, to):
-        if self.liquidity < amount:
+        if self.cash < amount:
+            self.raise_fund(amount)
+        if self.cash < amount:
             self.is_in_game = False
             self.transfer_ownership_of_all_assets(to)
             return
-        if self.cash < amount:
-            self.raise_fund(amount)
-        if self.is_in_game:
-            to.earn(amount)
+        self.cash -= amount
+        self.liquidity -= amount
+        to.earn(amount)
 
     def transfer_ownership_of_all_assets(self, to):
         if isinstance(to, Player):
@@ -512,9 +493,9 @@ class Player:
             u.owner = None
 
         if self.community_chest_jail_free_card:
-            CommunityChest.put_jail_free_card_back()
+            self.community_chest_deck.put_jail_free_card_back()
         if self.chance_jail_free_card:
-            Chance.put_jail_free_card_back()
+            self.chance_deck.put_jail_free_card_back()
 
     def raise_fund(self, amount):
         def sell_houses():
@@ -558,11 +539,11 @@ class Player:
 
     def decide_to_buy_property_random(self, prop):
         if isinstance(prop, Street):
-            return random.random() < self.w_buy_building
+            return self.rng.random() < self.w_buy_building
         elif isinstance(prop, RailRoad):
-            return random.random() < self.w_buy_railroad
+            return self.rng.random() < self.w_buy_railroad
         elif isinstance(prop, Utility):
-            return random.random() < self.w_buy_utility
+            return self.rng.random() < self.w_buy_utility
         return False
 
     def decide_to_buy_property(self, prop):
@@ -592,6 +573,25 @@ class Player:
         self.is_in_jail = True
         self.position = 10
 
+    def advance_to(self, position):
+        # Cards only move tokens forward, so a lower target means passing GO
+        if position < self.position:
+            self.earn(200)
+        self.position = position
+
+    def go_back(self, steps, board_size):
+        self.position = (self.position - steps) % board_size
+
+    def determine_repair_fee(self, per_house, per_hotel):
+        total = 0
+        for g, props in self.streets.items():
+            for s in props:
+                if s.level == 5:
+                    total += per_hotel
+                elif s.level >= 2:
+                    total += per_house * (s.level - 1)
+        return total
+
     def move(self, steps, board_size):
         self.last_dice_roll = steps
         self.position += steps
@@ -648,14 +648,46 @@ class Player:
 
 
 class Game:
-    def __init__(self, *players):
+    def __init__(self, *players, rng: Optional[GameRNG] = None):
         self.board = Board()
         self.players: List[Player] = list(players)
         self.bank = Bank()
         self.current_player_index = 0
+        self.rng = rng or GameRNG(random.getrandbits(64))
+        self.chance_deck = Deck(list(ChanceCards), self.rng)
+        self.community_chest_deck = Deck(list(CommunityChestCards), self.rng)
+        for player in self.players:
+            player.rng = self.rng
+            player.chance_deck = self.chance_deck
+            player.community_chest_deck = self.community_chest_deck
+        handlers = {
+            TileKinds.IDLE: self.handle_idle_landing,
+            TileKinds.STREET: self.handle_street_landing,
+            TileKinds.RAILROAD: self.handle_railroad_landing,
+            TileKinds.UTILITY: self.handle_utility_landing,
+            TileKinds.CHANCE: self.handle_chance_landing,
+            TileKinds.COMMUNITY_CHEST: self.handle_community_chest_landing,
+            TileKinds.TAX: self.handle_tax_landing,
+            TileKinds.GO_TO_JAIL: self.handle_go_to_jail_landing,
+        }
+        self.landing_handlers = [handlers[kind] for kind in self.board.tile_kinds]
+        self.nearest_landing_handlers = {
+            TileKinds.RAILROAD: self.handle_nearest_railroad_landing,
+            TileKinds.UTILITY: self.handle_nearest_utility_landing,
+        }
+        self.card_handlers = {
+            CardActions.CASH: self.apply_cash_card,
+            CardActions.MOVE_TO: self.apply_move_to_card,
+            CardActions.MOVE_TO_NEAREST: self.apply_move_to_nearest_card,
+            CardActions.MOVE_BACK: self.apply_move_back_card,
+            CardActions.GO_TO_JAIL: self.apply_go_to_jail_card,
+            CardActions.PAY_EACH_PLAYER: self.apply_pay_each_player_card,
+            CardActions.REPAIRS: self.apply_repairs_card,
+            CardActions.KEEP_CARD: self.apply_keep_card,
+        }
 
     def roll_dice(self):
-        return random.randint(1, 6), random.randint(1, 6)
+        return self.rng.roll_dice()
 
     def next_player(self):
         self.current_player_index = (self.current_player_index + 1) % len(self.players)
@@ -767,205 +799,175 @@ class Game:
 
     def handle_tile_landing(self, p: Player, tile: Block) -> List[str]:
         logs = []
-        if isinstance(tile, Street):
-            if tile.owner is None:
-                decide = p.decide_to_buy_property(tile)
-                logs.append(f"{p.name} lands on {tile.name}. Decides to buy? {decide}")
-                if decide:
-                    p.buy_property(tile)
-                    if tile.owner == p:
-                        logs.append(f"{p.name} bought {tile.name} for ${tile.price}.")
-            else:
-                if tile.owner != p and tile.owner.is_in_game:
-                    rent = tile.calculate_rent(p)
-                    if rent > 0:
-                        logs.append(
-                            f"{p.name} pays ${rent} rent to {tile.owner.name} for {tile.name}."
-                        )
-                    p.pay(rent, tile.owner)
-        elif isinstance(tile, RailRoad):
-            if tile.owner is None:
-                decide = p.decide_to_buy_property(tile)
-                logs.append(f"{p.name} lands on {tile.name} (Railroad). Buy? {decide}")
-                if decide:
-                    p.buy_property(tile)
-                    if tile.owner == p:
-                        logs.append(f"{p.name} bought {tile.name} for ${tile.price}.")
-            else:
-                if tile.owner != p and tile.owner.is_in_game:
-                    rent = tile.calculate_rent(p)
-                    if rent > 0:
-                        logs.append(
-                            f"{p.name} pays ${rent} railroad rent to {tile.owner.name}."
-                        )
-                    p.pay(rent, tile.owner)
-        elif isinstance(tile, Utility):
-            if tile.owner is None:
-                decide = p.decide_to_buy_property(tile)
-                logs.append(f"{p.name} lands on {tile.name} (Utility). Buy? {decide}")
-                if decide:
-                    p.buy_property(tile)
-                    if tile.owner == p:
-                        logs.append(f"{p.name} bought {tile.name} for ${tile.price}.")
-            else:
-                if tile.owner != p and tile.owner.is_in_game:
-                    rent = tile.calculate_rent(p.last_dice_roll, p)
-                    if rent > 0:
-                        logs.append(
-                            f"{p.name} pays ${rent} utility rent to {tile.owner.name}."
-                        )
-                    p.pay(rent, tile.owner)
-        elif isinstance(tile, Chance):
-            card = Chance.get_chance_card()
-            logs.append(f"{p.name} lands on Chance -> {card.value}")
-            self.resolve_card_effect(p, card, logs)
-        elif isinstance(tile, CommunityChest):
-            card = CommunityChest.get_community_chest_card()
-            logs.append(f"{p.name} lands on Community Chest -> {card.value}")
-            self.resolve_card_effect(p, card, logs)
-        elif isinstance(tile, Tax):
-            logs.append(f"{p.name} lands on {tile.name} -> pays ${tile.amount} tax.")
-            p.pay(tile.amount, self.bank)
-        elif tile.type == "go_to_jail":
-            logs.append(f"{p.name} hits GO TO JAIL!")
-            p.go_to_jail()
+        self.landing_handlers[p.position](p, tile, logs)
         return logs
 
-    def resolve_card_effect(self, p: Player, card: Enum, logs: List[str]):
-        if card in (ChanceCards.ADVANCE_TO_GO, CommunityChestCards.ADVANCE_TO_GO):
-            logs.append(f"{p.name} advances to GO (+$200).")
-            p.advance_to_go()
-        elif card == ChanceCards.BANK_DIVIDEND:
-            logs.append(f"{p.name} gets $50 from Bank Dividend.")
-            p.earn(50)
-        elif card in (ChanceCards.GO_TO_JAIL, CommunityChestCards.GO_TO_JAIL):
-            logs.append(f"{p.name} goes directly to Jail!")
-            p.go_to_jail()
-        elif card == ChanceCards.ADVANCE_TO_ILLINOIS:
-            logs.append(f"{p.name} advances to Illinois (24).")
-            p.advance_to_illinois()
-        elif card == ChanceCards.ADVANCE_TO_ST_CHARLES:
-            logs.append(f"{p.name} advances to St. Charles (11).")
-            p.advance_to_st_charles()
-        elif card == ChanceCards.NEAREST_UTILITY:
-            logs.append(f"{p.name} moves to nearest Utility.")
-            old_pos = p.position
-            p.advance_to_nearest_utility()
-            if p.position < old_pos:
-                logs.append(f"Passed GO -> +200!")
-            tile = self.board.tiles[p.position]
-            if isinstance(tile, Utility):
-                if tile.owner is None:
-                    decided = p.decide_to_buy_property(tile)
-                    logs.append(f"Decided to buy utility? {decided}")
-                    if decided:
-                        p.buy_property(tile)
-                elif tile.owner != p and tile.owner.is_in_game:
-                    d1, d2 = self.roll_dice()
-                    rent = (d1 + d2) * 10
+    def handle_idle_landing(self, p: Player, tile: Block, logs: List[str]):
+        pass
+
+    def handle_street_landing(self, p: Player, tile: Street, logs: List[str]):
+        if tile.owner is None:
+            decide = p.decide_to_buy_property(tile)
+            logs.append(f"{p.name} lands on {tile.name}. Decides to buy? {decide}")
+            if decide:
+                p.buy_property(tile)
+                if tile.owner == p:
+                    logs.append(f"{p.name} bought {tile.name} for ${tile.price}.")
+        else:
+            if tile.owner != p and tile.owner.is_in_game:
+                rent = tile.calculate_rent(p)
+                if rent > 0:
                     logs.append(
-                        f"{p.name} rolled ({d1},{d2}) -> pays ${rent} to {tile.owner.name}."
+                        f"{p.name} pays ${rent} rent to {tile.owner.name} for {tile.name}."
                     )
-                    p.pay(rent, tile.owner)
-        elif card == ChanceCards.NEAREST_RAILROAD:
-            logs.append(f"{p.name} moves to nearest Railroad.")
-            old_pos = p.position
-            p.advance_to_nearest_railroad()
-            if p.position < old_pos:
-                logs.append(f"Passed GO -> +200!")
-            tile = self.board.tiles[p.position]
-            if isinstance(tile, RailRoad):
-                if tile.owner is None:
-                    decided = p.decide_to_buy_property(tile)
-                    logs.append(f"Decided to buy RR? {decided}")
-                    if decided:
-                        p.buy_property(tile)
-                elif tile.owner != p and tile.owner.is_in_game:
-                    rent = tile.calculate_rent(p) * 2
+                p.pay(rent, tile.owner)
+
+    def handle_utility_landing(self, p: Player, tile: Utility, logs: List[str]):
+        if tile.owner is None:
+            decide = p.decide_to_buy_property(tile)
+            logs.append(f"{p.name} lands on {tile.name} (Utility). Buy? {decide}")
+            if decide:
+                p.buy_property(tile)
+                if tile.owner == p:
+                    logs.append(f"{p.name} bought {tile.name} for ${tile.price}.")
+        else:
+            if tile.owner != p and tile.owner.is_in_game:
+                rent = tile.calculate_rent(p.last_dice_roll, p)
+                if rent > 0:
                     logs.append(
-                        f"{p.name} pays double RR rent ${rent} to {tile.owner.name}."
+                        f"{p.name} pays ${rent} utility rent to {tile.owner.name}."
                     )
-                    p.pay(rent, tile.owner)
-        elif card == ChanceCards.READING_RAILROAD:
-            logs.append(f"{p.name} moves to Reading RR (5).")
-            old_pos = p.position
-            p.advance_to_reading_railroad()
-            if p.position < old_pos:
-                logs.append(f"Passed GO -> +200!")
-            tile = self.board.tiles[p.position]
-            self.handle_railroad_landing(p, tile, logs)
-        elif card == ChanceCards.BOARDWALK:
-            logs.append(f"{p.name} advances to Boardwalk (39).")
-            p.advance_to_boardwalk()
-            tile = self.board.tiles[p.position]
-            if isinstance(tile, Street):
-                logs += self.handle_tile_landing(p, tile)
-        elif card == ChanceCards.CHAIRMAN:
-            logs.append(f"CHAIRMAN: {p.name} pays each other player $50.")
-            for pl in self.players:
-                if pl != p and pl.is_in_game:
-                    p.pay(50, pl)
-        elif card == ChanceCards.BUILDING_LOAN:
-            logs.append(f"{p.name} gets $150 from building loan.")
-            p.earn(150)
-        elif card in (ChanceCards.STREET_REPAIRS, CommunityChestCards.STREET_REPAIRS):
-            fee = p.determine_street_repair_fee()
-            logs.append(f"{p.name} must pay street repair: ${fee}.")
-            p.pay(fee, self.bank)
-        elif card == ChanceCards.POOR_TAX:
-            logs.append(f"{p.name} pays poor tax of $15.")
-            p.pay(15, self.bank)
-        elif card == ChanceCards.GENERAL_REPAIRS:
-            fee = p.determine_general_repair_fee()
-            logs.append(f"{p.name} pays general repairs: ${fee}.")
-            p.pay(fee, self.bank)
-        elif card == ChanceCards.GET_OUT_OF_JAIL_FREE:
+                p.pay(rent, tile.owner)
+
+    def handle_chance_landing(self, p: Player, tile: Chance, logs: List[str]):
+        card = self.chance_deck.draw()
+        logs.append(f"{p.name} lands on Chance -> {card.value}")
+        self.resolve_card_effect(p, card, logs)
+
+    def handle_community_chest_landing(
+        self, p: Player, tile: CommunityChest, logs: List[str]
+    ):
+        card = self.community_chest_deck.draw()
+        logs.append(f"{p.name} lands on Community Chest -> {card.value}")
+        self.resolve_card_effect(p, card, logs)
+
+    def handle_tax_landing(self, p: Player, tile: Tax, logs: List[str]):
+        logs.append(f"{p.name} lands on {tile.name} -> pays ${tile.amount} tax.")
+        p.pay(tile.amount, self.bank)
+
+    def handle_go_to_jail_landing(self, p: Player, tile: Block, logs: List[str]):
+        logs.append(f"{p.name} hits GO TO JAIL!")
+        p.go_to_jail()
+
+    def handle_nearest_railroad_landing(
+        self, p: Player, tile: RailRoad, logs: List[str]
+    ):
+        if tile.owner is None:
+            decided = p.decide_to_buy_property(tile)
+            logs.append(f"Decided to buy RR? {decided}")
+            if decided:
+                p.buy_property(tile)
+        elif tile.owner != p and tile.owner.is_in_game:
+            rent = tile.calculate_rent(p) * 2
+            logs.append(f"{p.name} pays double RR rent ${rent} to {tile.owner.name}.")
+            p.pay(rent, tile.owner)
+
+    def handle_nearest_utility_landing(self, p: Player, tile: Utility, logs: List[str]):
+        if tile.owner is None:
+            decided = p.decide_to_buy_property(tile)
+            logs.append(f"Decided to buy utility? {decided}")
+            if decided:
+                p.buy_property(tile)
+        elif tile.owner != p and tile.owner.is_in_game and not tile.mortgaged:
+            d1, d2 = self.roll_dice()
+            rent = (d1 + d2) * 10
+            logs.append(
+                f"{p.name} rolled ({d1},{d2}) -> pays ${rent} to {tile.owner.name}."
+            )
+            p.pay(rent, tile.owner)
+
+    def resolve_card_effect(self, p: Player, card: Enum, logs: List[str]):
+        effect = CARD_EFFECTS[card]
+        self.card_handlers[effect.action](p, card, effect, logs)
+
+    def apply_cash_card(
+        self, p: Player, card: Enum, effect: CardEffect, logs: List[str]
+    ):
+        if effect.cash >= 0:
+            logs.append(f"{p.name} collects ${effect.cash}.")
+            p.earn(effect.cash)
+        else:
+            logs.append(f"{p.name} pays ${-effect.cash} to the bank.")
+            p.pay(-effect.cash, self.bank)
+
+    def apply_move_to_card(
+        self, p: Player, card: Enum, effect: CardEffect, logs: List[str]
+    ):
+        old_pos = p.position
+        p.advance_to(effect.move_to)
+        logs.append(f"{p.name} advances to {p.position}.")
+        if p.position < old_pos:
+            logs.append(f"Passed GO -> +200!")
+        self.landing_handlers[p.position](p, self.board.tiles[p.position], logs)
+
+    def apply_move_to_nearest_card(
+        self, p: Player, card: Enum, effect: CardEffect, logs: List[str]
+    ):
+        old_pos = p.position
+        p.advance_to(self.board.nearest_tiles[effect.nearest][p.position])
+        logs.append(f"{p.name} moves to nearest {effect.nearest.name.title()}.")
+        if p.position < old_pos:
+            logs.append(f"Passed GO -> +200!")
+        self.nearest_landing_handlers[effect.nearest](
+            p, self.board.tiles[p.position], logs
+        )
+
+    def apply_move_back_card(
+        self, p: Player, card: Enum, effect: CardEffect, logs: List[str]
+    ):
+        logs.append(f"{p.name} goes back {effect.move_back} spaces.")
+        p.go_back(effect.move_back, len(self.board.tiles))
+        self.landing_handlers[p.position](p, self.board.tiles[p.position], logs)
+
+    def apply_go_to_jail_card(
+        self, p: Player, card: Enum, effect: CardEffect, logs: List[str]
+    ):
+        logs.append(f"{p.name} goes directly to Jail!")
+        p.go_to_jail()
+
+    def apply_pay_each_player_card(
+        self, p: Player, card: Enum, effect: CardEffect, logs: List[str]
+    ):
+        if effect.pay_each_player > 0:
+            logs.append(f"{p.name} pays each other player ${effect.pay_each_player}.")
+        else:
+            logs.append(
+                f"Each other player pays ${-effect.pay_each_player} to {p.name}."
+            )
+        for pl in self.players:
+            if pl == p or not pl.is_in_game:
+                continue
+            if effect.pay_each_player > 0:
+                p.pay(effect.pay_each_player, pl)
+            else:
+                pl.pay(-effect.pay_each_player, p)
+
+    def apply_repairs_card(
+        self, p: Player, card: Enum, effect: CardEffect, logs: List[str]
+    ):
+        fee = p.determine_repair_fee(*effect.repair_rates)
+        logs.append(f"{p.name} must pay repairs: ${fee}.")
+        p.pay(fee, self.bank)
+
+    def apply_keep_card(
+        self, p: Player, card: Enum, effect: CardEffect, logs: List[str]
+    ):
+        if isinstance(card, ChanceCards):
             logs.append(f"{p.name} receives a Get Out of Jail Free (Chance).")
             p.chance_jail_free_card = True
-        elif card == ChanceCards.GO_BACK_THREE:
-            logs.append(f"{p.name} goes back 3 spaces.")
-            p.go_back_three(len(self.board.tiles))
-        elif card == CommunityChestCards.BANK_ERROR:
-            logs.append(f"{p.name} gets $200 from Bank Error.")
-            p.earn(200)
-        elif card == CommunityChestCards.DOCTOR_FEE:
-            logs.append(f"{p.name} pays $50 Doctor Fee.")
-            p.pay(50, self.bank)
-        elif card == CommunityChestCards.STOCK_SALE:
-            logs.append(f"{p.name} gets $50 from Stock Sale.")
-            p.earn(50)
-        elif card == CommunityChestCards.GET_OUT_OF_JAIL_FREE:
+        else:
             logs.append(f"{p.name} receives a Get Out of Jail Free (Chest).")
             p.community_chest_jail_free_card = True
-        elif card == CommunityChestCards.HOLIDAY_FUND:
-            logs.append(f"{p.name} receives $100 from Holiday Fund.")
-            p.earn(100)
-        elif card == CommunityChestCards.INCOME_TAX_REFUND:
-            logs.append(f"{p.name} collects $20 from Income Tax Refund.")
-            p.earn(20)
-        elif card == CommunityChestCards.BIRTHDAY:
-            logs.append(f"Birthday: each other player pays $10 to {p.name}.")
-            for pl in self.players:
-                if pl != p and pl.is_in_game:
-                    pl.pay(10, p)
-        elif card == CommunityChestCards.LIFE_INSURANCE:
-            logs.append(f"{p.name} gets $100 from Life Insurance.")
-            p.earn(100)
-        elif card == CommunityChestCards.HOSPITAL_FEES:
-            logs.append(f"{p.name} pays $100 Hospital Fees.")
-            p.pay(100, self.bank)
-        elif card == CommunityChestCards.SCHOOL_FEES:
-            logs.append(f"{p.name} pays $50 School Fees.")
-            p.pay(50, self.bank)
-        elif card == CommunityChestCards.CONSULTANCY_FEE:
-            logs.append(f"{p.name} gets $25 Consultancy Fee.")
-            p.earn(25)
-        elif card == CommunityChestCards.BEAUTY_CONTEST:
-            logs.append(f"{p.name} wins $10 from Beauty Contest.")
-            p.earn(10)
-        elif card == CommunityChestCards.INHERITANCE:
-            logs.append(f"{p.name} inherits $100.")
-            p.earn(100)
 
     def handle_railroad_landing(self, p: Player, tile: RailRoad, logs: List[str]):
         if tile.owner is None:
@@ -0,0 +1,272 @@
+"""Genetic search over Player decision weights.
+
+Each candidate is a full set of Player weights and is scored by its win rate
+against a fixed field of opponents (DEFAULT_ROSTER without its first player
+unless another roster is given). The candidate takes every seat in turn, so
+no candidate is helped by moving first. All candidates of a generation play
+the same game indices from the same generation seed (common random numbers),
+so they are ranked on identical dice rather than on their own luck, and each
+generation draws fresh games so lucky survivors are re-tested.
+
+The games of a generation are cut into chunks that run on one process pool.
+After every generation the population, the search RNG and the history are
+written to a JSON checkpoint, together with the settings of the search (the
+opponents, games per candidate, population size, elite, mutation rate, seeds
+and engine). Starting again with the same checkpoint file resumes from the
+last finished generation, and is refused if those settings differ.
+
+    python sim_optimize.py --generations 40 --population 24 --games 400 \\
+        --workers 32 --checkpoint search.json
+"""
+
+import argparse
+import json
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from typing import Dict, List, Optional
+
+from sim import DEFAULT_ROSTER, Game, GameRNG, Player
+from sim_sweep import load_roster
+
+# Searched weights and their bounds; integer bounds give integer weights
+PARAMETER_BOUNDS = {
+    "w_buy_building": (0.0, 1.0),
+    "w_buy_railroad": (0.0, 1.0),
+    "w_buy_utility": (0.0, 1.0),
+    "w_roll_double_in_jail": (0.0, 1.0),
+    "w_use_jail_free_card": (0.0, 1.0),
+    "min_cash": (0, 1000),
+    "min_cash_to_unmortgage": (0, 1500),
+}
+
+CANDIDATE_NAME = "Candidate"
+
+
+def clip(name: str, value: float):
+    low, high = PARAMETER_BOUNDS[name]
+    value = min(high, max(low, value))
+    return round(value) if isinstance(low, int) else value
+
+
+class FieldEvaluation:
+    """Win counts of candidate weights against a fixed field of opponents."""
+
+    def __init__(self, opponents: List[Dict], games: int, seed, game_class=Game):
+        self.opponents = opponents
+        self.games = games
+        self.seed = seed
+        self.game_class = game_class
+
+    def play(self, weights: Dict, generation: int, start: int, stop: int) -> int:
+        seed = f"{self.seed}/{generation}"
+        seats = len(self.opponents) + 1
+        games = {}
+        wins = 0
+        for index in range(start, stop):
+            seat = index % seats
+            if seat not in games:
+                candidate = Player(name=CANDIDATE_NAME, **weights)
+                players = [Player(**spec) for spec in self.opponents]
+                players.insert(seat, candidate)
+                games[seat] = self.game_class(*players, rng=GameRNG(seed))
+            game = games[seat]
+            game.reset(seed, index)
+            winner = game.simulate_game()
+            wins += winner is not None and winner.name == CANDIDATE_NAME
+        return wins
+
+    def evaluate(
+        self, population: List[Dict], generation: int, executor, chunk_size: int
+    ) -> List[float]:
+        tasks = [
+            (candidate, start, min(start + chunk_size, self.games))
+            for candidate in range(len(population))
+            for start in range(0, self.games, chunk_size)
+        ]
+        arguments = (
+            [population[candidate] for candidate, _, _ in tasks],
+            [generation] * len(tasks),
+            [start for _, start, _ in tasks],
+            [stop for _, _, stop in tasks],
+        )
+        results = (executor.map if executor else map)(self.play, *arguments)
+        wins = [0] * len(population)
+        for (candidate, _, _), chunk_wins in zip(tasks, results):
+            wins[candidate] += chunk_wins
+        return [count / self.games for count in wins]
+
+
+class GeneticOptimizer:
+    def __init__(
+        self,
+        evaluation: FieldEvaluation,
+        population_size: int = 24,
+        elite: int = 2,
+        mutation: float = 0.1,
+        seed=0,
+        checkpoint: Optional[str] = None,
+        chunk_size: int = 50,
+    ):
+        if population_size < 3:
+            raise ValueError("population_size must be at least 3 for selection")
+        if not 0 <= elite <= population_size:
+            raise ValueError("elite must be between 0 and population_size")
+        self.evaluation = evaluation
+        self.population_size = population_size
+        self.elite = elite
+        self.mutation = mutation
+        self.checkpoint = checkpoint
+        self.chunk_size = chunk_size
+        self.seed = seed
+        self.rng = random.Random(f"{seed}/search")
+        self.generation = 0
+        self.population = [self.random_weights() for _ in range(population_size)]
+        self.history: List[Dict] = []
+        if checkpoint and os.path.exists(checkpoint):
+            self.load(checkpoint)
+
+    def random_weights(self) -> Dict:
+        return {
+            name: clip(name, self.rng.uniform(low, high))
+            for name, (low, high) in PARAMETER_BOUNDS.items()
+        }
+
+    def select(self, ranked: List[Dict], fitness: List[float]) -> Dict:
+        """Tournament of three."""
+        entrants = self.rng.sample(range(len(ranked)), 3)
+        return ranked[max(entrants, key=fitness.__getitem__)]
+
+    def offspring(self, a: Dict, b: Dict) -> Dict:
+        child = {}
+        for name, (low, high) in PARAMETER_BOUNDS.items():
+            mix = self.rng.random()
+            value = mix * a[name] + (1 - mix) * b[name]
+            value += self.rng.gauss(0, self.mutation * (high - low))
+            child[name] = clip(name, value)
+        return child
+
+    def next_population(self, fitness: List[float]) -> List[Dict]:
+        order = sorted(range(len(fitness)), key=fitness.__getitem__, reverse=True)
+        ranked = [self.population[i] for i in order]
+        ranked_fitness = [fitness[i] for i in order]
+        children = ranked[: self.elite]
+        while len(children) < self.population_size:
+            a = self.select(ranked, ranked_fitness)
+            b = self.select(ranked, ranked_fitness)
+            children.append(self.offspring(a, b))
+        return children
+
+    def run(self, generations: int, workers: int = 1) -> Dict:
+        """Search until `generations` generations are done; returns the best seen."""
+        with ProcessPoolExecutor(workers) if workers > 1 else nullcontext() as pool:
+            while self.generation < generations:
+                fitness = self.evaluation.evaluate(
+                    self.population, self.generation, pool, self.chunk_size
+                )
+                best = max(range(len(fitness)), key=fitness.__getitem__)
+                self.history.append(
+                    {
+                        "generation": self.generation,
+                        "best_fitness": fitness[best],
+                        "mean_fitness": sum(fitness) / len(fitness),
+                        "best": self.population[best],
+                    }
+                )
+                self.population = self.next_population(fitness)
+                self.generation += 1
+                if self.checkpoint:
+                    self.save(self.checkpoint)
+        return self.best()
+
+    def best(self) -> Optional[Dict]:
+        if not self.history:
+            return None
+        return max(self.history, key=lambda entry: entry["best_fitness"])
+
+    def settings(self) -> Dict:
+        """Everything a resumed search must share with the one it continues."""
+        game_class = self.evaluation.game_class
+        settings = {
+            "opponents": self.evaluation.opponents,
+            "games": self.evaluation.games,
+            "evaluation_seed": self.evaluation.seed,
+            "game_class": f"{game_class.__module__}.{game_class.__qualname__}",
+            "population_size": self.population_size,
+            "elite": self.elite,
+            "mutation": self.mutation,
+            "seed": self.seed,
+        }
+        # As it reads back from JSON, so a loaded checkpoint compares equal
+        return json.loads(json.dumps(settings))
+
+    def save(self, path: str) -> None:
+        state = {
+            "settings": self.settings(),
+            "generation": self.generation,
+            "population": self.population,
+            "history": self.history,
+            "rng_state": self.rng.getstate(),
+        }
+        # Write then rename so an interrupted save keeps the last checkpoint
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(state, f)
+        os.replace(path + ".tmp", path)
+
+    def load(self, path: str) -> None:
+        with open(path, encoding="utf-8") as f:
+            state = json.load(f)
+        settings = self.settings()
+        saved = state.get("settings", {})
+        changed = sorted(name for name in settings if saved.get(name) != settings[name])
+        if changed:
+            raise ValueError(
+                f"Checkpoint {path} is a search with different settings"
+                f" ({', '.join(changed)}); pass the same arguments or another"
+                " checkpoint file"
+            )
+        self.generation = state["generation"]
+        self.population = state["population"]
+        self.history = state["history"]
+        version, internal, gauss_next = state["rng_state"]
+        self.rng.setstate((version, tuple(internal), gauss_next))
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Search for strong Player weights.")
+    parser.add_argument("--opponents", help="opponent roster, .json or .toml")
+    parser.add_argument("--generations", type=int, default=30)
+    parser.add_argument("--population", type=int, default=24)
+    parser.add_argument("--games", type=int, default=200, help="games per candidate")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--checkpoint", default="optimize_checkpoint.json")
+    args = parser.parse_args(argv)
+
+    opponents = (
+        load_roster(args.opponents)
+        if args.opponents
+        else [dict(spec) for spec in DEFAULT_ROSTER[1:]]
+    )
+    try:
+        optimizer = GeneticOptimizer(
+            FieldEvaluation(opponents, args.games, args.seed),
+            population_size=args.population,
+            seed=args.seed,
+            checkpoint=args.checkpoint,
+        )
+    except ValueError as error:
+        parser.error(str(error))
+    best = optimizer.run(args.generations, workers=args.workers)
+    for entry in optimizer.history:
+        print(
+            f"generation {entry['generation']:>3}: best {entry['best_fitness']:.3f}"
+            f"  mean {entry['mean_fitness']:.3f}"
+        )
+    if best:
+        print(f"best weights: {json.dumps(best['best'])}")
+
+
+if __name__ == "__main__":
+    main()
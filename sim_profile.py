@@ -0,0 +1,218 @@
+"""Profile seeded games of any engine variant.
+
+Plays the games of a sim_bench.py case (the engine is built before profiling
+starts, so only the games are measured) under one of two profilers:
+
+    cprofile   cProfile: exact call counts, self and cumulative time, saved
+               as a pstats dump for `python -m pstats` or snakeviz
+    sample     a stdlib-only statistical sampler: a thread reads the stack of
+               the playing thread every --interval ms and counts whole
+               stacks, saved as collapsed-stack text ("a;b;c 42" per line)
+               for flamegraph.pl, speedscope or inferno. Much lower overhead,
+               and time in C code is charged to the Python function calling it
+
+Both print the hot functions by self time and the same time summed over the
+class each method belongs to (sim.Game, sim.Player, sim.Board, sim.Street,
+...), so a report says at a glance whether the turn logic, the player's
+decisions or the board bookkeeping dominates:
+
+    python sim_profile.py --case sim --games 200 --mode cprofile
+    python sim_profile.py --case sim_log_on --mode sample --out log_on
+    flamegraph.pl log_on.collapsed > log_on.svg
+"""
+
+import argparse
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import types
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from sim_bench import CASES, SEED, PlayGame
+
+PROFILERS = ("cprofile", "sample")
+BUILTINS = "builtins"
+
+
+def code_names(filenames) -> Dict[Tuple[str, int, str], str]:
+    """
+    (file, first line, name) -> qualified name of every function in the
+    files; pstats keys only carry the bare name.
+    """
+    names = {}
+    for filename in filenames:
+        try:
+            with open(filename, encoding="utf-8") as f:
+                source = f.read()
+        except OSError:
+            continue
+        stack = [compile(source, filename, "exec")]
+        while stack:
+            code = stack.pop()
+            names[(filename, code.co_firstlineno, code.co_name)] = code.co_qualname
+            stack.extend(c for c in code.co_consts if isinstance(c, types.CodeType))
+    return names
+
+
+def function_label(filename: str, qualname: str) -> Tuple[str, str]:
+    """'module.Class.method' and its group, 'module.Class' or 'module'."""
+    module = os.path.splitext(os.path.basename(filename))[0]
+    owner = qualname.split(".")[0]
+    if "." in qualname and not owner.startswith("<"):
+        return f"{module}.{qualname}", f"{module}.{owner}"
+    return f"{module}.{qualname}", module
+
+
+def profile_games(play: PlayGame, games: int) -> pstats.Stats:
+    profiler = cProfile.Profile()
+    profiler.enable()
+    for index in range(games):
+        play(index)
+    profiler.disable()
+    return pstats.Stats(profiler)
+
+
+def cprofile_rows(stats: pstats.Stats) -> List[Dict]:
+    names = code_names({filename for filename, _, _ in stats.stats} - {"~"})
+    rows = []
+    for key, (_, calls, self_time, total_time, _) in stats.stats.items():
+        filename, _, name = key
+        if filename == "~":
+            function, group = name, BUILTINS
+        else:
+            function, group = function_label(filename, names.get(key, name))
+        rows.append(
+            {
+                "function": function,
+                "group": group,
+                "calls": calls,
+                "self": self_time,
+                "total": total_time,
+            }
+        )
+    return rows
+
+
+def sample_games(play: PlayGame, games: int, interval: float = 0.001) -> Counter:
+    """
+    Play the games while a thread samples their stack every `interval`
+    seconds; returns a count per stack of code objects, outermost first,
+    cut at this function.
+    """
+    counts = Counter()
+    target = threading.get_ident()
+    root = sys._getframe()
+    done = threading.Event()
+
+    def sampler():
+        while not done.wait(interval):
+            frame = sys._current_frames().get(target)
+            stack = []
+            while frame is not None and frame is not root:
+                stack.append(frame.f_code)
+                frame = frame.f_back
+            if frame is root and stack:
+                counts[tuple(reversed(stack))] += 1
+
+    # A shorter switch interval lets the sampler take the GIL on time
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(min(switch_interval, interval / 2))
+    thread = threading.Thread(target=sampler, daemon=True)
+    thread.start()
+    try:
+        for index in range(games):
+            play(index)
+    finally:
+        done.set()
+        thread.join()
+        sys.setswitchinterval(switch_interval)
+    return counts
+
+
+def code_label(code: types.CodeType) -> Tuple[str, str]:
+    return function_label(code.co_filename, code.co_qualname)
+
+
+def sample_rows(counts: Counter) -> List[Dict]:
+    rows = {}
+    for stack, count in counts.items():
+        for code in set(stack):
+            function, group = code_label(code)
+            row = rows.setdefault(
+                function,
+                {"function": function, "group": group, "self": 0, "total": 0},
+            )
+            row["total"] += count
+        rows[code_label(stack[-1])[0]]["self"] += count
+    return list(rows.values())
+
+
+def collapsed_stacks(counts: Counter) -> List[str]:
+    """Folded stacks, one "outer;...;inner count" line per distinct stack."""
+    lines = [
+        ";".join(code_label(code)[0] for code in stack) + f" {count}"
+        for stack, count in counts.items()
+    ]
+    return sorted(lines)
+
+
+def report(rows: List[Dict], top: int = 25, unit: str = "s") -> str:
+    """The method classes by self time, then the `top` hottest functions."""
+    elapsed = sum(row["self"] for row in rows) or 1
+    groups = Counter()
+    for row in rows:
+        groups[row["group"]] += row["self"]
+    value = "{:>13.3f}" if unit == "s" else "{:>13,}"
+    lines = [f"{'self ' + unit:>13}{'self %':>8}  class"]
+    for group, self_time in groups.most_common():
+        lines.append(f"{value.format(self_time)}{self_time / elapsed:>8.1%}  {group}")
+    lines.append("")
+    lines.append(
+        f"{'self ' + unit:>13}{'self %':>8}{'total ' + unit:>14}{'calls':>11}"
+        "  function"
+    )
+    hottest = sorted(rows, key=lambda row: row["self"], reverse=True)[:top]
+    for row in hottest:
+        calls = f"{row['calls']:>11,}" if "calls" in row else f"{'':>11}"
+        lines.append(
+            f"{value.format(row['self'])}{row['self'] / elapsed:>8.1%}"
+            f"{value.format(row['total']):>14}{calls}  {row['function']}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Profile seeded games.")
+    parser.add_argument("--case", choices=list(CASES), default="sim")
+    parser.add_argument("--games", type=int, help="default: the case's trial size")
+    parser.add_argument("--seed", type=int, default=SEED)
+    parser.add_argument("--mode", choices=PROFILERS, default="cprofile")
+    parser.add_argument(
+        "--interval", type=float, default=1.0, help="sampling interval, ms"
+    )
+    parser.add_argument("--top", type=int, default=25)
+    parser.add_argument("--out", help="output path without extension")
+    args = parser.parse_args(argv)
+
+    engine, options, games = CASES[args.case]
+    games = args.games or games
+    out = args.out or f"profile_{args.case}"
+    play = engine(args.seed, **options)
+    if args.mode == "cprofile":
+        stats = profile_games(play, games)
+        stats.dump_stats(out + ".pstats")
+        print(report(cprofile_rows(stats), args.top))
+        print(f"\npstats written to {out}.pstats")
+    else:
+        counts = sample_games(play, games, args.interval / 1000)
+        with open(out + ".collapsed", "w", encoding="utf-8") as f:
+            f.write("\n".join(collapsed_stacks(counts)) + "\n")
+        print(report(sample_rows(counts), args.top, unit="samples"))
+        print(f"\ncollapsed stacks written to {out}.collapsed")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""Progress reporting for long simulation runs.
+
+A reporter lives in the parent process and is fed each chunk of statistics as
+it comes back from run_chunk, so its counts are exact however the games are
+spread over worker processes. It reports at most once every `interval`
+seconds, plus once when the run is done:
+
+    SilentProgress      nothing
+    TTYProgress         one line on stderr, rewritten in place
+    JSONLinesProgress   one JSON object per report, for job schedulers
+
+Every report holds the games played and expected, games and turns per second,
+the estimated time left, the running win rate of each outcome and the share
+of games that ended at the turn cap. That share comes from the chunk's
+per-outcome counts; stats objects without them, e.g. PairedStats, fall back to
+the "no_winner" share, which also holds unadjudicated stalemates.
+"""
+
+import json
+import sys
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, TextIO
+
+NO_WINNER = "no_winner"
+# sim.Outcome.TURN_CAP.value; sim imports this module
+CAP_OUTCOME = "turn_cap"
+
+
+class ProgressReporter(ABC):
+    def __init__(self, interval: float = 2.0):
+        self.interval = interval
+        self.start(0)
+
+    def start(self, total: int) -> None:
+        self.total = total
+        self.games = 0
+        self.turns = 0
+        self.capped = 0
+        self.wins: Dict[str, int] = {}
+        self.started = time.perf_counter()
+        self.reported = self.started
+
+    def add(self, chunk) -> None:
+        """Count a finished chunk; any stats object with tally() will do."""
+        games, turns, wins = chunk.tally()
+        self.games += games
+        self.turns += turns
+        for name, count in wins.items():
+            self.wins[name] = self.wins.get(name, 0) + count
+        outcomes = getattr(chunk, "outcomes", None)
+        if outcomes is None:
+            self.capped += wins.get(NO_WINNER, 0)
+        else:
+            self.capped += outcomes.get(CAP_OUTCOME, 0)
+        now = time.perf_counter()
+        if now - self.reported >= self.interval:
+            self.reported = now
+            self.report(self.snapshot(now), done=False)
+
+    def finish(self) -> None:
+        self.report(self.snapshot(time.perf_counter()), done=True)
+
+    def snapshot(self, now: float) -> Dict:
+        elapsed = now - self.started
+        games_per_second = self.games / elapsed if elapsed > 0 else 0.0
+        remaining = max(0, self.total - self.games)
+        return {
+            "games": self.games,
+            "total": self.total,
+            "elapsed": elapsed,
+            "games_per_second": games_per_second,
+            "turns_per_second": self.turns / elapsed if elapsed > 0 else 0.0,
+            "eta": remaining / games_per_second if games_per_second else None,
+            "win_rates": {
+                name: count / self.games for name, count in sorted(self.wins.items())
+            },
+            "turn_cap_share": self.capped / self.games if self.games else 0.0,
+        }
+
+    @abstractmethod
+    def report(self, snapshot: Dict, done: bool) -> None:
+        pass
+
+
+class SilentProgress(ProgressReporter):
+    def add(self, chunk) -> None:
+        pass
+
+    def finish(self) -> None:
+        pass
+
+    def report(self, snapshot: Dict, done: bool) -> None:
+        pass
+
+
+class TTYProgress(ProgressReporter):
+    def __init__(self, interval: float = 0.5, stream: Optional[TextIO] = None):
+        super().__init__(interval)
+        self.stream = stream or sys.stderr
+
+    def report(self, snapshot: Dict, done: bool) -> None:
+        eta = snapshot["eta"]
+        rates = "  ".join(
+            f"{name} {rate:.3f}"
+            for name, rate in snapshot["win_rates"].items()
+            if name != NO_WINNER
+        )
+        line = (
+            f"{snapshot['games']}/{snapshot['total']} games"
+            f"  {snapshot['games_per_second']:.1f} games/s"
+            f"  {snapshot['turns_per_second']:,.0f} turns/s"
+            f"  ETA {'-' if eta is None else f'{eta:.0f}s'}"
+            f"  capped {snapshot['turn_cap_share']:.1%}  {rates}"
+        )
+        self.stream.write(f"\r\x1b[K{line}" + ("\n" if done else ""))
+        self.stream.flush()
+
+
+class JSONLinesProgress(ProgressReporter):
+    def __init__(self, interval: float = 10.0, stream: Optional[TextIO] = None):
+        super().__init__(interval)
+        self.stream = stream or sys.stdout
+
+    def report(self, snapshot: Dict, done: bool) -> None:
+        self.stream.write(json.dumps({"done": done, **snapshot}) + "\n")
+        self.stream.flush()
+
+
+PROGRESS_REPORTERS = {
+    "none": SilentProgress,
+    "tty": TTYProgress,
+    "json": JSONLinesProgress,
+}
+
+
+def make_progress(kind: str, interval: Optional[float] = None) -> ProgressReporter:
+    """A reporter by its command-line name, with its default interval if none."""
+    reporter = PROGRESS_REPORTERS[kind]
+    return reporter() if interval is None else reporter(interval)
@@ -0,0 +1,404 @@
+"""Streaming statistics for Monte Carlo runs.
+
+WinStats takes one finished game at a time and keeps the win counts, a Wilson
+score interval for every win rate and the mean and variance of game length
+(Welford's algorithm), so a run can be summarised or stopped early without
+keeping per-game results. Two WinStats merge exactly, which is how the chunks
+played by separate worker processes are combined.
+"""
+
+import math
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Two-sided 95% normal quantile
+Z_95 = 1.959963984540054
+
+
+def wilson_interval(wins: int, games: int, z: float = Z_95) -> Tuple[float, float]:
+    """Wilson score interval for a win rate of wins / games."""
+    if games == 0:
+        return (0.0, 1.0)
+    rate = wins / games
+    denominator = 1 + z * z / games
+    centre = (rate + z * z / (2 * games)) / denominator
+    half_width = (
+        z * math.sqrt(rate * (1 - rate) / games + z * z / (4 * games * games))
+    ) / denominator
+    low = 0.0 if wins == 0 else max(0.0, centre - half_width)
+    high = 1.0 if wins == games else min(1.0, centre + half_width)
+    return (low, high)
+
+
+class RunningMoments:
+    """
+    Count, mean and variance of a stream of values (Welford). merge() combines
+    two streams with Chan's parallel update.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def merge(self, other: "RunningMoments") -> None:
+        if other.count == 0:
+            return
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std(self) -> float:
+        return math.sqrt(self.variance)
+
+
+class WinStats:
+    """
+    Win counts, win-rate intervals and game-length moments of a run.
+    Games nobody won (the turn cap, or a stalemate that is not adjudicated)
+    are tallied under "no_winner". How each game ended (sim.Outcome values) is
+    counted separately in `outcomes`.
+    """
+
+    def __init__(self, z: float = Z_95):
+        self.z = z
+        self.games = 0
+        self.win_count: Dict[str, int] = {}
+        self.outcomes: Dict[str, int] = {}
+        self.turns = RunningMoments()
+
+    def add(self, name: str, turns: int, outcome: Optional[str] = None) -> None:
+        self.games += 1
+        self.win_count[name] = self.win_count.get(name, 0) + 1
+        if outcome is not None:
+            self.outcomes[outcome] = self.outcomes.get(outcome, 0) + 1
+        self.turns.add(turns)
+
+    def merge(self, other: "WinStats") -> None:
+        self.games += other.games
+        for name, wins in other.win_count.items():
+            self.win_count[name] = self.win_count.get(name, 0) + wins
+        for outcome, count in other.outcomes.items():
+            self.outcomes[outcome] = self.outcomes.get(outcome, 0) + count
+        self.turns.merge(other.turns)
+
+    def tally(self) -> Tuple[int, int, Dict[str, int]]:
+        """Games, turns played and wins by name, for progress reporting."""
+        return self.games, round(self.turns.count * self.turns.mean), self.win_count
+
+    def to_dict(self) -> Dict:
+        return {
+            "games": self.games,
+            "win_count": self.win_count,
+            "outcomes": self.outcomes,
+            "turns": [self.turns.count, self.turns.mean, self.turns.m2],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "WinStats":
+        stats = cls()
+        stats.games = data["games"]
+        stats.win_count = dict(data["win_count"])
+        stats.outcomes = dict(data.get("outcomes", {}))
+        stats.turns.count, stats.turns.mean, stats.turns.m2 = data["turns"]
+        return stats
+
+    def win_rate(self, name: str) -> float:
+        return self.win_count.get(name, 0) / self.games if self.games else 0.0
+
+    def interval(self, name: str) -> Tuple[float, float]:
+        return wilson_interval(self.win_count.get(name, 0), self.games, self.z)
+
+    def half_width(self, name: str) -> float:
+        low, high = self.interval(name)
+        return (high - low) / 2
+
+    def converged(self, epsilon: float, names: Iterable[str]) -> bool:
+        """True once every named win rate is known to within +/- epsilon."""
+        return self.games > 0 and all(self.half_width(name) < epsilon for name in names)
+
+    def summary(self) -> Dict:
+        return {
+            "games": self.games,
+            "win_rates": {
+                name: {
+                    "wins": wins,
+                    "rate": self.win_rate(name),
+                    "interval": self.interval(name),
+                }
+                for name, wins in self.win_count.items()
+            },
+            "outcomes": self.outcomes,
+            "turns_mean": self.turns.mean,
+            "turns_std": self.turns.std,
+        }
+
+
+class PairedStats:
+    """
+    Outcomes of the same games played by two variants, A and B, on the same
+    seeds. For every outcome name the per-game difference [A won] - [B won]
+    is tracked, so its interval only carries the noise the variants do not
+    share. The interval of two independent runs of the same size is kept
+    alongside for comparison.
+    """
+
+    def __init__(self, names: Iterable[str], z: float = Z_95):
+        self.z = z
+        self.a = WinStats(z)
+        self.b = WinStats(z)
+        self.differences = {name: RunningMoments() for name in names}
+
+    @property
+    def games(self) -> int:
+        return self.a.games
+
+    def add(self, name_a: str, turns_a: int, name_b: str, turns_b: int) -> None:
+        self.a.add(name_a, turns_a)
+        self.b.add(name_b, turns_b)
+        for name, moments in self.differences.items():
+            moments.add((name == name_a) - (name == name_b))
+
+    def merge(self, other: "PairedStats") -> None:
+        self.a.merge(other.a)
+        self.b.merge(other.b)
+        for name, moments in self.differences.items():
+            moments.merge(other.differences[name])
+
+    def tally(self) -> Tuple[int, int, Dict[str, int]]:
+        """Progress follows roster A."""
+        return self.a.tally()
+
+    def difference(self, name: str) -> float:
+        return self.differences[name].mean
+
+    def half_width(self, name: str) -> float:
+        moments = self.differences[name]
+        if moments.count < 2:
+            return math.inf
+        return self.z * moments.std / math.sqrt(moments.count)
+
+    def interval(self, name: str) -> Tuple[float, float]:
+        half_width = self.half_width(name)
+        return (self.difference(name) - half_width, self.difference(name) + half_width)
+
+    def independent_half_width(self, name: str) -> float:
+        """Half-width the difference would have with two independent runs."""
+        if self.games == 0:
+            return math.inf
+        rate_a, rate_b = self.a.win_rate(name), self.b.win_rate(name)
+        variance = rate_a * (1 - rate_a) + rate_b * (1 - rate_b)
+        return self.z * math.sqrt(variance / self.games)
+
+    def variance_ratio(self, name: str) -> float:
+        """How many times fewer games pairing needs for the same precision."""
+        paired = self.half_width(name)
+        if paired == 0:
+            return math.inf
+        return (self.independent_half_width(name) / paired) ** 2
+
+    def converged(self, epsilon: float, names: Iterable[str]) -> bool:
+        """True once every named difference is known to within +/- epsilon."""
+        return self.games > 0 and all(self.half_width(name) < epsilon for name in names)
+
+    def summary(self) -> Dict:
+        return {
+            "games": self.games,
+            "differences": {
+                name: {
+                    "rate_a": self.a.win_rate(name),
+                    "rate_b": self.b.win_rate(name),
+                    "difference": self.difference(name),
+                    "interval": self.interval(name),
+                    "independent_half_width": self.independent_half_width(name),
+                    "variance_ratio": self.variance_ratio(name),
+                }
+                for name in self.differences
+            },
+        }
+
+
+def solve(matrix: List[List[float]], vector: List[float]) -> List[float]:
+    """Solve matrix @ x = vector by Gaussian elimination with partial pivoting."""
+    size = len(vector)
+    rows = [list(row) + [value] for row, value in zip(matrix, vector)]
+    for column in range(size):
+        pivot = max(range(column, size), key=lambda r: abs(rows[r][column]))
+        rows[column], rows[pivot] = rows[pivot], rows[column]
+        if abs(rows[column][column]) < 1e-12:
+            # Covariate that never varied; give it no weight
+            rows[column] = [0.0] * column + [1.0] + [0.0] * (size - column)
+            continue
+        for r in range(column + 1, size):
+            factor = rows[r][column] / rows[column][column]
+            for c in range(column, size + 1):
+                rows[r][c] -= factor * rows[column][c]
+    solution = [0.0] * size
+    for r in reversed(range(size)):
+        tail = sum(rows[r][c] * solution[c] for c in range(r + 1, size))
+        solution[r] = (rows[r][size] - tail) / rows[r][r]
+    return solution
+
+
+class ControlVariateStats:
+    """
+    Win rates adjusted with control variates: per-game covariates whose true
+    mean is known to be zero. Regressing each win indicator on them removes
+    the part of its variance that the covariates explain, i.e. how lucky the
+    game was rather than how good the strategy is:
+
+        rate = mean(won) - beta . mean(covariates)
+
+    Only sums and cross-products are kept, so chunks merge exactly. The gain
+    is reported as the effective-sample-size factor var(won) / var(residual).
+    """
+
+    def __init__(self, names: Iterable[str], covariates: int, z: float = Z_95):
+        self.z = z
+        self.names = list(names)
+        self.k = covariates
+        self.games = 0
+        self.turns = RunningMoments()
+        self.sum_c = [0.0] * covariates
+        self.sum_cc = [[0.0] * covariates for _ in range(covariates)]
+        self.sum_y = {name: 0.0 for name in self.names}
+        self.sum_yc = {name: [0.0] * covariates for name in self.names}
+
+    def add(self, name: str, turns: int, covariates: List[float]) -> None:
+        self.games += 1
+        self.turns.add(turns)
+        for i, c_i in enumerate(covariates):
+            self.sum_c[i] += c_i
+            row = self.sum_cc[i]
+            for j, c_j in enumerate(covariates):
+                row[j] += c_i * c_j
+        if name in self.sum_y:
+            self.sum_y[name] += 1
+            row = self.sum_yc[name]
+            for i, c_i in enumerate(covariates):
+                row[i] += c_i
+
+    def merge(self, other: "ControlVariateStats") -> None:
+        self.games += other.games
+        self.turns.merge(other.turns)
+        for i in range(self.k):
+            self.sum_c[i] += other.sum_c[i]
+            for j in range(self.k):
+                self.sum_cc[i][j] += other.sum_cc[i][j]
+        for name in self.names:
+            self.sum_y[name] += other.sum_y[name]
+            for i in range(self.k):
+                self.sum_yc[name][i] += other.sum_yc[name][i]
+
+    def win_rate(self, name: str) -> float:
+        return self.sum_y[name] / self.games if self.games else 0.0
+
+    def tally(self) -> Tuple[int, int, Dict[str, int]]:
+        wins = {name: round(self.sum_y[name]) for name in self.names}
+        return self.games, round(self.turns.count * self.turns.mean), wins
+
+    def fit(self, name: str) -> Tuple[float, float, float]:
+        """Adjusted rate, its standard error, and the plain rate's standard error."""
+        n = self.games
+        if n <= self.k + 1:
+            return self.win_rate(name), math.inf, math.inf
+        mean_c = [s / n for s in self.sum_c]
+        mean_y = self.sum_y[name] / n
+        cov_cc = [
+            [self.sum_cc[i][j] - n * mean_c[i] * mean_c[j] for j in range(self.k)]
+            for i in range(self.k)
+        ]
+        cov_cy = [self.sum_yc[name][i] - n * mean_c[i] * mean_y for i in range(self.k)]
+        beta = solve(cov_cc, cov_cy)
+        ss_y = self.sum_y[name] - n * mean_y * mean_y
+        ss_residual = max(0.0, ss_y - sum(b * c for b, c in zip(beta, cov_cy)))
+        adjusted = mean_y - sum(b * c for b, c in zip(beta, mean_c))
+        residual_se = math.sqrt(ss_residual / (n - self.k - 1) / n)
+        plain_se = math.sqrt(ss_y / (n - 1) / n)
+        return adjusted, residual_se, plain_se
+
+    def interval(self, name: str) -> Tuple[float, float]:
+        adjusted, se, _ = self.fit(name)
+        return (adjusted - self.z * se, adjusted + self.z * se)
+
+    def half_width(self, name: str) -> float:
+        return self.z * self.fit(name)[1]
+
+    def ess_gain(self, name: str) -> float:
+        """How many plain games each game is worth after the adjustment."""
+        _, se, plain_se = self.fit(name)
+        if se == 0:
+            return math.inf
+        return (plain_se / se) ** 2
+
+    def converged(self, epsilon: float, names: Iterable[str]) -> bool:
+        return self.games > 0 and all(self.half_width(name) < epsilon for name in names)
+
+    def summary(self) -> Dict:
+        summary = {"games": self.games, "win_rates": {}}
+        for name in self.names:
+            adjusted, se, plain_se = self.fit(name)
+            summary["win_rates"][name] = {
+                "rate": self.win_rate(name),
+                "adjusted_rate": adjusted,
+                "interval": self.interval(name),
+                "plain_half_width": self.z * plain_se,
+                "ess_gain": self.ess_gain(name),
+            }
+        return summary
+
+
+def mann_whitney_less(a: List[float], b: List[float]) -> float:
+    """
+    One-sided Mann-Whitney U test that values in `a` tend to be smaller than
+    values in `b`; returns the p-value. Exact for small samples without ties,
+    otherwise the normal approximation with midranks.
+    """
+    m, n = len(a), len(b)
+    if not m or not n:
+        return 1.0
+    # U counts the (a, b) pairs with a < b, ties counting a half
+    u = sum((x < y) + 0.5 * (x == y) for x in a for y in b)
+    if m + n <= 30 and len(set(a) | set(b)) == m + n:
+        # counts[k] = orderings of m a's and n b's with k pairs a < b
+        counts = [[1] + [0] * (m * n) for _ in range(n + 1)]
+        for i in range(1, m + 1):
+            previous = counts
+            counts = [[1 if k == 0 else 0 for k in range(m * n + 1)]]
+            for j in range(1, n + 1):
+                # The largest value is either an a (beating no b) or a b
+                # (beaten by all i a's)
+                row = [
+                    previous[j][k] + (counts[j - 1][k - i] if k >= i else 0)
+                    for k in range(m * n + 1)
+                ]
+                counts.append(row)
+        total = math.comb(m + n, m)
+        return sum(counts[n][math.ceil(u) :]) / total
+    mean = m * n / 2
+    values = sorted(a + b)
+    ties = 0
+    start = 0
+    while start < len(values):
+        stop = start
+        while stop < len(values) and values[stop] == values[start]:
+            stop += 1
+        ties += (stop - start) ** 3 - (stop - start)
+        start = stop
+    variance = m * n / 12 * ((m + n + 1) - ties / ((m + n) * (m + n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - mean - 0.5) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
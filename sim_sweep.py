@@ -0,0 +1,292 @@
+"""Strategy sweeps over player rosters.
+
+A sweep file (JSON, or TOML) names a roster and the player parameters to vary:
+
+    {
+        "runs": 1000,
+        "seed": 1,
+        "method": "grid",
+        "roster": "roster.json",
+        "parameters": {
+            "Player 1.w_buy_building": [0.2, 0.5, 0.8],
+            "Player 2.min_cash": [100, 200, 400]
+        }
+    }
+
+"grid" plays every combination of the listed values. "lhs" draws `samples`
+cells from a Latin hypercube over {"low": ..., "high": ...} ranges; a range
+with integer bounds gives integer values. The roster is a file or an inline
+list of Player keyword arguments, and defaults to sim.DEFAULT_ROSTER. An
+optional "game" table sets sim.Game options such as "max_turns" and
+"stalemate_window".
+
+Every cell is cut into chunks of games and all chunks of all cells share one
+process pool, with only a few chunks per worker in flight at a time. All cells
+use the same seed, so they are played on the same dice. The results come back
+as one table with a row per cell and outcome. With --cache, results are kept
+in a sim_cache.ResultCache and a rerun only plays the games it is missing:
+
+    python sim_sweep.py sweep.json --workers 32 --out results.csv --cache cache
+"""
+
+import argparse
+import csv
+import itertools
+import json
+import os
+import random
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, List, Optional, Sequence
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    tomllib = None
+
+from sim import DEFAULT_ROSTER, Game, MonteCarloSimulation, Outcome
+from sim_cache import ResultCache
+from sim_progress import (
+    PROGRESS_REPORTERS,
+    ProgressReporter,
+    SilentProgress,
+    make_progress,
+)
+from sim_stats import WinStats
+
+
+def load_file(path: str):
+    if path.endswith(".toml"):
+        if tomllib is None:
+            raise RuntimeError("Reading TOML needs Python 3.11 or newer")
+        with open(path, "rb") as f:
+            return tomllib.load(f)
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def load_roster(spec=None, base_dir: str = ".") -> List[Dict]:
+    """
+    A roster is a list of Player keyword-argument dicts, given inline, as a
+    path to a JSON/TOML file (a list, or a table with a "players" list), or
+    omitted for DEFAULT_ROSTER.
+    """
+    if spec is None:
+        spec = DEFAULT_ROSTER
+    elif isinstance(spec, str):
+        spec = load_file(os.path.join(base_dir, spec))
+    if isinstance(spec, dict):
+        spec = spec["players"]
+    return [dict(player) for player in spec]
+
+
+def expand_grid(parameters: Dict[str, Sequence]) -> List[Dict]:
+    names = list(parameters)
+    return [
+        dict(zip(names, values))
+        for values in itertools.product(*(parameters[name] for name in names))
+    ]
+
+
+def latin_hypercube(parameters: Dict[str, Dict], samples: int, seed) -> List[Dict]:
+    """One value per stratum of every range, with the strata paired at random."""
+    rng = random.Random(f"{seed}/lhs")
+    cells = [{} for _ in range(samples)]
+    for name, bounds in parameters.items():
+        low, high = bounds["low"], bounds["high"]
+        strata = list(range(samples))
+        rng.shuffle(strata)
+        for cell, stratum in zip(cells, strata):
+            value = low + (stratum + rng.random()) / samples * (high - low)
+            if isinstance(low, int) and isinstance(high, int):
+                value = min(high, int(value))
+            cell[name] = value
+    return cells
+
+
+def apply_cell(roster: List[Dict], cell: Dict) -> List[Dict]:
+    """Copy the roster with the cell's "<player name>.<parameter>" values set."""
+    players = {player["name"]: dict(player) for player in roster}
+    for key, value in cell.items():
+        name, _, parameter = key.rpartition(".")
+        if name not in players:
+            raise ValueError(f"Sweep parameter {key} names no player in the roster")
+        players[name][parameter] = value
+    return list(players.values())
+
+
+class Sweep:
+    def __init__(
+        self,
+        roster: List[Dict],
+        cells: List[Dict],
+        runs: int,
+        seed,
+        chunk_size: int = 100,
+        game_class=Game,
+        game_options: Optional[Dict] = None,
+    ):
+        self.roster = roster
+        self.cells = cells
+        self.runs = runs
+        self.seed = seed
+        self.chunk_size = chunk_size
+        self.simulations = [
+            MonteCarloSimulation(
+                runs,
+                game_class=game_class,
+                seed=seed,
+                roster=apply_cell(roster, cell),
+                game_options=game_options,
+            )
+            for cell in cells
+        ]
+
+    @classmethod
+    def from_config(cls, config: Dict, base_dir: str = ".") -> "Sweep":
+        roster = load_roster(config.get("roster"), base_dir)
+        seed = config.get("seed", 0)
+        method = config.get("method", "grid")
+        parameters = config.get("parameters", {})
+        if method == "grid":
+            cells = expand_grid(parameters)
+        elif method == "lhs":
+            cells = latin_hypercube(parameters, config["samples"], seed)
+        else:
+            raise ValueError(f"Unknown sweep method: {method}")
+        return cls(
+            roster,
+            cells,
+            runs=config.get("runs", 1000),
+            seed=seed,
+            chunk_size=config.get("chunk_size", 100),
+            game_options=config.get("game"),
+        )
+
+    def run(
+        self,
+        workers: int = 1,
+        cache: Optional[ResultCache] = None,
+        progress: Optional[ProgressReporter] = None,
+    ) -> List[WinStats]:
+        """
+        Play every cell and return its statistics, in cell order. With a
+        cache, stored ranges of games are loaded and only the rest is played.
+        """
+        progress = progress or SilentProgress()
+        progress.start(len(self.cells) * self.runs)
+        chunks: Dict = {}
+        keys = [cache.cell_key(sim) for sim in self.simulations] if cache else []
+        tasks = []
+        for cell_index in range(len(self.cells)):
+            gaps = [(0, self.runs)]
+            if cache:
+                hits, gaps = cache.plan(keys[cell_index], 0, self.runs)
+                for start, stop in hits:
+                    chunks[cell_index, start] = cache.load(
+                        keys[cell_index], start, stop
+                    )
+                    progress.add(chunks[cell_index, start])
+            for gap_start, gap_stop in gaps:
+                for start in range(gap_start, gap_stop, self.chunk_size):
+                    stop = min(start + self.chunk_size, gap_stop)
+                    tasks.append((cell_index, start, stop))
+
+        def finished(cell_index: int, start: int, stop: int, stats: WinStats):
+            chunks[cell_index, start] = stats
+            progress.add(stats)
+            if cache:
+                cache.store(keys[cell_index], start, stop, stats)
+
+        if workers <= 1:
+            for cell_index, start, stop in tasks:
+                simulation = self.simulations[cell_index]
+                finished(cell_index, start, stop, simulation.run_chunk(start, stop))
+        else:
+            task_iter = iter(tasks)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                pending = {}
+
+                def submit(count: int) -> None:
+                    for task in itertools.islice(task_iter, count):
+                        simulation = self.simulations[task[0]]
+                        future = executor.submit(simulation.run_chunk, *task[1:])
+                        pending[future] = task
+
+                submit(workers * 4)
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        finished(*pending.pop(future), future.result())
+                    submit(len(done))
+        progress.finish()
+        if cache:
+            cache.evict()
+
+        # Merge in game order so the result does not depend on scheduling
+        results = [WinStats() for _ in self.cells]
+        for cell_index, start in sorted(chunks):
+            results[cell_index].merge(chunks[cell_index, start])
+        return results
+
+    def table(self, results: List[WinStats]) -> List[Dict]:
+        """
+        One row per cell and outcome, every player plus "no_winner", each with
+        the cell's game count per sim.Outcome.
+        """
+        names = [player["name"] for player in self.roster] + ["no_winner"]
+        rows = []
+        for cell_index, (cell, stats) in enumerate(zip(self.cells, results)):
+            for name in names:
+                low, high = stats.interval(name)
+                rows.append(
+                    {
+                        "cell": cell_index,
+                        **cell,
+                        "player": name,
+                        "games": stats.games,
+                        "wins": stats.win_count.get(name, 0),
+                        "win_rate": stats.win_rate(name),
+                        "ci_low": low,
+                        "ci_high": high,
+                        **{
+                            outcome.value: stats.outcomes.get(outcome.value, 0)
+                            for outcome in Outcome
+                        },
+                        "turns_mean": stats.turns.mean,
+                        "turns_std": stats.turns.std,
+                    }
+                )
+        return rows
+
+
+def write_table(rows: List[Dict], f) -> None:
+    if not rows:
+        return
+    writer = csv.DictWriter(f, fieldnames=list(rows[0]))
+    writer.writeheader()
+    writer.writerows(rows)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Run a strategy sweep.")
+    parser.add_argument("config", help="sweep file, .json or .toml")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--out", default="sweep_results.csv", help="CSV output file")
+    parser.add_argument("--cache", help="result cache directory (default: none)")
+    parser.add_argument("--cache-mb", type=int, default=256)
+    parser.add_argument("--progress", choices=PROGRESS_REPORTERS, default="tty")
+    args = parser.parse_args(argv)
+
+    config = load_file(args.config)
+    sweep = Sweep.from_config(config, os.path.dirname(args.config) or ".")
+    cache = ResultCache(args.cache, args.cache_mb * 2**20) if args.cache else None
+    results = sweep.run(
+        workers=args.workers, cache=cache, progress=make_progress(args.progress)
+    )
+    rows = sweep.table(results)
+    with open(args.out, "w", newline="", encoding="utf-8") as f:
+        write_table(rows, f)
+
+
+if __name__ == "__main__":
+    main()
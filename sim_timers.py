@@ -0,0 +1,256 @@
+"""Per-phase timers for Game.play_turn.
+
+While `instrument()` is active, the methods behind each phase of a turn are
+replaced on the Game and Player classes by wrappers that add
+time.perf_counter_ns intervals and a call count to preallocated counters:
+
+    turn        play_turn itself: movement, doubles and bookkeeping
+    dice        roll_dice
+    jail        attempt_jail_break
+    landing     the handle_*_landing dispatch, buying included
+    cards       resolve_card_effect and the apply_*_card handlers
+    pay         Player.pay, rent, tax and card payments
+    raise_fund  Player.raise_fund, selling houses and mortgaging to pay
+    unmortgage  Player.unmortgage_properties
+    build       Player.buy_houses_and_hotels
+
+Outside the context the classes are untouched, so a run without timers pays
+nothing for them. Phases nest (a card moves the player, the landing charges
+rent, the rent needs a mortgage), so each phase keeps both its inclusive
+time and its self time with the nested phases taken out; the self times add
+up to the time spent in play_turn. What the wrappers themselves cost the
+caller is measured once per instrument() and charged to the nested phase,
+so it does not swell the self time of the outer ones (the inclusive times
+still hold it). Games must be created inside the context,
+since Game binds its landing and card handlers when it is built.
+
+TimedSimulation times every chunk in the process that plays it and returns
+TimedStats, whose PhaseTimes merge across worker processes like the win
+counts do:
+
+    python sim_timers.py --runs 500 --workers 4
+"""
+
+import argparse
+import fnmatch
+import functools
+import json
+import os
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+from sim import Game, MonteCarloSimulation, Player
+from sim_stats import WinStats
+
+# phase -> (class it lives on, method name patterns)
+PHASE_METHODS = {
+    "turn": ("game", ("play_turn",)),
+    "dice": ("game", ("roll_dice",)),
+    "jail": ("game", ("attempt_jail_break",)),
+    "landing": ("game", ("handle_*_landing",)),
+    "cards": ("game", ("resolve_card_effect", "apply_*_card")),
+    "pay": ("player", ("pay",)),
+    "raise_fund": ("player", ("raise_fund",)),
+    "unmortgage": ("player", ("unmortgage_properties",)),
+    "build": ("player", ("buy_houses_and_hotels",)),
+}
+PHASES = tuple(PHASE_METHODS)
+
+
+class PhaseTimes:
+    """Call counts and nanoseconds per phase, indexed like PHASES."""
+
+    def __init__(self):
+        self.calls = [0] * len(PHASES)
+        self.total_ns = [0] * len(PHASES)
+        self.self_ns = [0] * len(PHASES)
+        # Time of the nested phases of each phase call in progress
+        self.nested = []
+        # What timing a nested call costs its caller outside the nested
+        # call's own interval; see calibrate()
+        self.overhead_ns = 0
+
+    def timed(self, function, index: int):
+        calls = self.calls
+        total_ns = self.total_ns
+        self_ns = self.self_ns
+        nested = self.nested
+        overhead_ns = self.overhead_ns
+        clock = time.perf_counter_ns
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            nested.append(0)
+            started = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = clock() - started
+                inner = nested.pop()
+                calls[index] += 1
+                total_ns[index] += elapsed
+                self_ns[index] += elapsed - inner
+                if nested:
+                    nested[-1] += elapsed + overhead_ns
+
+        return wrapper
+
+    def calibrate(self, calls: int = 5000, rounds: int = 3) -> None:
+        """
+        Set overhead_ns from a loop of timed no-ops against a loop of plain
+        ones, both timed as a phase; the best of `rounds`.
+        """
+
+        def no_op():
+            pass
+
+        costs = []
+        for _ in range(rounds):
+            probe = PhaseTimes()
+            timed_no_op = probe.timed(no_op, 1)
+
+            def plain():
+                for _ in range(calls):
+                    no_op()
+
+            def timed():
+                for _ in range(calls):
+                    timed_no_op()
+
+            probe.timed(plain, 0)()
+            plain_ns = probe.self_ns[0]
+            probe.timed(timed, 0)()
+            costs.append(probe.self_ns[0] - 2 * plain_ns)
+        self.overhead_ns = max(0, min(costs) // calls)
+
+    def merge(self, other: "PhaseTimes") -> None:
+        for index in range(len(PHASES)):
+            self.calls[index] += other.calls[index]
+            self.total_ns[index] += other.total_ns[index]
+            self.self_ns[index] += other.self_ns[index]
+
+    def to_dict(self) -> Dict:
+        return {
+            phase: [self.calls[i], self.total_ns[i], self.self_ns[i]]
+            for i, phase in enumerate(PHASES)
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "PhaseTimes":
+        times = cls()
+        for i, phase in enumerate(PHASES):
+            times.calls[i], times.total_ns[i], times.self_ns[i] = data.get(
+                phase, (0, 0, 0)
+            )
+        return times
+
+    def table(self) -> str:
+        """A row per phase: calls, inclusive and self time, share of the turn."""
+        turn_ns = sum(self.self_ns) or 1
+        lines = [
+            f"{'phase':<11}{'calls':>11}{'total ms':>11}{'self ms':>11}"
+            f"{'self %':>8}{'ns/call':>9}"
+        ]
+        for i, phase in enumerate(PHASES):
+            per_call = self.self_ns[i] / self.calls[i] if self.calls[i] else 0
+            lines.append(
+                f"{phase:<11}{self.calls[i]:>11,}{self.total_ns[i] / 1e6:>11.1f}"
+                f"{self.self_ns[i] / 1e6:>11.1f}{self.self_ns[i] / turn_ns:>8.1%}"
+                f"{per_call:>9.0f}"
+            )
+        return "\n".join(lines)
+
+
+@contextmanager
+def instrument(game_class=Game, player_class=Player, times=None):
+    """
+    Time the phases of every game_class game created inside the block;
+    yields the PhaseTimes being filled. The classes are restored on exit.
+    """
+    if times is None:
+        times = PhaseTimes()
+        times.calibrate()
+    owners = {"game": game_class, "player": player_class}
+    patched = []
+    try:
+        for index, (phase, (owner, patterns)) in enumerate(PHASE_METHODS.items()):
+            cls = owners[owner]
+            for name in dir(cls):
+                if not any(fnmatch.fnmatchcase(name, p) for p in patterns):
+                    continue
+                function = getattr(cls, name)
+                if not callable(function):
+                    continue
+                patched.append((cls, name, cls.__dict__.get(name)))
+                setattr(cls, name, times.timed(function, index))
+        yield times
+    finally:
+        for cls, name, original in reversed(patched):
+            if original is None:
+                # Inherited: drop the wrapper so the base method shows again
+                delattr(cls, name)
+            else:
+                setattr(cls, name, original)
+
+
+class TimedStats(WinStats):
+    """WinStats with the PhaseTimes of the games behind them."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.phases = PhaseTimes()
+
+    def merge(self, other: "TimedStats") -> None:
+        super().merge(other)
+        self.phases.merge(other.phases)
+
+    def to_dict(self) -> Dict:
+        return {**super().to_dict(), "phases": self.phases.to_dict()}
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "TimedStats":
+        stats = super().from_dict(data)
+        stats.phases = PhaseTimes.from_dict(data.get("phases", {}))
+        return stats
+
+
+class TimedSimulation(MonteCarloSimulation):
+    """MonteCarloSimulation that times the phases of every turn it plays."""
+
+    def __init__(self, *args, player_class=Player, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.player_class = player_class
+
+    def new_stats(self) -> TimedStats:
+        return TimedStats()
+
+    def run_chunk(self, start: int, stop: int) -> TimedStats:
+        # Instrumented in the process that plays the chunk, so the counters
+        # travel back with its stats
+        with instrument(self.game_class, self.player_class) as times:
+            stats = super().run_chunk(start, stop)
+        stats.phases.merge(times)
+        return stats
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Time the phases of a turn.")
+    parser.add_argument("--runs", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--out", help="also write the merged stats as JSON")
+    args = parser.parse_args(argv)
+
+    simulation = TimedSimulation(args.runs, seed=args.seed)
+    stats = simulation.play_all(workers=args.workers)
+    turns = round(stats.turns.count * stats.turns.mean)
+    print(f"{stats.games} games, {turns:,} turns")
+    print(stats.phases.table())
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(stats.to_dict(), f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,320 @@
+"""Seat-rotated round-robin tournaments between strategies.
+
+A pool of M strategies (Player keyword arguments, each with a unique name)
+is played at 2-, 3- or 4-player tables. Every table that is scheduled is
+played in all k! seat orders, so each strategy moves first as often as it
+moves last. The schedule is a generator: "full" walks every combination of
+the pool in order, "sample" draws `tables` random combinations, so a pool of
+50+ strategies is never expanded in memory. Tables are handed to a process
+pool in batches, with a few batches per worker in flight.
+
+Seat advantage is measured from the results themselves: p(k, seat) is the
+win rate of seat `seat` at k-player tables over the whole tournament. Each
+strategy's seat-corrected win rate removes the advantage or handicap of the
+seats it happened to sit in:
+
+    corrected = raw - mean p(k, seat) over its games + mean p(k) over its games
+
+On a full schedule every strategy sits in every seat equally often and the
+correction is zero; on a sample it corrects the imbalance.
+
+As with MonteCarloSimulation, game_options go to every game (turn cap,
+stalemate window, ...) and a sim_progress reporter is fed every finished
+batch:
+
+    python sim_tournament.py pool.json --sizes 4 --sample 2000 --workers 32
+"""
+
+import argparse
+import itertools
+import math
+import os
+import random
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from sim import Game, GameRNG, Player
+from sim_progress import (
+    PROGRESS_REPORTERS,
+    ProgressReporter,
+    SilentProgress,
+    make_progress,
+)
+from sim_sweep import load_roster
+
+Table = Tuple[int, ...]
+
+
+def full_schedule(strategies: int, sizes: Sequence[int]) -> Iterator[Table]:
+    for size in sizes:
+        for combination in itertools.combinations(range(strategies), size):
+            yield from itertools.permutations(combination)
+
+
+def sampled_schedule(
+    strategies: int, sizes: Sequence[int], tables: int, seed
+) -> Iterator[Table]:
+    """`tables` random combinations, each in every seat order."""
+    rng = random.Random(f"{seed}/schedule")
+    for _ in range(tables):
+        combination = rng.sample(range(strategies), rng.choice(sizes))
+        yield from itertools.permutations(combination)
+
+
+class TournamentStats:
+    def __init__(self, names: Sequence[str]):
+        self.names = list(names)
+        strategies = len(self.names)
+        self.games = [0] * strategies
+        self.wins = [0] * strategies
+        # (table size, seat) -> count, per strategy and over all strategies
+        self.seat_games: List[Dict[Tuple[int, int], int]] = [
+            {} for _ in range(strategies)
+        ]
+        self.seats_played: Dict[Tuple[int, int], int] = {}
+        self.seats_won: Dict[Tuple[int, int], int] = {}
+        self.no_winner = 0
+        # Over all games, for progress reporting
+        self.played = 0
+        self.turns = 0
+        self.outcomes: Dict[str, int] = {}
+
+    def add(
+        self,
+        table: Table,
+        winner_seat: Optional[int],
+        turns: int = 0,
+        outcome: Optional[str] = None,
+    ) -> None:
+        size = len(table)
+        self.played += 1
+        self.turns += turns
+        if outcome is not None:
+            self.outcomes[outcome] = self.outcomes.get(outcome, 0) + 1
+        for seat, strategy in enumerate(table):
+            key = (size, seat)
+            self.games[strategy] += 1
+            self.seat_games[strategy][key] = self.seat_games[strategy].get(key, 0) + 1
+            self.seats_played[key] = self.seats_played.get(key, 0) + 1
+        if winner_seat is None:
+            self.no_winner += 1
+            return
+        self.wins[table[winner_seat]] += 1
+        key = (size, winner_seat)
+        self.seats_won[key] = self.seats_won.get(key, 0) + 1
+
+    def merge(self, other: "TournamentStats") -> None:
+        for strategy in range(len(self.games)):
+            self.games[strategy] += other.games[strategy]
+            self.wins[strategy] += other.wins[strategy]
+            mine = self.seat_games[strategy]
+            for key, count in other.seat_games[strategy].items():
+                mine[key] = mine.get(key, 0) + count
+        for key, count in other.seats_played.items():
+            self.seats_played[key] = self.seats_played.get(key, 0) + count
+        for key, count in other.seats_won.items():
+            self.seats_won[key] = self.seats_won.get(key, 0) + count
+        self.no_winner += other.no_winner
+        self.played += other.played
+        self.turns += other.turns
+        for outcome, count in other.outcomes.items():
+            self.outcomes[outcome] = self.outcomes.get(outcome, 0) + count
+
+    def tally(self) -> Tuple[int, int, Dict[str, int]]:
+        """Games, turns played and wins by name, for progress reporting."""
+        wins = dict(zip(self.names, self.wins))
+        wins["no_winner"] = self.no_winner
+        return self.played, self.turns, wins
+
+    def seat_rate(self, key: Tuple[int, int]) -> float:
+        played = self.seats_played.get(key, 0)
+        return self.seats_won.get(key, 0) / played if played else 0.0
+
+    def size_rate(self, size: int) -> float:
+        rates = [self.seat_rate((size, seat)) for seat in range(size)]
+        return sum(rates) / size
+
+    def corrected_rate(self, strategy: int) -> float:
+        games = self.games[strategy]
+        if not games:
+            return 0.0
+        seat_expected = sum(
+            count * self.seat_rate(key)
+            for key, count in self.seat_games[strategy].items()
+        )
+        size_expected = sum(
+            count * self.size_rate(key[0])
+            for key, count in self.seat_games[strategy].items()
+        )
+        return (self.wins[strategy] - seat_expected + size_expected) / games
+
+
+class Tournament:
+    def __init__(
+        self,
+        pool: List[Dict],
+        sizes: Sequence[int] = (4,),
+        games_per_table: int = 1,
+        sample: Optional[int] = None,
+        seed=0,
+        batch_size: int = 32,
+        game_class=Game,
+        game_options: Optional[Dict] = None,
+    ):
+        names = [strategy["name"] for strategy in pool]
+        if len(set(names)) != len(names):
+            raise ValueError("Strategy names in a tournament pool must be unique")
+        if max(sizes) > min(4, len(pool)) or min(sizes) < 2:
+            raise ValueError("Table sizes must be between 2 and min(4, pool size)")
+        self.pool = pool
+        self.sizes = sizes
+        self.games_per_table = games_per_table
+        self.sample = sample
+        self.seed = seed
+        self.batch_size = batch_size
+        self.game_class = game_class
+        self.game_options = game_options or {}
+
+    def schedule(self) -> Iterator[Table]:
+        if self.sample is None:
+            return full_schedule(len(self.pool), self.sizes)
+        return sampled_schedule(len(self.pool), self.sizes, self.sample, self.seed)
+
+    def total_games(self) -> int:
+        if self.sample is None:
+            tables = sum(math.perm(len(self.pool), size) for size in self.sizes)
+        else:
+            # Sampled sizes vary; the schedule is only `sample` tables long
+            tables = sum(1 for _ in self.schedule())
+        return tables * self.games_per_table
+
+    def batches(self) -> Iterator[List[Tuple[int, Table]]]:
+        """Numbered tables in batches; table n plays from game n * games_per_table."""
+        numbered = enumerate(self.schedule())
+        while True:
+            batch = list(itertools.islice(numbered, self.batch_size))
+            if not batch:
+                return
+            yield batch
+
+    def new_stats(self) -> TournamentStats:
+        return TournamentStats([strategy["name"] for strategy in self.pool])
+
+    def play_batch(self, batch: List[Tuple[int, Table]]) -> TournamentStats:
+        stats = self.new_stats()
+        for number, table in batch:
+            players = [Player(**self.pool[strategy]) for strategy in table]
+            game = self.game_class(
+                *players, rng=GameRNG(self.seed), **self.game_options
+            )
+            for offset in range(self.games_per_table):
+                game.reset(self.seed, number * self.games_per_table + offset)
+                winner = game.simulate_game()
+                stats.add(
+                    table,
+                    players.index(winner) if winner else None,
+                    game.turn_count,
+                    game.outcome.value,
+                )
+        return stats
+
+    def run(
+        self, workers: int = 1, progress: Optional[ProgressReporter] = None
+    ) -> TournamentStats:
+        """
+        Play the schedule; progress, e.g. sim_progress.TTYProgress(), is fed
+        every finished batch.
+        """
+        progress = progress or SilentProgress()
+        progress.start(self.total_games())
+        stats = self.new_stats()
+
+        def finished(batch_stats: TournamentStats) -> None:
+            stats.merge(batch_stats)
+            progress.add(batch_stats)
+
+        if workers <= 1:
+            for batch in self.batches():
+                finished(self.play_batch(batch))
+            progress.finish()
+            return stats
+
+        batches = self.batches()
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = set()
+
+            def submit(count: int) -> None:
+                for batch in itertools.islice(batches, count):
+                    pending.add(executor.submit(self.play_batch, batch))
+
+            submit(workers * 4)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    pending.remove(future)
+                    finished(future.result())
+                submit(len(done))
+        progress.finish()
+        return stats
+
+    def table(self, stats: TournamentStats) -> List[Dict]:
+        """One row per strategy, best seat-corrected win rate first."""
+        rows = [
+            {
+                "strategy": strategy["name"],
+                "games": stats.games[index],
+                "wins": stats.wins[index],
+                "win_rate": (
+                    stats.wins[index] / stats.games[index]
+                    if stats.games[index]
+                    else 0.0
+                ),
+                "corrected_win_rate": stats.corrected_rate(index),
+            }
+            for index, strategy in enumerate(self.pool)
+        ]
+        return sorted(rows, key=lambda row: row["corrected_win_rate"], reverse=True)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Run a seat-rotated tournament.")
+    parser.add_argument("pool", help="strategy pool file, .json or .toml")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[4])
+    parser.add_argument("--games-per-table", type=int, default=1)
+    parser.add_argument("--sample", type=int, help="random tables instead of all")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--max-turns", type=int, help="default: sim.MAX_TURNS")
+    parser.add_argument("--stalemate-window", type=int, help="0 turns stalemates off")
+    parser.add_argument("--progress", choices=PROGRESS_REPORTERS, default="tty")
+    args = parser.parse_args(argv)
+
+    game_options = {}
+    if args.max_turns is not None:
+        game_options["max_turns"] = args.max_turns
+    if args.stalemate_window is not None:
+        game_options["stalemate_window"] = args.stalemate_window or None
+    tournament = Tournament(
+        load_roster(args.pool),
+        sizes=args.sizes,
+        games_per_table=args.games_per_table,
+        sample=args.sample,
+        seed=args.seed,
+        game_options=game_options,
+    )
+    stats = tournament.run(workers=args.workers, progress=make_progress(args.progress))
+    for size in args.sizes:
+        rates = ", ".join(
+            f"{stats.seat_rate((size, seat)):.3f}" for seat in range(size)
+        )
+        print(f"{size}-player tables, win rate by seat: {rates}")
+    print(f"games without a winner: {stats.no_winner}")
+    for row in tournament.table(stats):
+        print(
+            f"{row['strategy']:>20}  games {row['games']:>6}  wins {row['wins']:>5}"
+            f"  raw {row['win_rate']:.3f}  seat-corrected {row['corrected_win_rate']:.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+from sim import DEFAULT_ROSTER, Game, GameRNG, MonteCarloSimulation, Player
+from sim_array import ArrayGame
+
+OPTIONS = {"max_turns": 2000}
+
+
+def play(game_class, index, **options):
+    players = [Player(**spec) for spec in DEFAULT_ROSTER]
+    game = game_class(*players, rng=GameRNG(99, index), **OPTIONS, **options)
+    winner = game.simulate_game()
+    return (winner.name if winner else None), game.turn_count, game.outcome
+
+
+def test_array_game_matches_game_seed_for_seed():
+    for index in range(30):
+        assert play(ArrayGame, index) == play(Game, index)
+
+
+def test_array_game_matches_adjudicated_stalemates():
+    for index in range(10):
+        expected = play(Game, index, adjudicate_stalemates=True)
+        assert play(ArrayGame, index, adjudicate_stalemates=True) == expected
+
+
+def test_serial_and_pooled_runs_agree():
+    simulation = MonteCarloSimulation(24, seed=7, game_options=OPTIONS)
+    serial = simulation.play_all(workers=1)
+    pooled = simulation.play_all(workers=2)
+    assert pooled.win_count == serial.win_count
+    assert pooled.outcomes == serial.outcomes
+    assert pooled.turns.count == serial.turns.count
+    assert abs(pooled.turns.mean - serial.turns.mean) < 1e-9
+
+
+def test_dice_do_not_depend_on_decisions():
+    # Common random numbers: decisions draw from a stream of their own
+    quiet, busy = GameRNG(5, 3), GameRNG(5, 3)
+    rolls = []
+    for _ in range(2000):
+        busy.random()
+        rolls.append(busy.roll_dice())
+    assert [quiet.roll_dice() for _ in range(2000)] == rolls
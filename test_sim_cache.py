@@ -0,0 +1,61 @@
+import math
+
+from sim import MonteCarloSimulation
+from sim_batch import BatchSimulation
+from sim_cache import ResultCache
+
+
+def test_batch_turn_caps_get_their_own_cells(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    short = cache.cell_key(BatchSimulation(10, lanes=4, seed=1, max_turns=100))
+    long = cache.cell_key(BatchSimulation(10, lanes=4, seed=1, max_turns=5000))
+    assert short != long
+
+
+def test_game_options_are_part_of_the_cell(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    keys = {
+        cache.cell_key(MonteCarloSimulation(10, seed=1)),
+        cache.cell_key(
+            MonteCarloSimulation(10, seed=1, game_options={"max_turns": 100})
+        ),
+        cache.cell_key(BatchSimulation(10, seed=1)),
+    }
+    assert len(keys) == 3
+
+
+def assert_same_stats(a, b):
+    assert a.games == b.games
+    assert a.win_count == b.win_count
+    assert a.outcomes == b.outcomes
+    assert math.isclose(a.turns.mean, b.turns.mean)
+    assert math.isclose(a.turns.variance, b.turns.variance)
+
+
+def test_hit_and_extend_match_a_fresh_run(tmp_path):
+    cache = ResultCache(str(tmp_path))
+    options = {"max_turns": 500}
+    fresh = MonteCarloSimulation(30, seed=4, game_options=options).play_all()
+
+    first = cache.run(MonteCarloSimulation(20, seed=4, game_options=options), 10)
+    assert_same_stats(
+        first, MonteCarloSimulation(20, seed=4, game_options=options).play_all()
+    )
+    extended = MonteCarloSimulation(30, seed=4, game_options=options)
+    key = cache.cell_key(extended)
+    assert cache.plan(key, 0, 30) == ([(0, 10), (10, 20)], [(20, 30)])
+    assert_same_stats(cache.run(extended, 10), fresh)
+    # All stored now: served without playing
+    assert cache.plan(key, 0, 30)[1] == []
+    assert_same_stats(cache.run(extended, 10), fresh)
+
+
+def test_batch_cells_extend_reproducibly(tmp_path):
+    def batch(runs):
+        return BatchSimulation(runs, lanes=8, seed=2, max_turns=300)
+
+    grown = ResultCache(str(tmp_path / "grown"))
+    grown.run(batch(16), 8)
+    extended = grown.run(batch(32), 8)
+    at_once = ResultCache(str(tmp_path / "at_once")).run(batch(32), 8)
+    assert_same_stats(extended, at_once)
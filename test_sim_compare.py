@@ -0,0 +1,25 @@
+from sim import DEFAULT_ROSTER, MonteCarloSimulation
+from sim_compare import PairedComparison
+
+OPTIONS = {"max_turns": 500}
+
+
+def test_identical_rosters_pair_to_zero_difference():
+    roster = [dict(spec) for spec in DEFAULT_ROSTER]
+    stats = PairedComparison(20, roster, roster, seed=3, game_options=OPTIONS).run()
+    assert stats.a.win_count == stats.b.win_count
+    for name in stats.differences:
+        assert stats.difference(name) == 0
+        assert stats.half_width(name) == 0
+
+
+def test_each_side_replays_its_own_run():
+    roster_a = [dict(spec) for spec in DEFAULT_ROSTER]
+    roster_b = [dict(spec, w_buy_building=0.1) for spec in DEFAULT_ROSTER]
+    stats = PairedComparison(20, roster_a, roster_b, seed=3, game_options=OPTIONS)
+    stats = stats.run(workers=2)
+    for roster, side in ((roster_a, stats.a), (roster_b, stats.b)):
+        alone = MonteCarloSimulation(
+            20, seed=3, roster=roster, game_options=OPTIONS
+        ).play_all()
+        assert side.win_count == alone.win_count
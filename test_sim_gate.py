@@ -0,0 +1,59 @@
+import math
+from itertools import combinations
+
+from sim_gate import check_case
+from sim_stats import mann_whitney_less
+
+
+def case(rates):
+    return {"trials": [{"games_per_second": rate} for rate in rates]}
+
+
+def test_mann_whitney_exact_extremes():
+    # All of a below all of b is one ordering in C(6, 3)
+    assert math.isclose(mann_whitney_less([1, 2, 3], [4, 5, 6]), 1 / 20)
+    assert mann_whitney_less([4, 5, 6], [1, 2, 3]) == 1.0
+
+
+def test_mann_whitney_exact_matches_enumeration():
+    a, b = [1.0, 3.0, 5.0, 8.0], [2.0, 4.0, 6.0, 7.0, 9.0]
+    u = sum(x < y for x in a for y in b)
+    # P(U >= u) by brute force over every split of the ranks
+    ranks = range(len(a) + len(b))
+    splits = list(combinations(ranks, len(a)))
+    at_least = sum(
+        sum(x < y for x in split for y in ranks if y not in split) >= u
+        for split in splits
+    )
+    assert math.isclose(mann_whitney_less(a, b), at_least / len(splits))
+
+
+def test_mann_whitney_ties_use_normal_approximation():
+    p = mann_whitney_less([1.0, 1.0, 2.0] * 10, [2.0, 3.0, 3.0] * 10)
+    assert 0 < p < 1e-4
+    assert mann_whitney_less([], [1.0]) == 1.0
+
+
+def test_gate_flags_slowdown_with_three_trials_each():
+    problems = check_case(
+        case([50.0, 51.0, 52.0]), case([100.0, 101.0, 102.0]), 0.05, 0.10, 0.05
+    )
+    assert problems
+
+
+def test_gate_passes_unchanged_rates():
+    problems = check_case(
+        case([100.0, 99.0, 101.0]), case([100.0, 101.0, 99.0]), 0.05, 0.10, 0.05
+    )
+    assert problems == []
+
+
+def test_gate_flags_slowdown_with_five_trials_each():
+    problems = check_case(
+        case([50.0, 51.0, 52.0, 53.0, 54.0]),
+        case([100.0, 101.0, 102.0, 103.0, 104.0]),
+        0.05,
+        0.10,
+        0.05,
+    )
+    assert problems and "p=" in problems[0]
@@ -0,0 +1,45 @@
+import math
+import random
+
+from sim_stats import WinStats, wilson_interval
+
+
+def test_wilson_interval_known_values():
+    low, high = wilson_interval(5, 10)
+    assert math.isclose(low, 0.2366, abs_tol=1e-4)
+    assert math.isclose(high, 0.7634, abs_tol=1e-4)
+    z = 1.959963984540054
+    low, high = wilson_interval(0, 10)
+    assert low == 0.0 and math.isclose(high, z * z / (10 + z * z))
+    assert wilson_interval(10, 10)[1] == 1.0
+    assert wilson_interval(0, 0) == (0.0, 1.0)
+
+
+def test_wilson_interval_bounds():
+    for games in (1, 7, 100, 5000):
+        for wins in range(0, games + 1, max(1, games // 10)):
+            low, high = wilson_interval(wins, games)
+            assert 0.0 <= low <= wins / games <= high <= 1.0
+
+
+def test_merge_matches_a_single_pass():
+    rng = random.Random(1)
+    games = [
+        (rng.choice(["a", "b", "no_winner"]), rng.randint(10, 3000), "bankruptcy")
+        for _ in range(500)
+    ]
+    whole = WinStats()
+    for game in games:
+        whole.add(*game)
+    merged = WinStats()
+    for start in range(0, len(games), 73):
+        part = WinStats()
+        for game in games[start : start + 73]:
+            part.add(*game)
+        merged.merge(WinStats.from_dict(part.to_dict()))
+    assert merged.games == whole.games
+    assert merged.win_count == whole.win_count
+    assert merged.outcomes == whole.outcomes
+    assert math.isclose(merged.turns.mean, whole.turns.mean)
+    assert math.isclose(merged.turns.variance, whole.turns.variance)
+    assert merged.interval("a") == whole.interval("a")